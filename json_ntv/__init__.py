@@ -12,10 +12,16 @@ This package contains the following classes:
     - `NTV.json_ntv.namespace.Namespace`
     - `NTV.json_ntv.namespace.Datatype`
 
+- `NTV.json_ntv.namespace_cache` :
+    - `NTV.json_ntv.namespace_cache.NamespaceCache`
 
 - `NTV.json_ntv.ntv` :
     - `NTV.json_ntv.ntv.NtvSingle`
     - `NTV.json_ntv.ntv.NtvList`
+    - `NTV.json_ntv.ntv.NtvColumn`
+    - `NTV.json_ntv.ntv.NtvLazy`
+    - `NTV.json_ntv.ntv.NtvShared`
+    - `NTV.json_ntv.ntv.NtvSequence` (abstract class)
     - `NTV.json_ntv.ntv.Ntv` (abstract class)
 
 - `NTV.json_ntv.ntv_patch` :
@@ -31,7 +37,9 @@ This package contains the following classes:
 - `NTV.json_ntv.ntv_util` :
 
     - `NTV.json_ntv.ntv_util.NtvTree`
+    - `NTV.json_ntv.ntv_util.NtvSelector`
     - `NTV.json_ntv.ntv_util.NtvJsonEncoder`
+    - `NTV.json_ntv.ntv_util.NtvJson`
     - `NTV.json_ntv.ntv_util.NtvError`
     - `NTV.json_ntv.ntv_util.NtvConnector` (abstract class)
 
@@ -69,9 +77,17 @@ from json_ntv.ntv_comment import NtvComment as NtvComment
 from json_ntv.ntv import Ntv as Ntv
 from json_ntv.ntv import NtvSingle as NtvSingle
 from json_ntv.ntv import NtvList as NtvList
+from json_ntv.ntv import NtvColumn as NtvColumn
+from json_ntv.ntv import NtvLazy as NtvLazy
+from json_ntv.ntv import NtvSequence as NtvSequence
+from json_ntv.ntv import NtvShared as NtvShared
+from json_ntv.ntv import set_copy_on_write as set_copy_on_write
 from json_ntv.ntv_validate import Validator as Validator
 from json_ntv.ntv_util import NtvTree as NtvTree
+from json_ntv.ntv_util import NtvSelector as NtvSelector
 from json_ntv.ntv_util import NtvJsonEncoder as NtvJsonEncoder
+from json_ntv.ntv_util import NtvJson as NtvJson
+from json_ntv.ntv_util import set_json_backend as set_json_backend
 from json_ntv.ntv_util import NtvConnector as NtvConnector
 from json_ntv.ntv_util import NtvError as NtvError
 from json_ntv.ntv_connector import from_csv as from_csv
@@ -6,25 +6,67 @@ The `namespace` module is part of the `NTV.json_ntv` package ([specification doc
 https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
 
 It contains the `Namespace`, `Datatype`, `DatatypeError` classes and
-the functions `agreg_type`, `from_file`, `mapping`, `relative_type` and `str_type`.
+the functions `agreg_type`, `from_file`, `mapping`, `relative_type`, `str_type`,
+`type_cache_info` and `write_snapshot`.
+
+The local configuration files are loaded from a JSON snapshot (e.g.
+'NTV_global_namespace.json') when it is consistent with the .ini file. The
+root Datatype are created when they are first used.
+
+The results of `agreg_type`, `relative_type` and `str_type` are memoized in
+bounded caches (TYPE_CACHE_SIZE entries). The caches are cleared when a
+Namespace is created or when a TypeBase is replaced.
 
 For more information, see the
 [user guide](https://loco-philippe.github.io/NTV/documentation/user_guide.html)
 or the [github repository](https://github.com/loco-philippe/NTV)
 """
 
-import configparser
+import functools
 from pathlib import Path
 import json
-import requests
+import zlib
 
 import json_ntv
 from json_ntv.ntv_util import NtvUtil
 from json_ntv.ntv_validate import Validator
 
 SCH_ORG = "https://schema.org/"
+TYPE_CACHE_SIZE = 4096
+
+_type_caches = []
+
+
+def _type_cache(func):
+    """return a memoized version of a type resolution function"""
+    cached_func = functools.lru_cache(maxsize=TYPE_CACHE_SIZE)(func)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return cached_func(*args, **kwargs)
+        except TypeError:  # unhashable arguments
+            return func(*args, **kwargs)
+
+    wrapper.cache_info = cached_func.cache_info
+    wrapper.cache_clear = cached_func.cache_clear
+    _type_caches.append(wrapper)
+    return wrapper
+
+
+def _clear_type_caches():
+    """clear the type resolution caches (new Namespace or replaced TypeBase)"""
+    for func in _type_caches:
+        func.cache_clear()
 
 
+def type_cache_info():
+    """return a dict with the cache statistics (hits, misses, maxsize, currsize)
+    of the type resolution functions"""
+    return {func.__name__: func.cache_info() for func in _type_caches}
+
+
+@_type_cache
 def agreg_type(str_typ, def_type, single):
     """
     Aggregate  str_typ and def_type.
@@ -77,16 +119,42 @@ def from_file(file, name, long_parent=None):
     long_parent = "" if not long_parent else long_parent
     if name[0] != "$":
         raise DatatypeError(name + " is not a custom Datatype")
-    if long_parent not in Namespace.namespaces():
+    if long_parent not in NtvUtil._namespaces_:
         raise DatatypeError(long_parent + " is not a valid Datatype")
     schema_nsp = Namespace(name, long_parent)
-    config = configparser.ConfigParser()
+    config = _config_parser()
     config.read(file)
     if name not in config.sections():
         raise DatatypeError(name + " is not present in " + str(file))
     _add_namespace(config, schema_nsp)
 
 
+def write_snapshot(file=None):
+    """write the JSON snapshot of a local configuration file and return the
+    snapshot path
+
+    *Parameters*
+
+        - **file** : string (default None) - name of the .ini file in the
+        'config' folder (default: global Namespace file)
+    """
+    file = Path(file if file else Namespace._global_)
+    path = Path(json_ntv.__file__).parent / "config" / file.name
+    config = _config_parser()
+    config.read(path)
+    snapshot = {
+        "source": _crc(path),
+        "name": config["data"]["name"],
+        "type": json.loads(config["data"]["type"]),
+        "namespace": json.loads(config["data"]["namespace"]),
+    }
+    snap_path = path.with_suffix(".json")
+    snap_path.write_text(
+        json.dumps(snapshot, separators=(",", ":")) + "\n", encoding="utf-8"
+    )
+    return snap_path
+
+
 def mapping(typ=None, func=None):
     """Affect a validate function (func) to a Datatype (typ)"""
     if typ and func:
@@ -103,6 +171,7 @@ def mapping(typ=None, func=None):
                 Datatype(func_str[:-6]).validate = Validator.__dict__[func_str]
 
 
+@_type_cache
 def relative_type(str_def, str_typ):
     """return relative str_typ string from Datatype or Namespace str_def
 
@@ -127,6 +196,7 @@ def relative_type(str_def, str_typ):
     return ".".join(str_typ_split[ind:])
 
 
+@_type_cache
 def str_type(long_name, single):
     """create a Datatype or a Namespace from a string
 
@@ -147,6 +217,39 @@ def str_type(long_name, single):
     return Datatype(long_name)
 
 
+def _config_parser():
+    """return a ConfigParser (configparser is imported at first use)"""
+    import configparser
+
+    return configparser.ConfigParser()
+
+
+def _crc(path):
+    """return the checksum of a file"""
+    return zlib.crc32(path.read_bytes())
+
+
+def _local_config(p_file):
+    """return the data of a local configuration file as a dict
+    {'name': name, 'type': types, 'namespace': namespaces}
+
+    The JSON snapshot is used if it is consistent with the .ini file."""
+    path = Path(json_ntv.__file__).parent / "config" / p_file
+    try:
+        snapshot = json.loads(path.with_suffix(".json").read_bytes())
+        if snapshot["source"] == _crc(path):
+            return snapshot
+    except (OSError, ValueError, KeyError):
+        pass
+    config = _config_parser()
+    config.read(path)
+    return {
+        "name": config["data"]["name"],
+        "type": json.loads(config["data"]["type"]),
+        "namespace": json.loads(config["data"]["namespace"]),
+    }
+
+
 def _add_namespace(config, namesp):
     """create the child Namespace and the child Datatype of the parent namespace"""
     if namesp.name in config.sections():
@@ -182,21 +285,16 @@ def _isin_schemaorg(name, prop=True, typ=None):
     or if a schema.org Type is present"""
     n_org = name if prop else name[:-1]
     t_org = typ[:-1] if typ else None
-    req_name = requests.get(
-        SCH_ORG + n_org, allow_redirects=True, timeout=10
-    ).content.decode()
+    from json_ntv.namespace_cache import NamespaceCache
+
+    req_name = NamespaceCache.get(SCH_ORG + n_org, default="")
     if not prop:
         return "Type</ti" in req_name
     is_prop = "Property</ti" in req_name
     if not t_org:
         return is_prop
     if is_prop:
-        return (
-            "/" + n_org
-            in requests.get(
-                SCH_ORG + t_org, allow_redirects=True, timeout=10
-            ).content.decode()
-        )
+        return "/" + n_org in NamespaceCache.get(SCH_ORG + t_org, default="")
     return False
 
 
@@ -228,7 +326,9 @@ class TypeBase(NtvUtil):
 
     @staticmethod
     def types():
-        """return the list of TypeBase created"""
+        """return the list of TypeBase created (including the root TypeBase)"""
+        for root_typ in NtvUtil._namespaces_[""].content["type"]:
+            TypeBase.add(root_typ)
         return [nam.long_name for nam in NtvUtil._types_.values()]
 
     @classmethod
@@ -244,7 +344,7 @@ class TypeBase(NtvUtil):
         """
         if long_name == "":
             return None
-        if long_name in cls.types():
+        if long_name in NtvUtil._types_:
             return NtvUtil._types_[long_name]
         split_name = long_name.rsplit(".", 1)
         if split_name[-1] == "":
@@ -295,8 +395,14 @@ class TypeBase(NtvUtil):
         self.custom = nspace.custom or name[0] == "$"
         # self.gen_type = '' if self.custom else self.nspace.content['type'][self.name]
         # self.long_name = self.nspace.long_name + self.name
+        if not validate and not nspace.name and not self.custom:
+            validate = Validator.__dict__.get(name + "_valid")
         if validate:
             self.validate = validate
+        if self.long_name in NtvUtil._types_:
+            # shared Datatype instances refer to the replaced TypeBase
+            NtvUtil._datatypes_.clear()
+            _clear_type_caches()
         NtvUtil._types_[self.long_name] = self
         return
 
@@ -387,6 +493,9 @@ class Datatype(TypeBase):
     - `gen_type`
     - `long_name` (TypeBase)
 
+    Datatype instances are shared: the constructor returns the existing
+    Datatype if the full name is already known.
+
     *staticmethods*
     - `types` (TypeBase)
 
@@ -395,6 +504,14 @@ class Datatype(TypeBase):
     - `validate` (TypeBase)
     """
 
+    def __new__(cls, full_name, module=False, force=False, validate=None):
+        """return the shared Datatype if full_name is already known"""
+        if isinstance(full_name, Datatype):
+            return full_name
+        if isinstance(full_name, str) and full_name in NtvUtil._datatypes_:
+            return NtvUtil._datatypes_[full_name]
+        return super().__new__(cls)
+
     def __init__(self, full_name, module=False, force=False, validate=None):
         """DataType constructor.
 
@@ -405,11 +522,7 @@ class Datatype(TypeBase):
         local .ini file, else in the distant repository
         - **force** : boolean (default False) - if True, no Namespace control
         - **validate** : function (default None) - validate function to include"""
-        if isinstance(full_name, Datatype):
-            self.name = full_name.name
-            self.base_name = full_name.base_name
-            self.typebase = full_name.typebase
-            self.extension = full_name.extension
+        if "typebase" in self.__dict__:  # shared instance already initialized
             return
         spl_name = full_name.split("[", maxsplit=1)
         long_base = spl_name[0]
@@ -418,8 +531,17 @@ class Datatype(TypeBase):
         ext_str = "[" + self.extension + "]" if self.extension else ""
         self.base_name = self.typebase.name
         self.name = self.typebase.name + ext_str
+        NtvUtil._datatypes_[full_name] = self
         return
 
+    def __reduce__(self):
+        """Datatype are shared: copy and pickle use the full name"""
+        return (Datatype, (self.long_name,))
+
+    def __deepcopy__(self, memo):
+        """return self (shared Datatype)"""
+        return self
+
     @property
     def gen_type(self):
         """return the generic type of the Datatype"""
@@ -504,7 +626,7 @@ class Namespace(NtvUtil):
         - **module** : boolean (default False) - if True search data in the
         local .ini file, else in the distant repository
         """
-        if long_name in Namespace.namespaces():
+        if long_name in NtvUtil._namespaces_:
             return NtvUtil._namespaces_[long_name]
         split_name = long_name.rsplit(".", 2)
         if len(split_name) == 1 or split_name[-1] != "":
@@ -545,6 +667,7 @@ class Namespace(NtvUtil):
         self.file = Namespace._file(self.parent, self.name, self.custom, module)
         self.content = Namespace._content(self.file, self.name, self.custom, module)
         NtvUtil._namespaces_[self.long_name] = self
+        _clear_type_caches()
 
     def __eq__(self, other):
         """equal if name and parent are equal"""
@@ -568,6 +691,14 @@ class Namespace(NtvUtil):
         """return classname and long name"""
         return self.__class__.__name__ + "(" + self.long_name + ")"
 
+    def __reduce__(self):
+        """Namespace are shared: copy and pickle use the long name"""
+        return (Namespace.add, (self.long_name,))
+
+    def __deepcopy__(self, memo):
+        """return self (shared Namespace)"""
+        return self
+
     @staticmethod
     def _file(parent, name, custom, module):
         """return the file name of the Namespace configuration
@@ -585,19 +716,15 @@ class Namespace(NtvUtil):
         if parent:
             if "schema.org" in parent.file or name == "org.":
                 return SCH_ORG
-            config = configparser.ConfigParser()
             if module:
-                p_file = Path(parent.file).stem + Path(parent.file).suffix
-                config.read(Path(json_ntv.__file__).parent / "config" / p_file)
+                namespaces = _local_config(Path(parent.file).name)["namespace"]
             else:
-                config.read_string(
-                    requests.get(
-                        parent.file, allow_redirects=True, timeout=10
-                    ).content.decode()
-                )
-            return (
-                Namespace._pathconfig_ + json.loads(config["data"]["namespace"])[name]
-            )
+                from json_ntv.namespace_cache import NamespaceCache
+
+                config = _config_parser()
+                config.read_string(NamespaceCache.get(parent.file))
+                namespaces = json.loads(config["data"]["namespace"])
+            return Namespace._pathconfig_ + namespaces[name]
         return Namespace._pathconfig_ + Namespace._global_
 
     @staticmethod
@@ -619,21 +746,21 @@ class Namespace(NtvUtil):
         """
         if custom or "schema.org" in file:
             return {"type": {}, "namespace": {}}
-        config = configparser.ConfigParser()
         if module:
-            p_file = Path(file).stem + Path(file).suffix
-            config.read(Path(json_ntv.__file__).parent / "config" / p_file)
+            data = _local_config(Path(file).name)
         else:
-            config.read_string(
-                requests.get(file, allow_redirects=True, timeout=10).content.decode()
-            )
-        config_name = config["data"]["name"]
-        if config_name != name:
+            from json_ntv.namespace_cache import NamespaceCache
+
+            config = _config_parser()
+            config.read_string(NamespaceCache.get(file))
+            data = {
+                "name": config["data"]["name"],
+                "type": json.loads(config["data"]["type"]),
+                "namespace": json.loads(config["data"]["namespace"]),
+            }
+        if data["name"] != name:
             raise DatatypeError(file + " is not correct")
-        return {
-            "type": json.loads(config["data"]["type"]),
-            "namespace": json.loads(config["data"]["namespace"]),
-        }
+        return {"type": data["type"], "namespace": data["namespace"]}
 
     @property
     def long_name(self):
@@ -667,8 +794,5 @@ class DatatypeError(Exception):
 
 
 nroot = Namespace(module=True)
-for root_typ in nroot.content["type"]:
-    # typ = Datatype(root_typ, module=True,
-    Datatype(root_typ, module=True, validate=Validator.__dict__[root_typ + "_valid"])
-# mapping(Datatype.types())
+# the other root Datatype are created when they are first used
 typ_json = Datatype("json")
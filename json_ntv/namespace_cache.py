@@ -0,0 +1,293 @@
+# -*- coding: utf-8 -*-
+"""
+@author: Philippe@loco-labs.io
+
+The `namespace_cache` module is part of the `NTV.json_ntv` package ([specification document](
+https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
+
+It contains the `NamespaceCache` and `NamespaceCacheError` classes.
+
+The configuration files of the distant Namespaces (e.g. 'fr.', 'fr.BAN.') and
+the schema.org pages are stored in a local cache directory. A file is
+downloaded again only when it is older than the time-to-live and the server
+is requested with its ETag / Last-Modified values (no download if unchanged).
+
+The cache is configured by the `NamespaceCache` class attributes or by
+environment variables:
+
+- `path` (JSON_NTV_CACHE_DIR): location of the cache directory
+- `ttl` (JSON_NTV_CACHE_TTL): time-to-live of a cached file in seconds
+- `offline` (JSON_NTV_OFFLINE): if True, only the cached files are used
+- `enabled` (JSON_NTV_CACHE): if False, files are always downloaded
+
+The cache can be loaded before use (e.g. for air-gapped hosts) with the
+`NamespaceCache.prewarm` method or with the command:
+
+    python -m json_ntv.namespace_cache [--dir DIR] [namespace ...]
+
+For more information, see the
+[user guide](https://loco-philippe.github.io/NTV/documentation/user_guide.html)
+or the [github repository](https://github.com/loco-philippe/NTV).
+"""
+
+import argparse
+import configparser
+import hashlib
+import json
+import os
+from pathlib import Path
+import re
+import time
+
+from json_ntv.ntv_util import NtvUtil
+
+
+def _env_flag(name, default):
+    """return the boolean value of an environment variable"""
+    return os.environ.get(name, default).lower() not in ("", "0", "false", "no")
+
+
+class NamespaceCache:
+    """The NamespaceCache class manages the local copy of the distant files
+    used by Namespace and Datatype.
+
+    *class variables :*
+    - **path** : Path - location of the cache directory
+    - **ttl** : float - time-to-live of a cached file (seconds)
+    - **offline** : boolean - if True, distant files are not requested
+    - **enabled** : boolean - if False, the cache is not used
+    - **timeout** : float - timeout of the requests (seconds)
+
+    *classmethods*
+    - `configure`
+    - `get`
+    - `clear`
+    - `prewarm`
+    """
+
+    path = Path(
+        os.environ.get(
+            "JSON_NTV_CACHE_DIR",
+            Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "json_ntv",
+        )
+    )
+    ttl = float(os.environ.get("JSON_NTV_CACHE_TTL", "86400"))
+    offline = _env_flag("JSON_NTV_OFFLINE", "0")
+    enabled = _env_flag("JSON_NTV_CACHE", "1")
+    timeout = 10
+
+    @classmethod
+    def configure(cls, path=None, ttl=None, offline=None, enabled=None):
+        """update the cache parameters (None values are unchanged)
+
+        *Parameters*
+
+        - **path** : string or Path (default None) - location of the cache directory
+        - **ttl** : float (default None) - time-to-live of a cached file (seconds)
+        - **offline** : boolean (default None) - if True, distant files are not requested
+        - **enabled** : boolean (default None) - if False, the cache is not used
+        """
+        if path is not None:
+            cls.path = Path(path)
+        if ttl is not None:
+            cls.ttl = float(ttl)
+        if offline is not None:
+            cls.offline = offline
+        if enabled is not None:
+            cls.enabled = enabled
+
+    @classmethod
+    def get(cls, url, default=None):
+        """return the text content of a distant file (from the cache if it is
+        available and valid)
+
+        A response with an error status is never returned: the cached file is
+        used if it exists, else a NamespaceCacheError is raised.
+
+        *Parameters*
+
+        - **url** : string - url of the distant file
+        - **default** : string (default None) - value returned (if not None)
+        instead of raising a NamespaceCacheError when the server answers with
+        an error status
+        """
+        if not cls.enabled:
+            if cls.offline:
+                raise NamespaceCacheError(url + " is not available (offline mode)")
+            try:
+                return cls._checked(url, cls._request(url)).content.decode()
+            except NamespaceCacheError:
+                if default is not None:
+                    return default
+                raise
+        file = cls._file(url)
+        meta = cls._read_meta(file)
+        if meta and (cls.offline or time.time() - meta["fetched"] < cls.ttl):
+            return file.read_text(encoding="utf-8")
+        if cls.offline:
+            raise NamespaceCacheError(url + " is not in the cache (offline mode)")
+        requests = NtvUtil.lazy_import("requests")
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        try:
+            resp = cls._checked(url, cls._request(url, headers), bool(meta))
+        except (requests.RequestException, NamespaceCacheError) as exc:
+            if meta:  # stale file is better than no file (or an error page)
+                return file.read_text(encoding="utf-8")
+            if default is not None and isinstance(exc, NamespaceCacheError):
+                return default
+            raise
+        if resp.status_code == 304:
+            cls._write(file, None, meta)
+            return file.read_text(encoding="utf-8")
+        content = resp.content.decode()
+        meta = {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        }
+        cls._write(file, content, meta)
+        return content
+
+    @classmethod
+    def clear(cls):
+        """remove all the cached files"""
+        if not cls.path.is_dir():
+            return
+        for file in cls.path.iterdir():
+            if file.suffix in (".cache", ".meta"):
+                file.unlink(missing_ok=True)
+
+    @classmethod
+    def prewarm(cls, long_names=None, root=None):
+        """load in the cache the configuration files of a Namespace tree and
+        return a dict with the loaded files {namespace long_name: url}
+
+        *Parameters*
+
+        - **long_names** : list of string (default None) - Namespaces to load
+        with their parents and children (all the Namespaces if None)
+        - **root** : string (default None) - url of the global Namespace file
+        (default: Namespace._pathconfig_ + Namespace._global_)
+        """
+        if not root:
+            from json_ntv.namespace import Namespace
+
+            root = Namespace._pathconfig_ + Namespace._global_
+        requests = NtvUtil.lazy_import("requests")
+        base = root.rsplit("/", 1)[0] + "/"
+        loaded = {}
+        stack = [("", root)]
+        while stack:
+            long_name, url = stack.pop()
+            config = configparser.ConfigParser()
+            try:
+                config.read_string(cls.get(url))
+                namespaces = json.loads(config["data"]["namespace"])
+            except (
+                requests.RequestException,
+                NamespaceCacheError,
+                configparser.Error,
+                KeyError,
+            ):
+                continue
+            loaded[long_name] = url
+            for name, file in namespaces.items():
+                child = long_name + name
+                if file.startswith("http") or not (
+                    long_names is None
+                    or any(
+                        nsp.startswith(child) or child.startswith(nsp)
+                        for nsp in long_names
+                    )
+                ):
+                    continue
+                stack.append((child, base + file))
+        return loaded
+
+    @classmethod
+    def _request(cls, url, headers=None):
+        """return the response of the GET request"""
+        return NtvUtil.lazy_import("requests").get(
+            url, headers=headers, allow_redirects=True, timeout=cls.timeout
+        )
+
+    @staticmethod
+    def _checked(url, resp, not_modified=False):
+        """return the response if the status is 200 (or 304 if not_modified),
+        else raise a NamespaceCacheError"""
+        if resp.status_code == 200 or (not_modified and resp.status_code == 304):
+            return resp
+        raise NamespaceCacheError(
+            url + " is not available (status " + str(resp.status_code) + ")"
+        )
+
+    @classmethod
+    def _file(cls, url):
+        """return the cache file associated to the url"""
+        name = re.sub(r"[^A-Za-z0-9._-]", "_", url.rstrip("/").rsplit("/", 1)[-1])
+        digest = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return cls.path / (digest + "_" + name + ".cache")
+
+    @staticmethod
+    def _read_meta(file):
+        """return the metadata of a cached file (None if not available)"""
+        try:
+            meta = json.loads(file.with_suffix(".meta").read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return meta if file.exists() and "fetched" in meta else None
+
+    @classmethod
+    def _write(cls, file, content, meta):
+        """write the content (if not None) and the metadata of a cached file"""
+        meta = meta | {"fetched": time.time()}
+        try:
+            cls.path.mkdir(parents=True, exist_ok=True)
+            if content is not None:
+                _write_atomic(file, content)
+            _write_atomic(file.with_suffix(".meta"), json.dumps(meta))
+        except OSError:  # the cache is optional
+            pass
+
+
+def _write_atomic(file, text):
+    """write a text file (the file is replaced only when it is complete)"""
+    tmp = file.with_name(file.name + "." + str(os.getpid()) + ".tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, file)
+
+
+class NamespaceCacheError(Exception):
+    """NamespaceCache Exception"""
+
+
+def main(args=None):
+    """command line to load the Namespace files in the cache"""
+    parser = argparse.ArgumentParser(
+        prog="python -m json_ntv.namespace_cache",
+        description="load the distant Namespace files in the local cache",
+    )
+    parser.add_argument(
+        "namespaces", nargs="*", help="Namespaces to load (e.g. fr.BAN.), all if none"
+    )
+    parser.add_argument("--dir", help="cache directory", default=None)
+    parser.add_argument("--root", help="url of the global Namespace file")
+    parser.add_argument("--clear", action="store_true", help="clear the cache before")
+    opt = parser.parse_args(args)
+    NamespaceCache.configure(path=opt.dir, ttl=0, offline=False, enabled=True)
+    if opt.clear:
+        NamespaceCache.clear()
+    loaded = NamespaceCache.prewarm(
+        opt.namespaces if opt.namespaces else None, opt.root
+    )
+    for long_name, url in sorted(loaded.items()):
+        print((long_name if long_name else "(global)").ljust(20), url)
+    print(len(loaded), "files in", NamespaceCache.path)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,10 @@
 The `ntv` module is part of the `NTV.json_ntv` package ([specification document](
 https://loco-philippe.github.io/ES/JSON%20semantic%20format%20(JSON-NTV).htm)).
 
-It contains the classes `NtvSingle`, `NtvList`, `Ntv`(abstract) for NTV entities.
+It contains the classes `NtvSingle`, `NtvList`, `Ntv`(abstract) for NTV entities,
+the classes `NtvColumn` (ntv_value of columnar NtvList), `NtvLazy`
+(ntv_value of lazy NtvList) and `NtvShared` (ntv_value of copy-on-write
+NtvList) and the function `set_copy_on_write`.
 
 For more information, see the
 [user guide](https://loco-philippe.github.io/NTV/documentation/user_guide.html)
@@ -14,12 +17,28 @@ or the [github repository](https://github.com/loco-philippe/NTV).
 """
 
 import copy
+import hashlib
+import heapq
 from abc import ABC, abstractmethod
+from array import array
+from collections.abc import MutableSequence
+from itertools import islice
 from numbers import Number
 import json
+import weakref
 
 from json_ntv.namespace import Datatype, Namespace, str_type, relative_type, agreg_type
-from json_ntv.ntv_util import NtvError, NtvJsonEncoder, NtvConnector, NtvTree, NtvUtil
+from json_ntv.ntv_util import (
+    NtvError,
+    NtvJsonEncoder,
+    NtvJson,
+    NtvConnector,
+    NtvSelector,
+    NtvTree,
+    NtvUtil,
+    NtvReader,
+    NtvWriter,
+)
 from json_ntv.ntv_patch import NtvPointer
 
 NAME = "N"
@@ -41,9 +60,20 @@ class Ntv(ABC, NtvUtil):
     *Internal attributes :*
     - **parent**:     parent NtvList entity
     - **is_json**:    True if ntv_value is a json_value
+    - **_digest**:    cached value of `digest` (None if not computed)
+    - **_stats**:     cached value of `NtvTree.stats` (None if not computed)
+    - **_row**:       index of the entity in its parent (None if unknown)
+    - **_types**:     cached value of the type index (None if not computed)
+
+    The attributes are stored in `__slots__` (no instance `__dict__`).
+
+    *class variables :*
+    - **copy_on_write** : boolean (default False) - copy mode of the NtvList
+    entities (see `set_copy_on_write`)
 
     *dynamic values (@property)*
     - `code_ntv`
+    - `digest`
     - `json_name_str`
     - `json_array` (abstract method)
     - `max_len`
@@ -58,7 +88,9 @@ class Ntv(ABC, NtvUtil):
     - `fast`
     - `obj`
     - `from_obj`
+    - `from_obj_iter`
     - `from_att`
+    - `iter_file`
 
     *NTV conversion (instance methods)*
     - `alike`
@@ -67,6 +99,7 @@ class Ntv(ABC, NtvUtil):
     - `validate` (validation)
 
     *export - conversion (instance methods)*
+    - `dump`
     - `expand`
     - `no_type`
     - `no_name`
@@ -82,7 +115,11 @@ class Ntv(ABC, NtvUtil):
 
     *tree methods (instance methods)*
     - `childs`
+    - `find`
+    - `get_many`
+    - `index_by_type`
     - `pointer`
+    - `select`
     - `replace`
     - `remove`
     - `append` (NtvList only)
@@ -101,7 +138,20 @@ class Ntv(ABC, NtvUtil):
     - `obj_ntv` *(staticmethod)*
     """
 
-    def __init__(self, ntv_value, ntv_name, ntv_type):
+    __slots__ = (
+        "ntv_name",
+        "ntv_type",
+        "ntv_value",
+        "is_json",
+        "parent",
+        "_digest",
+        "_stats",
+        "_row",
+        "_types",
+    )
+    copy_on_write = False
+
+    def __init__(self, ntv_value, ntv_name, ntv_type, is_json=None):
         """Ntv constructor.
 
         *Parameters*
@@ -109,6 +159,8 @@ class Ntv(ABC, NtvUtil):
         - **ntv_value**: Json entity - value of the entity
         - **ntv_name** : String (default None) - name of the NTV entity
         - **ntv_type**: String or Datatype or Namespace (default None) - type of the entity
+        - **is_json**: Boolean (default None) - json status of ntv_value if
+        already known (computed if None)
         """
         if ntv_type.__class__.__name__ in ["Datatype", "Namespace"]:
             self.ntv_type = ntv_type
@@ -122,8 +174,12 @@ class Ntv(ABC, NtvUtil):
             ntv_name = ""
         self.ntv_name = ntv_name
         self.ntv_value = ntv_value
-        self.is_json = NtvConnector.is_json(ntv_value)
+        self.is_json = NtvConnector.is_json(ntv_value) if is_json is None else is_json
         self.parent = None
+        self._digest = None
+        self._stats = None
+        self._row = None
+        self._types = None
 
     @staticmethod
     def fast(data, no_typ=False, typ_auto=False):
@@ -133,7 +189,16 @@ class Ntv(ABC, NtvUtil):
         return Ntv.obj(data, no_typ=no_typ, typ_auto=typ_auto, fast=True)
 
     @staticmethod
-    def obj(data, no_typ=False, decode_str=False, typ_auto=False, fast=False):
+    def obj(
+        data,
+        no_typ=False,
+        decode_str=False,
+        typ_auto=False,
+        fast=False,
+        engine="recursive",
+        columnar=False,
+        lazy=False,
+    ):
         """return an Ntv entity from data.
 
         *Parameters*
@@ -145,16 +210,36 @@ class Ntv(ABC, NtvUtil):
         - **type_auto**: boolean (default False) - if True, default type for NtvList
         is the ntv_type of the first Ntv in the ntv_value
         - **fast** : boolean (default False) - if True, Ntv entity is created without conversion
-        - **decode_str**: boolean (default False) - if True, string are loaded in json data"""
+        - **decode_str**: boolean (default False) - if True, string are loaded in json data
+        - **engine**: string (default 'recursive') - decoder used for a value to decode
+            'recursive': `from_obj` method
+            'iterative': `from_obj_iter` method (no recursion limit)
+        - **columnar**: boolean (default False) - if True, the lists of int
+        (or float) values are stored in a `NtvColumn`
+        - **lazy**: boolean (default False) - if True, the included entities are
+        created only when they are accessed (see `NtvLazy`)"""
         if isinstance(data, tuple):
             return Ntv.from_att(*data, decode_str=decode_str, fast=fast)
         if isinstance(data, str):
             try:
-                data = json.loads(data)
-            except json.JSONDecodeError:
+                data = NtvJson.loads(data)
+            except NtvJson.error:
                 pass
-        return Ntv.from_obj(
-            data, no_typ=no_typ, decode_str=decode_str, typ_auto=typ_auto, fast=fast
+        match engine:
+            case "recursive":
+                from_obj = Ntv.from_obj
+            case "iterative":
+                from_obj = Ntv.from_obj_iter
+            case _:
+                raise NtvError("the engine option is not valid")
+        return from_obj(
+            data,
+            no_typ=no_typ,
+            decode_str=decode_str,
+            typ_auto=typ_auto,
+            fast=fast,
+            columnar=columnar,
+            lazy=lazy,
         )
 
     @staticmethod
@@ -188,6 +273,8 @@ class Ntv(ABC, NtvUtil):
         decode_str=False,
         typ_auto=False,
         fast=False,
+        columnar=False,
+        lazy=False,
     ):
         """return an Ntv entity from an object value.
 
@@ -200,29 +287,139 @@ class Ntv(ABC, NtvUtil):
         - **decode_str**: boolean (default False) - if True, string are loaded as json data
         - **type_auto**: boolean (default False) - if True, default type for NtvList
         is the ntv_type of the first Ntv in the ntv_value
-        - **fast** : boolean (default False) - if True, Ntv entity is created without conversion"""
+        - **fast** : boolean (default False) - if True, Ntv entity is created without conversion
+        - **columnar**: boolean (default False) - if True, the lists of int
+        (or float) values are stored in a `NtvColumn`
+        - **lazy**: boolean (default False) - if True, the included entities are
+        created only when they are accessed (see `NtvLazy`)"""
         value = Ntv._from_value(value, decode_str)
         if value.__class__.__name__ in ["NtvSingle", "NtvList"]:
             return value
-        ntv_value, ntv_name, str_typ, sep, is_json = Ntv.decode_json(value)
-        sep = def_sep if not sep else sep
-        sep = None if str_typ and str_typ[-1] == "." and sep == ":" else sep
-        if isinstance(ntv_value, (list, dict)) and sep in (None, "::"):
-            return Ntv._create_ntvlist(
-                str_typ, def_type, sep, ntv_value, typ_auto, no_typ, ntv_name, fast
-            )
-        if sep == ":" or (sep is None and isinstance(ntv_value, dict)):
-            ntv_type = agreg_type(str_typ, def_type, False)
-            return NtvSingle(ntv_value, ntv_name, ntv_type, fast=fast)
-        if sep is None and not isinstance(ntv_value, dict):
-            is_single_json = isinstance(ntv_value, (int, str, float, bool))
-            ntv_type = agreg_type(str_typ, def_type, is_single_json)
-            return NtvSingle(ntv_value, ntv_name, ntv_type, fast=fast)
-        raise NtvError('separator ":" is not compatible with value')
+        node = Ntv._decode_node(*Ntv._decode_obj(value), def_type, def_sep, fast)
+        if isinstance(node, Ntv):
+            return node
+        return Ntv._create_ntvlist(*node, typ_auto, no_typ, fast, columnar, lazy)
+
+    @staticmethod
+    def from_obj_iter(
+        value,
+        def_type=None,
+        def_sep=None,
+        no_typ=False,
+        decode_str=False,
+        typ_auto=False,
+        fast=False,
+        columnar=False,
+        lazy=False,
+    ):
+        """return an Ntv entity from an object value.
+
+        The result is the same as with the `from_obj` method but the decoding
+        uses an explicit stack instead of recursive calls (no recursion limit).
+
+        *Parameters* : see `from_obj` method"""
+        value = Ntv._from_value(value, decode_str)
+        if value.__class__.__name__ in ["NtvSingle", "NtvList"]:
+            return value
+        node = Ntv._decode_node(*Ntv._decode_obj(value), def_type, def_sep, fast)
+        if isinstance(node, Ntv):
+            return node
+        column = NtvColumn.from_json(node[0], node[2], node[3]) if columnar else None
+        if column is not None or lazy:
+            return Ntv._create_ntvlist(*node, typ_auto, no_typ, fast, columnar, lazy)
+        # stack item: [child values, is_dict, child Ntv, name, type, separator]
+        stack = [Ntv._iter_frame(*node)]
+        decode_node = Ntv._decode_node
+        from_obj_name = NtvUtil.from_obj_name
+        while True:
+            childs, is_dict, ntv_list, ntv_name, list_type, sep_val = stack[-1]
+            for child in childs:
+                if is_dict:
+                    node = decode_node(
+                        child[1], *from_obj_name(child[0]), list_type, sep_val, fast
+                    )
+                else:
+                    if isinstance(child, bytes):
+                        child = Ntv._from_value(child)
+                    if isinstance(child, Ntv):
+                        ntv_list.append(child)
+                        continue
+                    node = decode_node(
+                        *Ntv._decode_obj(child), list_type, sep_val, fast
+                    )
+                if isinstance(node, Ntv):
+                    ntv_list.append(node)
+                    continue
+                if columnar and (
+                    column := NtvColumn.from_json(node[0], node[2], node[3])
+                ):
+                    ntv_list.append(NtvList._from_ntv_list(column, node[1], node[2]))
+                    continue
+                stack.append(Ntv._iter_frame(*node))
+                break
+            else:
+                stack.pop()
+                if not stack:
+                    return NtvList._from_ntv_list(
+                        ntv_list, ntv_name, list_type, typ_auto, no_typ, fast
+                    )
+                stack[-1][2].append(
+                    NtvList._from_ntv_list(ntv_list, ntv_name, list_type, fast=fast)
+                )
+
+    @staticmethod
+    def iter_file(path, pointer="", def_type=None, **kwargs):
+        """return an iterator on the Ntv entities included in a json container
+        of a JSON-NTV file (members of a json-object or values of a json-array).
+
+        The file is read by chunks and only one entity is decoded at a time: the
+        entities are the same as the entities of the NtvList decoded from the
+        json container (the types and namespaces defined in the json names of
+        the json pointer are applied).
+
+        *Parameters*
+
+        - **path** : string or Path - JSON-NTV file (utf-8)
+        - **pointer** : string (default '') - json pointer (RFC 6901) of the json
+        container in the file (the root by default)
+        - **def_type** : Datatype or Namespace (default None) - default type of the
+        root value
+        - **kwargs** : other parameters of the `from_obj` method (fast, columnar,
+        lazy)"""
+        tokens = [
+            tok.replace("~1", "/").replace("~0", "~") for tok in pointer.split("/")
+        ]
+        if tokens[0]:
+            raise NtvError("the pointer is not a valid json pointer")
+        with open(path, encoding="utf-8") as file:
+            reader = NtvReader(file)
+            json_name, sep_val = (None, None, None), None
+            for token in tokens[1:] + [None]:
+                if reader.peek() not in ("[", "{"):
+                    raise NtvError("the pointer doesn't select a json container")
+                node = Ntv._decode_node([], *json_name, def_type, sep_val, True)
+                if isinstance(node, Ntv):
+                    raise NtvError("the pointer doesn't select a NtvList")
+                def_type, sep_val = node[2], node[3]
+                if token is None:
+                    break
+                for key in reader.items():
+                    if str(key) == token:
+                        json_name = (None, None, None)
+                        if isinstance(key, str):
+                            json_name = NtvUtil.from_obj_name(key)
+                        break
+                    reader.skip_value()
+                else:
+                    raise NtvError(pointer + " is not present in the file")
+            for key in reader.items():
+                value = reader.read_value()
+                value = {key: value} if isinstance(key, str) else value
+                yield Ntv.from_obj(value, def_type, sep_val, **kwargs)
 
     def __len__(self):
         """len of ntv_value"""
-        if isinstance(self.ntv_value, list):
+        if isinstance(self.ntv_value, (list, NtvSequence)):
             return len(self.ntv_value)
         return 1
 
@@ -236,7 +433,7 @@ class Ntv(ABC, NtvUtil):
 
     def __contains__(self, item):
         """item of Ntv entities"""
-        if isinstance(self.val, list):
+        if isinstance(self.val, (list, NtvSequence)):
             return item in self.ntv_value
         return item == self.ntv_value
 
@@ -269,34 +466,147 @@ class Ntv(ABC, NtvUtil):
         if isinstance(selec, str):
             return self.ntv_value[self._string_to_ind(selec)]
         if isinstance(selec, list):
-            return self[selec[0]][selec[1:]]
+            node = self
+            for key in selec:
+                node = node._get_child(key)
+            return node
         return self.ntv_value[selec]
 
+    def _get_child(self, key):
+        """return the item designated by a key of a pointer (`__getitem__` with
+        a shortcut for the index and the name of a NtvList entity)"""
+        if isinstance(self, NtvList):
+            if key.__class__ is int:
+                return self.ntv_value[key]
+            if key.__class__ is str and key[:1] not in ("", "#"):
+                return self.ntv_value[self._string_to_ind(key)]
+        return self[key]
+
+    def get_many(self, pointers):
+        """return the list of the entities designated by a list of pointers.
+
+        The pointers are merged in a tree (trie) of the common prefixes: each
+        intermediate entity is read only once.
+
+        *Parameters*
+
+        - **pointers** : list of pointers (json-pointer string with or without
+        '#' or NtvPointer or list of name or index), from the root entity
+        """
+        result = [None] * len(pointers)
+        trie = ([], {})
+        for row, pointer in enumerate(pointers):
+            if isinstance(pointer, str):
+                pointer = NtvPointer.compile(pointer.removeprefix("#"))
+            branch = trie
+            for key in pointer:
+                child = branch[1].get(key)
+                if child is None:
+                    child = branch[1][key] = ([], {})
+                branch = child
+            branch[0].append(row)
+        for root in trie[1]:
+            self._check_root(root)
+        stack = [(self, branch) for branch in trie[1].values()]
+        stack.append((self, (trie[0], {})))
+        while stack:
+            node, (rows, childs) = stack.pop()
+            for row in rows:
+                result[row] = node
+            stack.extend(
+                (node._get_child(key), branch) for key, branch in childs.items()
+            )
+        return result
+
+    def select(self, path):
+        """return the list of the included entities selected by a path query.
+
+        *Parameters*
+
+        - **path** : string or NtvSelector - path of the query (see `NtvSelector`),
+        e.g. '**/:point' (all the included entities with the point type),
+        'records/*/name' or 'records/[0:10]/*:date'"""
+        if not isinstance(path, NtvSelector):
+            path = NtvSelector.compile(path)
+        return path.run(self)
+
+    def index_by_type(self):
+        """return a dict with the list of the included entities (DFS preordering)
+        for each ntv_type (Datatype, Namespace or None).
+
+        The index is cached in the entity until the entity (or one of the
+        included entities) is modified."""
+        nodes, ranks = self._type_index()
+        return {typ: [nodes[rank] for rank in rnk] for typ, rnk in ranks.items()}
+
+    def find(self, type=None, namespace=None, leaf=None):
+        """return the list of the included entities (DFS preordering) with a
+        ntv_type (the type index is used, see `index_by_type`).
+
+        *Parameters*
+
+        - **type** : string or Datatype (default None) - ntv_type of the entities
+        - **namespace** : string or Namespace (default None) - Namespace which
+        includes the ntv_type of the entities (e.g. 'fr.')
+        - **leaf** : boolean (default None) - if True, only NtvSingle entities,
+        if False, only NtvList entities, if None, all the entities"""
+        type_name = type.long_name if isinstance(type, Datatype) else type
+        nsp_name = namespace
+        if isinstance(namespace, Namespace):
+            nsp_name = namespace.long_name
+        nodes, ranks = self._type_index()
+        selected = [
+            rnk
+            for typ, rnk in ranks.items()
+            if typ is not None
+            and (type_name is None or typ.long_name == type_name)
+            and (nsp_name is None or typ.long_name.startswith(nsp_name))
+        ]
+        found = [nodes[rank] for rank in heapq.merge(*selected)]
+        if leaf is None:
+            return found
+        return [node for node in found if isinstance(node, NtvSingle) == leaf]
+
+    def _type_index(self):
+        """return the cached type index: list of the included entities and dict
+        with the rows of the entities for each ntv_type"""
+        if self._types is None:
+            nodes = NtvTree(self).nodes
+            ranks = {}
+            for rank, node in enumerate(nodes):
+                ranks.setdefault(node.ntv_type, []).append(rank)
+            self._types = (nodes, ranks)
+        return self._types
+
     def _pointer_to_list(self, pointer):
         """return a list of child pointers from a string or a NtvPointer"""
         if isinstance(pointer, str):
-            selec = list(NtvPointer(pointer[1:]))
+            selec = NtvPointer.compile(pointer[1:])
         elif isinstance(pointer, NtvPointer):
-            selec = list(pointer)
+            selec = tuple(pointer)
         else:
             raise NtvError("pointer is not a valid pointer")
+        self._check_root(selec[0])
+        return list(selec[1:])
+
+    def _check_root(self, root):
+        """raise an NtvError if root is not the first pointer of the entity"""
         if not (
-            selec[0] in [self.json_name(string=True), self.ntv_name]
-            or (isinstance(selec[0], int) and selec[0] == 0)
+            root == self.ntv_name
+            or (isinstance(root, int) and root == 0)
+            or root == self.json_name(string=True)
         ):
-            raise NtvError(
-                str(selec[0]) + "is not the root json_name : " + self.ntv_name
-            )
-        return selec[1:]
+            raise NtvError(str(root) + "is not the root json_name : " + self.ntv_name)
 
     def _string_to_ind(self, json_name):
-        """return the index of a name or a json_name"""
+        """return the index of a name or a json_name (first entity)"""
         if NtvUtil.from_obj_name(json_name)[1]:
-            return [
-                ntv.json_name(def_type=self.type_str, string=True)
-                for ntv in self.ntv_value
-            ].index(json_name)
-        return [ntv.ntv_name for ntv in self.ntv_value].index(json_name)
+            idx = self.json_names.get(json_name)
+        else:
+            idx = self.names.get(json_name)
+        if idx is None:
+            raise ValueError(repr(json_name) + " is not in list")
+        return idx
 
     def __lt__(self, other):
         """return a comparison between two ntv_value"""
@@ -327,6 +637,20 @@ class Ntv(ABC, NtvUtil):
             code += "T"
         return code
 
+    @property
+    def digest(self):
+        """return the structural digest (bytes) of the entity (Merkle hash of the
+        included entities).
+
+        The digest is cached and it is reset (for the entity and its parents) by
+        the methods which modify the entity (`set_value`, `set_name`, `set_type`,
+        `append`, `insert`, `remove`, `replace`, item assignment or deletion).
+        A direct modification of the attributes (or of a mutable value) has to
+        be followed by `_invalidate`."""
+        if self._digest is None:
+            self._digest = self._new_digest()
+        return self._digest
+
     @property
     def json_name_str(self):
         """return the JSON name of the NTV entity"""
@@ -336,7 +660,7 @@ class Ntv(ABC, NtvUtil):
     def max_len(self):
         """return the highest len of Ntv entity included"""
         maxi = len(self)
-        if isinstance(self.ntv_value, (list, set)):
+        if isinstance(self.ntv_value, (list, set, NtvSequence)):
             maxi = max(maxi, max(ntv.max_len for ntv in self.ntv_value))
         return maxi
 
@@ -428,7 +752,7 @@ class Ntv(ABC, NtvUtil):
 
     def from_value(self):
         """return a Ntv entity from ntv_value"""
-        if isinstance(self.ntv_value, list):
+        if isinstance(self.ntv_value, (list, NtvSequence)):
             return NtvList(self.ntv_value)
         return Ntv.from_obj(self.ntv_value)
 
@@ -488,63 +812,115 @@ class Ntv(ABC, NtvUtil):
 
     def no_type(self):
         """convert NTV entity in a NV entity (in which ntv_type is 'json' or None')"""
-        no_typ = copy.copy(self)
-        for ntv in NtvTree(no_typ).leaf_nodes:
-            ntv.set_type("json")
-        for ntv in NtvTree(no_typ).inner_nodes:
-            ntv.set_type()
-        return no_typ
+        return self._copy_update(
+            lambda ntv: ntv.set_type("json" if isinstance(ntv, NtvSingle) else None),
+            lambda ntv: (
+                ntv.type_str != "json"
+                if isinstance(ntv, NtvSingle)
+                else ntv.ntv_type is not None
+            ),
+        )
 
     def no_name(self):
         """convert NTV entity in a TV entity (in which ntv_name is None)"""
-        no_nam = copy.copy(self)
-        for ntv in NtvTree(no_nam):
+
+        def change(ntv):
             ntv.ntv_name = None
-        return no_nam
+
+        return self._copy_update(change, lambda ntv: ntv.ntv_name is not None)
 
     def no_value(self):
         """convert NTV entity in a NV entity (in which ntv_value of leaf nodes is ntv_type )"""
-        no_val = copy.copy(self)
-        for ntv in NtvTree(no_val).leaf_nodes:
+
+        def change(ntv):
             ntv.ntv_value = ntv.type_str
             ntv.set_type("json")
-        return no_val
+
+        return self._copy_update(change, leaf=True)
 
     def only_type(self):
         """convert NTV entity in a V entity (in which ntv_value of leaf nodes
         is ntv_type )"""
-        only_typ = copy.copy(self)
-        for ntv in NtvTree(only_typ).leaf_nodes:
-            ntv.ntv_value = ntv.type_str
-            ntv.set_type("json")
-            ntv.set_name()
-        for ntv in NtvTree(only_typ).inner_nodes:
+
+        def change(ntv):
+            if isinstance(ntv, NtvSingle):
+                ntv.ntv_value = ntv.type_str
+            ntv.set_type("json" if isinstance(ntv, NtvSingle) else None)
             ntv.set_name()
-            ntv.set_type()
-        return only_typ
+
+        return self._copy_update(change)
 
     def only_name(self):
         """convert NTV entity in a V entity (in which ntv_value of leaf nodes
         is ntv_name )"""
-        only_nam = copy.copy(self)
-        for ntv in NtvTree(only_nam).leaf_nodes:
-            ntv.ntv_value = ntv.name
-            ntv.set_type("json")
-            ntv.set_name()
-        for ntv in NtvTree(only_nam).inner_nodes:
-            ntv.set_type()
-        return only_nam
+
+        def change(ntv):
+            if isinstance(ntv, NtvSingle):
+                ntv.ntv_value = ntv.name
+                ntv.set_name()
+            ntv.set_type("json" if isinstance(ntv, NtvSingle) else None)
+
+        return self._copy_update(change)
 
     def only_value(self):
         """convert NTV entity in a V entity"""
-        only_val = copy.copy(self)
-        for ntv in NtvTree(only_val).leaf_nodes:
-            ntv.set_type("json")
-            ntv.set_name()
-        for ntv in NtvTree(only_val).inner_nodes:
-            ntv.set_type()
+
+        def change(ntv):
+            ntv.set_type("json" if isinstance(ntv, NtvSingle) else None)
             ntv.set_name()
-        return only_val
+
+        return self._copy_update(
+            change,
+            lambda ntv: ntv.ntv_name != ""
+            or (
+                ntv.type_str != "json"
+                if isinstance(ntv, NtvSingle)
+                else ntv.ntv_type is not None
+            ),
+        )
+
+    def _copy_update(self, change, select=None, leaf=None):
+        """return a copy of the entity where the function `change` is applied to
+        the included entities for which `select` is True (all the entities if
+        select is None).
+
+        In the copy-on-write mode (see `set_copy_on_write`), the self-tree is
+        only read: the changed entities and their parents are the only copied
+        entities.
+
+        *Parameters*
+
+        - **change**: function - modification of an entity of the copy
+        - **select**: function (default None) - selection of the entities to be
+        changed (applied to the entities of the self-tree)
+        - **leaf**: boolean (default None) - entities to be changed (see
+        `NtvTree.iter_nodes`)"""
+        cop = copy.copy(self)
+        if not Ntv.copy_on_write:
+            for ntv in NtvTree(cop, keep=True).iter_nodes(leaf=leaf):
+                if select is None or select(ntv):
+                    change(ntv)
+            return cop
+        # rows and entities of the copy (None if not accessed) of the current path
+        rows, nodes = [None], [cop]
+        for ntv, depth, row in NtvTree(self).walk():
+            if depth:
+                del rows[depth:], nodes[depth:]
+                rows.append(row)
+                nodes.append(None)
+            if leaf is not None and NtvTree._is_inner(ntv) == leaf:
+                continue
+            if select is not None and not select(ntv):
+                continue
+            level = depth
+            while nodes[level] is None:
+                level -= 1
+            for lev in range(level + 1, depth + 1):
+                value = nodes[lev - 1].ntv_value
+                node = value._node(rows[lev]) if value.__class__ is NtvShared else None
+                nodes[lev] = value[rows[lev]] if node is None else node
+            change(nodes[depth])
+        return cop
 
     @staticmethod
     def obj_ntv(value, name="", typ="", single=False):
@@ -585,12 +961,61 @@ class Ntv(ABC, NtvUtil):
         if not self.parent:
             root_pointer = 0 if index else self.json_name(string=True)
             return NtvPointer([root_pointer])
-        idx = item_idx if item_idx else self.parent.ntv_value.index(self)
+        idx = item_idx if item_idx else self._position()
         num = index or self.parent.json_array
         pointer = self.parent.pointer(index)
         pointer.append(idx if num else self.json_name_str)
         return pointer
 
+    def _position(self):
+        """return the index of the entity in its parent (the `_row` attribute
+        maintained by the NtvList methods is checked by identity and the rows
+        are renumbered if it is not valid)"""
+        siblings = self.parent.ntv_value
+        if isinstance(siblings, NtvSequence):
+            return siblings._position(self)
+        row = self._row
+        if row is None or row >= len(siblings) or siblings[row] is not self:
+            self.parent._renumber()
+            row = self._row
+            if row is None or row >= len(siblings) or siblings[row] is not self:
+                raise NtvError("the entity is not included in its parent")
+        return row
+
+    def _invalidate(self, tree=False):
+        """reset the cached values (digest, tree statistics, name indexes) of the
+        entity (and of the included entities if tree) and of its parents"""
+        if tree:
+            for node in NtvTree(self):
+                node._clear_cache()
+        node = self
+        while node is not None:
+            node._clear_cache()
+            node = node.parent
+
+    def _clear_cache(self):
+        """reset the cached values of the entity"""
+        self._digest = self._stats = self._types = None
+
+    def _detach(self, tree=False):
+        """copy the entity (and the included entities if tree) in the
+        copy-on-write copies which share it, before a modification of the entity
+        (see `set_copy_on_write`)"""
+        if not NtvShared.sharing:
+            return
+        path, top = [self], 0
+        while path[-1].parent is not None:
+            path.append(path[-1].parent)
+            top = len(path) - 1 if path[-1]._sharers else top
+        # from the root: the copied entities share the next entity of the path
+        for idx in range(top, 0, -1):
+            for shared in path[idx]._shared():
+                shared._detach(path[idx - 1])
+        if tree:
+            for node in NtvTree(self).iter_nodes(leaf=False):
+                for shared in node._shared():
+                    shared._detach()
+
     def reduce(self, obj=True, maxi=6, level=3):
         """reduce the length and the level of the entity
 
@@ -603,23 +1028,13 @@ class Ntv(ABC, NtvUtil):
         *return*
 
         - **NTV entity** or **jsonNTV**
+
+        The reduced entity is a preview: only the first and the last maxi // 2
+        entities of the NtvList are read (down to `level`) and the values are
+        shared with the entity (not copied).
         """
-        ntv = copy.copy(self)
-        cont = Ntv.obj("___") if self.json_array else Ntv.obj({"___": ""})
-        if isinstance(self, NtvSingle):
-            return ntv
-        if level == 0:
-            ntv.ntv_value = [Ntv.obj("___", no_typ=True)]
-        if len(self) <= maxi:
-            ntv.ntv_value = [child.reduce(False, maxi, level - 1) for child in ntv]
-            return ntv
-        mid = maxi // 2
-        cont.set_type(ntv.type_str)
-        start = [child.reduce(False, maxi, level - 1) for child in ntv[:mid]]
-        middle = [cont]
-        end = [child.reduce(False, maxi, level - 1) for child in ntv[-mid:]]
-        ntv.ntv_value = start + middle + end
-        if obj:
+        ntv = self._preview(maxi, level)
+        if obj and isinstance(self, NtvList):
             return ntv.to_obj()
         return ntv
 
@@ -635,27 +1050,23 @@ class Ntv(ABC, NtvUtil):
         parent = self.parent
         if not parent:
             return
-        idx = parent.ntv_value.index(self) if index is None else index
+        idx = self._position() if index is None else index
         if not parent[idx] == self:
             raise NtvError("the entity is not present at the index")
-        del parent.ntv_value[idx]
+        del parent[idx]
         if not first and index is None:
             while self in parent:
-                idx = parent.ntv_value.index(self)
-                del parent.ntv_value[idx]
-        if self not in parent:
-            self.parent = None
+                del parent[parent.ntv_value.index(self)]
+        self.parent = self._row = None
         return
 
     def replace(self, ntv):
         """replace self by ntv in the tree"""
         parent = self.parent
         if parent:
-            idx = parent.ntv_value.index(self)
-            parent.insert(idx, ntv)
-            del parent[idx + 1]
-            if self not in parent:
-                self.parent = None
+            parent.insert(self._position(), ntv)
+            del parent[self._position()]
+            self.parent = self._row = None
         else:
             raise NtvError("replace is not available for root node")
 
@@ -671,23 +1082,25 @@ class Ntv(ABC, NtvUtil):
             'inner': NtvList entities
             'all': all entities"""
         name = "" if name is None else name
+        self._detach(nodes != "simple")
+        self._invalidate(nodes != "simple")
         match nodes:
             case "simple":
                 self.ntv_name = str(name)
             case "leaves":
                 if not isinstance(name, list):
                     name = [str(name)] * NtvTree(self).breadth
-                for nam, ntv in zip(name, NtvTree(self).leaf_nodes):
+                for nam, ntv in zip(name, NtvTree(self, True).iter_nodes(leaf=True)):
                     ntv.ntv_name = nam
             case "inner":
                 if not isinstance(name, list):
                     name = [str(name)] * len(NtvTree(self).inner_nodes)
-                for nam, ntv in zip(name, NtvTree(self).inner_nodes):
+                for nam, ntv in zip(name, NtvTree(self, True).iter_nodes(leaf=False)):
                     ntv.ntv_name = nam
             case "all":
                 if not isinstance(name, list):
                     name = [str(name)] * NtvTree(self).size
-                for nam, ntv in zip(name, NtvTree(self).nodes):
+                for nam, ntv in zip(name, NtvTree(self, keep=True)):
                     ntv.ntv_name = nam
             case _:
                 raise NtvError("the nodes option is not valid")
@@ -700,7 +1113,9 @@ class Ntv(ABC, NtvUtil):
         - **typ**: string, Datatype, Namespace (default None)"""
         if typ and not isinstance(typ, (str, Datatype, Namespace)):
             raise NtvError("the type is not a valid type")
+        self._detach()
         self.ntv_type = str_type(typ, self.__class__.__name__ == "NtvSingle")
+        self._invalidate()
 
     def set_value(self, value=None, fast=False):
         """set new ntv_value of a single entity or of a list of entities included
@@ -710,13 +1125,17 @@ class Ntv(ABC, NtvUtil):
         - **value**: list or single value
         - **fast** : boolean (default False) - if True, value is not converted"""
         if isinstance(self, NtvSingle):
+            self._detach()
             self.ntv_value = NtvSingle(value, ntv_type=self.ntv_type, fast=fast).val
+            self._invalidate()
             return
+        self._detach(True)
         if not isinstance(value, list):
             value = [value] * NtvTree(self).breadth
         ntv_val = NtvList(value, fast=fast)
-        for val, ntv in zip(ntv_val, NtvTree(self).leaf_nodes):
+        for val, ntv in zip(ntv_val, NtvTree(self, True).iter_nodes(leaf=True)):
             ntv.ntv_value = val.val
+        self._invalidate(True)
         return
 
     def to_ntvsingle(self, name=None, typ=None, def_type=None, **kwargs):
@@ -818,7 +1237,7 @@ class Ntv(ABC, NtvUtil):
             return {
                 ntv: [
                     ntvi.to_repr(nam, typ, val, jsn, maxi)
-                    for ntvi in self.ntv_value[:maxv]
+                    for ntvi in self._childs(maxv)
                 ]
             }
         raise NtvError("the ntv entity is not consistent")
@@ -863,7 +1282,8 @@ class Ntv(ABC, NtvUtil):
         - **def_type** : Datatype or Namespace (default None) - default type to apply
         to the NTV entity
         - **encoded** : boolean (default False) - choice for return format
-        (string/bytes if True, dict/list/tuple else)
+        (string/bytes if True, dict/list/tuple else). The JSON text is encoded
+        with the JSON backend (see `set_json_backend`)
         - **format**  : string (default 'json')- choice for return format
         (json, cbor, obj)
         - **simpleval** : boolean (default False) - if True, only value (without
@@ -874,6 +1294,10 @@ class Ntv(ABC, NtvUtil):
         - **fast** : boolean (default False) - if True, json is created without conversion
         - **maxi**: Integer (default -1) - number of values to include for NtvList
         entities. If maxi < 1 all the values are included.
+        - **engine** : string (default 'single') - serializer used
+            'single': single pass on the tree (if the json values are not
+            converted: json or tuple format, fast option), else 'recursive'
+            'recursive': `obj_value` method of each entity
         """
         option = {
             "encoded": False,
@@ -884,48 +1308,100 @@ class Ntv(ABC, NtvUtil):
             "name": True,
             "json_array": False,
             "type": False,
+            "engine": "single",
         } | kwargs
-        value = self.obj_value(def_type=def_type, **option)
+        if option["engine"] == "single" and (
+            option["fast"] or option["format"] in ("json", "tuple")
+        ):
+            if isinstance(def_type, (Datatype, Namespace)):
+                def_type = def_type.long_name
+            opt2 = option | {"encoded": False}
+            json_obj = Ntv._json_obj(*self._json_item(def_type or "", opt2, {}))
+        else:
+            value = self.obj_value(def_type=def_type, **option)
+            json_obj = Ntv._json_obj(self._obj_name(value, def_type, option), value)
+        if option["encoded"] and option["format"] == "json":
+            return NtvJson.dumps(json_obj)
+        if option["encoded"] and option["format"] == "cbor":
+            return NtvConnector.connector()["CborConnec"].to_obj_ntv(json_obj)
+        return json_obj
+
+    @staticmethod
+    def _json_obj(name, value):
+        """return the `to_obj` value from the name and the `obj_value` value"""
+        if name:
+            return {name: value}
+        return [value] if isinstance(value, dict) and len(value) == 1 else value
+
+    def _obj_name(self, value, def_type, option):
+        """return the name of the `to_obj` value (json-object if not empty)"""
         obj_name = self.json_name(def_type)
         if not option["name"]:
             obj_name[0] = ""
         if option["simpleval"]:
-            name = ""
-        elif (
+            return ""
+        if (
             option["format"] in ("cbor", "obj")
             and not NtvConnector.is_json_class(value)
             and not option["type"]
         ):
-            name = obj_name[0]
-        else:
-            name = obj_name[0] + obj_name[1] + obj_name[2]
-        value = (
-            [value]
-            if not name and isinstance(value, dict) and len(value) == 1
-            else value
-        )
-        json_obj = {name: value} if name else value
-        if option["encoded"] and option["format"] == "json":
-            return json.dumps(json_obj, cls=NtvJsonEncoder)
-        if option["encoded"] and option["format"] == "cbor":
-            return NtvConnector.connector()["CborConnec"].to_obj_ntv(json_obj)
-        return json_obj
+            return obj_name[0]
+        return obj_name[0] + obj_name[1] + obj_name[2]
+
+    def dump(self, fp, format="json", def_type=None, **kwargs):
+        """write the JSON representation of the NTV entity in a file-like object.
+
+        The data written is the same as with `to_obj(encoded=True)` but the json
+        value is written by chunks during the tree walk (the json value is never
+        created as a whole).
+
+        *Parameters*
+
+        - **fp** : file-like object with a `write` method (text object for
+        'json' format, binary object for 'cbor' format)
+        - **format**  : string (default 'json')- choice for data format
+        (json, cbor)
+        - **def_type** : Datatype or Namespace (default None) - default type to apply
+        to the NTV entity
+        - **kwargs** : other parameters of the `to_obj` method (except encoded)
+        """
+        if format not in ("json", "cbor"):
+            raise NtvError("the format is not valid for dump")
+        option = {
+            "fast": False,
+            "maxi": -1,
+            "simpleval": False,
+            "name": True,
+            "json_array": False,
+            "type": False,
+        } | kwargs
+        option |= {"encoded": False, "format": format}
+        writer = NtvWriter(fp, format)
+        self._dump(writer, def_type, option)
+        writer.flush()
 
     def to_json_ntv(self):
         """create a copy where ntv-value of the self-tree nodes is converted
         in json-value"""
-        ntv = copy.copy(self)
-        for leaf in ntv.tree.leaf_nodes:
+
+        def change(leaf):
             if isinstance(leaf.ntv_value, (NtvSingle, NtvList)):
                 leaf.ntv_value = leaf.ntv_value.to_obj()
                 leaf.ntv_type = Datatype("ntv")
-            elif not leaf.is_json:
+                leaf.is_json = True
+            else:
                 leaf.ntv_value, leaf.ntv_name, type_str = NtvConnector.cast(
                     leaf.ntv_value, leaf.ntv_name, leaf.type_str
                 )
                 leaf.ntv_type = Datatype(type_str)
                 leaf.is_json = True
-        return ntv
+
+        return self._copy_update(
+            change,
+            lambda leaf: isinstance(leaf.ntv_value, (NtvSingle, NtvList))
+            or not leaf.is_json,
+            leaf=True,
+        )
 
     def to_obj_ntv(self, **kwargs):
         """create a copy where ntv-value of the self-tree nodes is converted
@@ -934,19 +1410,22 @@ class Ntv(ABC, NtvUtil):
         *Parameters*
 
         - **kwargs** : parameters used in NtvConnector class (specific for each Connector)"""
-        ntv = copy.copy(self)
-        for leaf in ntv.tree.leaf_nodes:
-            if (
-                leaf.is_json
-                and leaf.type_str in set(NtvConnector.dic_type.values())
-                or leaf.ntv_type is None
-            ):
-                leaf.ntv_value, leaf.ntv_name, type_str = NtvConnector.uncast(
-                    leaf, **kwargs
-                )
-                leaf.ntv_type = Datatype(type_str) if type_str else None
-                leaf.is_json = NtvConnector.is_json(leaf.ntv_value)
-        return ntv
+        obj_types = set(NtvConnector.dic_type.values())
+
+        def change(leaf):
+            leaf.ntv_value, leaf.ntv_name, type_str = NtvConnector.uncast(
+                leaf, **kwargs
+            )
+            leaf.ntv_type = Datatype(type_str) if type_str else None
+            leaf.is_json = NtvConnector.is_json(leaf.ntv_value)
+
+        return self._copy_update(
+            change,
+            lambda leaf: leaf.is_json
+            and leaf.type_str in obj_types
+            or leaf.ntv_type is None,
+            leaf=True,
+        )
 
     def to_tuple(self, maxi=10):
         """return a nested tuple representation of the NTV entity
@@ -969,7 +1448,12 @@ class Ntv(ABC, NtvUtil):
             return (clas, name, typ, val.to_tuple(maxi=maxi))
         if isinstance(self, NtvList):
             maxv = len(self.ntv_value) if maxi < 1 else maxi
-            return (clas, name, typ, [ntv.to_tuple(maxi=maxi) for ntv in val[:maxv]])
+            return (
+                clas,
+                name,
+                typ,
+                [ntv.to_tuple(maxi=maxi) for ntv in self._childs(maxv)],
+            )
         raise NtvError("the ntv entity is not consistent")
 
     def validate(self, unique=False):
@@ -980,7 +1464,7 @@ class Ntv(ABC, NtvUtil):
         - **unique**: boolean (default False) - if True, stop validation at the
         first error"""
         errors = []
-        for ntv in self.tree.leaf_nodes:
+        for ntv in self.tree.iter_nodes(leaf=True):
             valid = ntv.ntv_type.validate(ntv.ntv_value)
             if not valid:
                 errors.append(str(ntv.pointer()))
@@ -992,6 +1476,31 @@ class Ntv(ABC, NtvUtil):
     def obj_value(self, def_type=None, **kwargs):
         """return the ntv_value with different formats defined by kwargs (abstract method)"""
 
+    @abstractmethod
+    def _new_digest(self):
+        """return the computed `digest` (abstract method)"""
+
+    @abstractmethod
+    def _preview(self, maxi, level):
+        """return the `reduce` entity (abstract method)"""
+
+    @abstractmethod
+    def _json_item(self, def_type, option, types):
+        """return the name and the `obj_value` value for the single pass
+        serializer (abstract method)"""
+
+    @abstractmethod
+    def _dump(self, writer, def_type, option):
+        """write the `to_obj` value with a NtvWriter (abstract method)"""
+
+    def _dump_key(self, def_type, option):
+        """return the name of the `to_obj` value if it is a json-object with
+        one value, else None"""
+        value = None
+        if isinstance(self, NtvSingle) and option["format"] != "json":
+            value = self.obj_value(def_type, **option)
+        return self._obj_name(value, def_type, option) or None
+
     @property
     @abstractmethod
     def json_array(self):
@@ -1018,42 +1527,90 @@ class Ntv(ABC, NtvUtil):
             and value.lstrip()[0] in '"-{[0123456789tfn'
         ):
             try:
-                value = json.loads(value)
-            except json.JSONDecodeError:
+                value = NtvJson.loads(value)
+            except NtvJson.error:
                 pass
         return value
 
     @staticmethod
     def decode_json(json_value):
         """return (value, name, type, separator, isjson) of a json object"""
+        val, *name_typ_sep = Ntv._decode_obj(json_value)
+        return (val, *name_typ_sep, NtvConnector.is_json(val))
+
+    @staticmethod
+    def _decode_obj(json_value):
+        """return (value, name, type, separator) of a json object (the json
+        status of the value is not computed)"""
         if isinstance(json_value, dict) and len(json_value) == 1:
-            json_name = list(json_value.keys())[0]
-            val = json_value[json_name]
-            return (val, *NtvUtil.from_obj_name(json_name), NtvConnector.is_json(val))
-        return (json_value, None, None, None, NtvConnector.is_json(json_value))
+            json_name, val = next(iter(json_value.items()))
+            return (val, *NtvUtil.from_obj_name(json_name))
+        return (json_value, None, None, None)
+
+    @staticmethod
+    def _decode_node(ntv_value, ntv_name, str_typ, sep, def_type, def_sep, fast):
+        """return the NtvSingle defined by the decoded json value or the
+        parameters (ntv_value, ntv_name, def_type, sep_val) of the NtvList to create
+
+        *Parameters*
+
+        - **ntv_value, ntv_name, str_typ, sep**: decoded json value (see `_decode_obj`)
+        - **def_type, def_sep, fast**: see `from_obj` method"""
+        sep = def_sep if not sep else sep
+        sep = None if str_typ and str_typ[-1] == "." and sep == ":" else sep
+        if isinstance(ntv_value, (list, dict)) and sep in (None, "::"):
+            def_type = agreg_type(str_typ, def_type, False)
+            sep_val = ":" if sep and def_type else None
+            return (ntv_value, ntv_name, def_type, sep_val)
+        if sep == ":" or (sep is None and isinstance(ntv_value, dict)):
+            ntv_type = agreg_type(str_typ, def_type, False)
+            return NtvSingle(ntv_value, ntv_name, ntv_type, fast=fast)
+        if sep is None and not isinstance(ntv_value, dict):
+            is_single_json = isinstance(ntv_value, (int, str, float, bool))
+            ntv_type = agreg_type(str_typ, def_type, is_single_json)
+            return NtvSingle(ntv_value, ntv_name, ntv_type, fast=fast)
+        raise NtvError('separator ":" is not compatible with value')
 
     @staticmethod
     def _create_ntvlist(
-        str_typ, def_type, sep, ntv_value, typ_auto, no_typ, ntv_name, fast
+        ntv_value,
+        ntv_name,
+        def_type,
+        sep_val,
+        typ_auto,
+        no_typ,
+        fast,
+        columnar=False,
+        lazy=False,
     ):
         """return a NtvList with parameters from Ntv.from_obj method"""
-        def_type = agreg_type(str_typ, def_type, False)
-        sep_val = ":" if sep and def_type else None
-        if isinstance(ntv_value, dict):
-            keys = list(ntv_value.keys())
-            values = list(ntv_value.values())
+        column = NtvColumn.from_json(ntv_value, def_type, sep_val) if columnar else None
+        if column is not None:
+            ntv_list = column
+        elif lazy:
+            ntv_list = NtvLazy(ntv_value, def_type, sep_val, fast, columnar)
+        elif isinstance(ntv_value, dict):
             ntv_list = [
-                Ntv.from_obj({key: val}, def_type, sep_val, fast=fast)
-                for key, val in zip(keys, values)
+                Ntv.from_obj(
+                    {key: val}, def_type, sep_val, fast=fast, columnar=columnar
+                )
+                for key, val in ntv_value.items()
             ]
         else:
             ntv_list = [
-                Ntv.from_obj(val, def_type, sep_val, fast=fast) for val in ntv_value
+                Ntv.from_obj(val, def_type, sep_val, fast=fast, columnar=columnar)
+                for val in ntv_value
             ]
-        if typ_auto and not def_type and ntv_list:
-            def_type = ntv_list[0].ntv_type
-        def_type = None if no_typ else def_type
-        return NtvList(ntv_list, ntv_name, def_type, typ_auto, fast=fast)
+        return NtvList._from_ntv_list(
+            ntv_list, ntv_name, def_type, typ_auto, no_typ, fast
+        )
+
+    @staticmethod
+    def _iter_frame(ntv_value, ntv_name, def_type, sep_val):
+        """return a stack item for the Ntv.from_obj_iter method"""
+        is_dict = isinstance(ntv_value, dict)
+        childs = iter(ntv_value.items() if is_dict else ntv_value)
+        return [childs, is_dict, [], ntv_name, def_type, sep_val]
 
     @staticmethod
     def _listed(idx):
@@ -1076,7 +1633,9 @@ class NtvSingle(Ntv):
     - `obj_value`
     """
 
-    def __init__(self, value, ntv_name=None, ntv_type=None, fast=False):
+    __slots__ = ()
+
+    def __init__(self, value, ntv_name=None, ntv_type=None, fast=False, is_json=None):
         """NtvSingle constructor.
 
         *Parameters*
@@ -1086,29 +1645,26 @@ class NtvSingle(Ntv):
         - **value**: value of the entity
         - **fast**: boolean (default False) - Ntv is created with a list of json values
         without control
+        - **is_json**: Boolean (default None) - json status of the value if
+        already known with fast option (computed if None)
         """
         if not fast:
-            value, ntv_name, ntv_type = NtvSingle._decode_s(value, ntv_name, ntv_type)
+            value, ntv_name, ntv_type, is_json = NtvSingle._decode_s(
+                value, ntv_name, ntv_type
+            )
             if ntv_type and isinstance(ntv_type, str) and ntv_type[-1] == ".":
                 raise NtvError("the ntv_type is not valid")
-        super().__init__(value, ntv_name, ntv_type)
+        super().__init__(value, ntv_name, ntv_type, is_json)
 
     def __eq__(self, other):
-        """equal if name type and value are equal"""
-        return (
-            self.__class__.__name__ == other.__class__.__name__
-            and self.ntv_name == other.ntv_name
-            and self.ntv_type == other.ntv_type
-            and self.ntv_value == other.ntv_value
+        """equal if name type and value are equal (same digest)"""
+        return self is other or (
+            isinstance(other, NtvSingle) and self.digest == other.digest
         )
 
     def __hash__(self):
-        """return hash(name) + hash(type) + hash(value)"""
-        return (
-            hash(self.ntv_name)
-            + hash(self.ntv_type)
-            + hash(json.dumps(self.ntv_value, cls=NtvJsonEncoder))
-        )
+        """return hash(digest)"""
+        return hash(self.digest)
 
     def __copy__(self):
         """Copy all the Ntv tree"""
@@ -1121,6 +1677,27 @@ class NtvSingle(Ntv):
         """return the json_array dynamic attribute (always False)"""
         return False
 
+    def _new_digest(self):
+        """return the computed `digest` (name, type and value)"""
+        value = self.ntv_value
+        if isinstance(value, Ntv):
+            value = ("ntv", value.digest)
+        elif value.__class__ is float and value.is_integer():
+            value = int(value)
+        elif value is not None and value.__class__ not in (str, int, float, bool):
+            value = NtvSingle._int_float(value)
+            value = ("json", json.dumps(value, sort_keys=True, cls=NtvJsonEncoder))
+        return hashlib.blake2b(
+            repr(("S", self.ntv_name or "", self.type_str, value)).encode(),
+            digest_size=16,
+        ).digest()
+
+    def _preview(self, maxi, level):
+        """return the `reduce` entity (the value is shared)"""
+        return self.__class__(
+            self.ntv_value, self.ntv_name, self.ntv_type, True, self.is_json
+        )
+
     def obj_value(self, def_type=None, **kwargs):
         """return the ntv_value with different formats defined by kwargs"""
         option = {
@@ -1135,6 +1712,42 @@ class NtvSingle(Ntv):
             return None
         return NtvConnector.uncast(self, **option)[0]
 
+    def _json_item(self, def_type, option, types):
+        """return the name and the `obj_value` value for the single pass
+        serializer (see `json_name` and `to_obj`).
+
+        *Parameters*
+
+        - **def_type** : string - long_name of the default type
+        - **option** : dict - `to_obj` parameters
+        - **types** : dict - json_type (value) for each (def_type, ntv_type)
+        """
+        value = self.ntv_value
+        if option["simpleval"]:
+            return ("", value)
+        json_type = ""
+        if self.ntv_type:
+            json_type = types.get((def_type, self.ntv_type))
+            if json_type is None:
+                json_type = relative_type(def_type, self.ntv_type.long_name)
+                if json_type == "json" and (
+                    not def_type or def_type == "json" or def_type[-1] == "."
+                ):
+                    json_type = ""
+                types[def_type, self.ntv_type] = json_type
+            if json_type and not NtvConnector.is_json_class(value):
+                json_type = ""
+        name = (self.ntv_name or "") if option["name"] else ""
+        if json_type:
+            return (name + ":" + json_type, value)
+        if not def_type and isinstance(value, (list, dict)):
+            return (name + ":", value)
+        return (name, value)
+
+    def _dump(self, writer, def_type, option):
+        """write the `to_obj` value with a NtvWriter"""
+        writer.leaf(self.to_obj(def_type, **option))
+
     def _obj_sep(self, json_name, json_type, def_type=None):  # REQ5
         """return separator to include in json_name"""
         if json_type or not def_type and isinstance(self.ntv_value, (list, dict)):
@@ -1143,22 +1756,15 @@ class NtvSingle(Ntv):
 
     @staticmethod
     def _decode_s(ntv_value, ntv_name, ntv_type_str):
-        """return adjusted ntv_value, ntv_name, ntv_type(str)"""
+        """return adjusted ntv_value, ntv_name, ntv_type(str) and json status
+        of the adjusted ntv_value"""
         is_json = NtvConnector.is_json(ntv_value)
         name = None
         if is_json:
-            if isinstance(ntv_value, (list)):
-                ntv_value = [
-                    NtvSingle._decode_s(val, "", ntv_type_str)[0] for val in ntv_value
-                ]
-            elif isinstance(ntv_value, (dict)):
-                ntv_value = {
-                    key: NtvSingle._decode_s(val, "", ntv_type_str)[0]
-                    for key, val in ntv_value.items()
-                }
+            ntv_value = NtvSingle._copy_json(ntv_value)
         elif isinstance(ntv_value, NtvSingle):
             ntv_value = ntv_value.to_obj()
-            return (ntv_value, ntv_name, "ntv")
+            return (ntv_value, ntv_name, "ntv", NtvConnector.is_json(ntv_value))
         else:
             ntv_value, name, typ_str = NtvConnector.cast(ntv_value, ntv_name)
             ntv_type_str = Datatype(typ_str).name if typ_str else ntv_type_str
@@ -1170,7 +1776,30 @@ class NtvSingle(Ntv):
         elif not is_json and ntv_type_str != typ_str:
             raise NtvError("ntv_value is not compatible with ntv_type")
         ntv_name = name if not ntv_name else ntv_name
-        return (ntv_value, ntv_name, ntv_type_str)
+        if not is_json:
+            is_json = NtvConnector.is_json(ntv_value)
+        return (ntv_value, ntv_name, ntv_type_str, is_json)
+
+    @staticmethod
+    def _int_float(value):
+        """return the value where the integral floats of the included lists and
+        dicts are converted to int (1.0 and 1 have the same `digest`)"""
+        if value.__class__ is float:
+            return int(value) if value.is_integer() else value
+        if isinstance(value, (list, tuple)):
+            return [NtvSingle._int_float(val) for val in value]
+        if isinstance(value, dict):
+            return {key: NtvSingle._int_float(val) for key, val in value.items()}
+        return value
+
+    @staticmethod
+    def _copy_json(json_value):
+        """return a json_value where nested lists and dicts are copied"""
+        if isinstance(json_value, list):
+            return [NtvSingle._copy_json(val) for val in json_value]
+        if isinstance(json_value, dict):
+            return {key: NtvSingle._copy_json(val) for key, val in json_value.items()}
+        return json_value
 
 
 class NtvList(Ntv):
@@ -1182,8 +1811,16 @@ class NtvList(Ntv):
     *Attributes :*
     - no additional attributes to those of parent class `Ntv`
 
+    *Internal attributes :*
+    - **_names**:      cached value of `names` (None if not computed)
+    - **_json_names**: cached value of `json_names` (None if not computed)
+    - **_sharers**:    weak references to the NtvShared which share the
+    included entities (None if not shared)
+
     *dynamic values (@property)*
     - `json_array`
+    - `names`
+    - `json_names`
 
     The additional methods defined in this class are :
 
@@ -1191,6 +1828,8 @@ class NtvList(Ntv):
     - `obj_value`
     """
 
+    __slots__ = ("_names", "_json_names", "_sharers")
+
     def __init__(
         self, list_ntv, ntv_name=None, ntv_type=None, typ_auto=False, fast=False
     ):
@@ -1202,17 +1841,31 @@ class NtvList(Ntv):
         - **ntv_type**: String (default None) - default type or namespace of
         the included entities
         - **list_ntv**: list - list of Ntv objects or obj_value of Ntv objects
+        (or NtvSequence for a columnar or lazy NtvList)
         - **fast**: boolean (default False) - if True, Ntv is created with a list
         of json values without control
         - **type_auto**: boolean (default False) - if True, default type for NtvList
         is the ntv_type of the first Ntv in the ntv_value"""
-        if isinstance(list_ntv, NtvList):
+        if isinstance(list_ntv, NtvList) and isinstance(
+            list_ntv.ntv_value, NtvSequence
+        ):
+            ntv_value = copy.copy(list_ntv.ntv_value)
+            ntv_type = list_ntv.ntv_type
+            ntv_name = list_ntv.ntv_name
+        elif isinstance(list_ntv, NtvList):
             ntv_value = [copy.copy(ntv) for ntv in list_ntv.ntv_value]
             ntv_type = list_ntv.ntv_type
             ntv_name = list_ntv.ntv_name
+        elif isinstance(list_ntv, NtvSequence):
+            ntv_value = list_ntv if list_ntv.parent is None else list_ntv.copy()
         elif isinstance(list_ntv, list):
             ntv_value = [
-                Ntv.from_obj(ntv, ntv_type, ":", fast=fast) for ntv in list_ntv
+                (
+                    ntv
+                    if isinstance(ntv, Ntv)
+                    else Ntv.from_obj(ntv, ntv_type, ":", fast=fast)
+                )
+                for ntv in list_ntv
             ]
         elif isinstance(list_ntv, dict):
             ntv_value = [
@@ -1223,30 +1876,63 @@ class NtvList(Ntv):
             raise NtvError("ntv_value is not a list")
         if typ_auto and not ntv_type and len(ntv_value) > 0 and ntv_value[0].ntv_type:
             ntv_type = ntv_value[0].ntv_type
-        super().__init__(ntv_value, ntv_name, ntv_type)
-        for ntv in self:
+        # a list of Ntv entities is a json-value only if it is empty
+        super().__init__(ntv_value, ntv_name, ntv_type, not ntv_value)
+        self._names = self._json_names = self._sharers = None
+        if isinstance(ntv_value, NtvSequence):
+            ntv_value.set_parent(self)
+            return
+        for row, ntv in enumerate(ntv_value):
             ntv.parent = self
+            ntv._row = row
 
     @property
     def json_array(self):
         """return the json_array dynamic attribute"""
-        set_name = {ntv.json_name(def_type=self.type_str, string=True) for ntv in self}
-        return "" in set_name or len(set_name) != len(self)
+        json_names = self.json_names
+        return "" in json_names or len(json_names) != len(self)
+
+    @property
+    def names(self):
+        """return a dict with the index of the first entity for each ntv_name
+        (cached until the next modification)"""
+        if self._names is None:
+            names = {}
+            for idx, ntv in enumerate(self._childs(len(self))):
+                names.setdefault(ntv.ntv_name, idx)
+            self._names = names
+        return self._names
+
+    @property
+    def json_names(self):
+        """return a dict with the index of the first entity for each json_name
+        (cached until the next modification)"""
+        if self._json_names is None:
+            def_type = self.type_str
+            names = {}
+            for idx, ntv in enumerate(self._childs(len(self))):
+                names.setdefault(ntv.json_name(def_type=def_type, string=True), idx)
+            self._json_names = names
+        return self._json_names
 
     def __eq__(self, other):
-        """equal if name and value are equal"""
-        return (
-            self.__class__.__name__ == other.__class__.__name__
-            and self.ntv_name == other.ntv_name
-            and self.ntv_value == other.ntv_value
+        """equal if name and value are equal (same digest)"""
+        return self is other or (
+            isinstance(other, NtvList) and self.digest == other.digest
         )
 
     def __hash__(self):
-        """return hash(name) + hash(value)"""
-        return hash(self.ntv_name) + hash(tuple(self.ntv_value))
+        """return hash(digest)"""
+        return hash(self.digest)
 
     def __copy__(self):
-        """Copy all the data"""
+        """Copy all the data (in the copy-on-write mode, the included entities
+        are shared and copied only when they are accessed, see
+        `set_copy_on_write`)"""
+        if Ntv.copy_on_write and not isinstance(self.ntv_value, (NtvColumn, NtvLazy)):
+            value = self.ntv_value
+            values = value[:] if isinstance(value, list) else value._read()[:]
+            return self.__class__(NtvShared(values), self.ntv_name, self.ntv_type)
         cop = self.__class__(self)
         cop.parent = None
         return cop
@@ -1255,32 +1941,233 @@ class NtvList(Ntv):
         """replace ntv_value item at the `ind` row with `value`"""
         if ind < 0 or ind >= len(self):
             raise NtvError("out of bounds")
+        if NtvShared.sharing:
+            self._detach()
+            for shared in self._shared():
+                shared._detach(self._child(ind))
         self.ntv_value[ind] = value
         if isinstance(value, (NtvSingle, NtvList)):
             value.parent = self
+            value._row = ind
+        self._invalidate()
 
     def __delitem__(self, ind):
         """remove ntv_value item at the `ind` row"""
-        if isinstance(ind, int):
-            self.ntv_value.pop(ind)
-        else:
-            self.ntv_value.pop(self.ntv_value.index(self[ind]))
+        if not isinstance(ind, int):
+            ntv = self[ind]
+            if ntv.parent is not self:
+                raise NtvError("the entity is not included")
+            ind = ntv._position()
+        ind = ind + len(self) if ind < 0 else ind
+        if NtvShared.sharing:
+            self._detach()
+            for shared in self._shared():
+                shared._detach(self._child(ind))
+        self.ntv_value.pop(ind)
+        self._renumber(ind)
+        self._invalidate()
 
     def append(self, ntv):
         """add ntv at the end of the list of Ntv entities included"""
+        self._detach()
         old_parent = ntv.parent
         if old_parent:
-            del old_parent[old_parent.ntv_value.index(ntv)]
+            del old_parent[ntv._position()]
         self.ntv_value.append(ntv)
         ntv.parent = self
+        ntv._row = len(self) - 1
+        self._invalidate()
 
     def insert(self, idx, ntv):
         """add ntv at the index idx of the list of Ntv entities included"""
+        self._detach()
         old_parent = ntv.parent
         if old_parent:
-            del old_parent[old_parent.ntv_value.index(ntv)]
+            del old_parent[ntv._position()]
         self.ntv_value.insert(idx, ntv)
         ntv.parent = self
+        start = idx if idx >= 0 else len(self) - 1 + idx
+        self._renumber(max(0, min(start, len(self) - 1)))
+        self._invalidate()
+
+    def _clear_cache(self):
+        """reset the cached values of the entity"""
+        self._digest = self._stats = self._types = None
+        self._names = self._json_names = None
+
+    def _shared(self):
+        """return the NtvShared which share the included entities"""
+        if not self._sharers:
+            return []
+        shareds = [ref() for ref in self._sharers]
+        shareds = [shared for shared in shareds if shared is not None]
+        self._sharers = [weakref.ref(shared) for shared in shareds] or None
+        return shareds
+
+    def _renumber(self, start=0):
+        """update the `_row` attribute of the entities included from the `start`
+        row (the rows of a NtvSequence are checked when they are used)"""
+        if isinstance(self.ntv_value, NtvSequence):
+            return
+        values = self.ntv_value
+        for row in range(start, len(values)):
+            values[row]._row = row
+
+    @staticmethod
+    def _from_ntv_list(
+        ntv_list, ntv_name, def_type, typ_auto=False, no_typ=False, fast=False
+    ):
+        """return a NtvList from a list of decoded Ntv entities"""
+        if typ_auto and not def_type and ntv_list:
+            def_type = ntv_list[0].ntv_type
+        def_type = None if no_typ else def_type
+        return NtvList(ntv_list, ntv_name, def_type, typ_auto, fast=fast)
+
+    def _json_item(self, def_type, option, types):
+        """return the name and the `obj_value` value for the single pass
+        serializer (see `json_name`, `to_obj` and `obj_value`).
+
+        *Parameters*
+
+        - **def_type** : string - long_name of the default type
+        - **option** : dict - `to_obj` parameters
+        - **types** : dict - json_type (value) for each (def_type, ntv_type)
+        """
+        name = ""
+        if not option["simpleval"]:
+            json_type = ""
+            if self.ntv_type:
+                json_type = relative_type(def_type, self.ntv_type.long_name)
+            if json_type and (json_type[-1] != "." or self.ntv_name):
+                json_type = (":" if json_type[-1] == "." else "::") + json_type
+            name = ((self.ntv_name or "") if option["name"] else "") + json_type
+        if self.ntv_type:
+            def_type = self.ntv_type.long_name
+        maxv = len(self) if option["maxi"] < 1 else option["maxi"]
+        if isinstance(self.ntv_value, NtvSequence):
+            values = self.ntv_value.obj_values(def_type=def_type, **option)
+            if values is not None:
+                return (name, self._json_value(values[:maxv], option))
+        items = [ntv._json_item(def_type, option, types) for ntv in self._childs(maxv)]
+        if len(self) == 1 and isinstance(self._child(0), NtvSingle):
+            json_obj = Ntv._json_obj(*items[0])
+            if isinstance(json_obj, dict):
+                return (name, json_obj)
+        if (
+            not (option["simpleval"] or option["json_array"])
+            and all(item[0] for item in items)
+            and len(value := dict(items)) == len(items)
+        ):
+            return (name, value)
+        return (name, [Ntv._json_obj(*item) for item in items])
+
+    def _json_value(self, values, option):
+        """return the `obj_value` value from the `to_obj` values of the entities"""
+        if (
+            len(self) == 1
+            and isinstance(values[0], dict)
+            and isinstance(self[0], NtvSingle)
+        ):
+            return values[0]
+        if (
+            not NtvUtil.is_dictable(values)
+            or option["simpleval"]
+            or option["json_array"]
+        ):
+            return values
+        return {list(val.items())[0][0]: list(val.items())[0][1] for val in values}
+
+    def _dump(self, writer, def_type, option, inner=False):
+        """write the `to_obj` value (the `obj_value` value if inner) with a
+        NtvWriter (see `to_obj` and `obj_value`)"""
+        name = None if inner else self._dump_key(def_type, option)
+        def_type = self.ntv_type.long_name if self.ntv_type else def_type
+        single, keys, length = self._dump_plan(def_type, option)
+        is_dict = keys is not None
+        wrap = not inner and not name and is_dict and length == 1
+        if name:
+            writer.start(True, 1)
+            writer.key(name)
+        if wrap:
+            writer.start(False, 1)
+        if single is not None:
+            writer.leaf(single)
+        else:
+            writer.start(is_dict, length)
+            for idx, child in enumerate(self._childs(length)):
+                if not is_dict:
+                    child._dump(writer, def_type, option)
+                    continue
+                writer.key(keys[idx])
+                if isinstance(child, NtvSingle):
+                    writer.leaf(child.obj_value(def_type, **option))
+                else:
+                    child._dump(writer, def_type, option, inner=True)
+            writer.end()
+        if name or wrap:
+            writer.end()
+
+    def _new_digest(self):
+        """return the computed `digest` (name and digest of the included entities)"""
+        hsh = hashlib.blake2b(repr(("L", self.ntv_name or "")).encode(), digest_size=16)
+        hsh.update(b"".join(child.digest for child in self._childs(len(self))))
+        return hsh.digest()
+
+    def _preview(self, maxi, level):
+        """return the `reduce` entity (only the previewed entities are read)"""
+        if level == 0:
+            childs = [Ntv.obj("___", no_typ=True)]
+        elif len(self) <= maxi:
+            childs = [child._preview(maxi, level - 1) for child in self._childs(maxi)]
+        else:
+            mid = maxi // 2
+            length = len(self)
+            idxs = list(range(mid)) + list(range(length - mid, length))
+            childs = [self._child(idx)._preview(maxi, level - 1) for idx in idxs]
+            names = {
+                child.json_name(def_type=self.type_str, string=True) for child in childs
+            }
+            if "" in names or len(names) != len(childs):
+                cont = Ntv.obj("___")
+            else:
+                cont = Ntv.obj({"___": ""})
+            cont.set_type(self.type_str)
+            childs.insert(mid, cont)
+        return self.__class__(childs, self.ntv_name, self.ntv_type, fast=True)
+
+    def _child(self, idx):
+        """return the Ntv entity at the idx row (the entity of a NtvSequence is
+        not kept)"""
+        if isinstance(self.ntv_value, NtvSequence):
+            return self.ntv_value._node(idx, keep=False)
+        return self.ntv_value[idx]
+
+    def _childs(self, maxv):
+        """return an iterator on the first maxv Ntv entities (the entities of a
+        NtvSequence are not kept)"""
+        if isinstance(self.ntv_value, NtvSequence):
+            return islice(self.ntv_value._iter_nodes(), maxv)
+        return islice(self.ntv_value, maxv)
+
+    def _dump_plan(self, def_type, option):
+        """return the form of the `obj_value` value: (value of the single
+        NtvSingle or None, names if json-object else None, length of the value)"""
+        length = len(self) if option["maxi"] < 1 else min(option["maxi"], len(self))
+        if len(self) == 1:
+            child = next(self._childs(1))
+            if isinstance(child, NtvSingle):
+                obj = child.to_obj(def_type, **option)
+                if isinstance(obj, dict):
+                    return (obj, list(obj), len(obj))
+        if option["simpleval"] or option["json_array"]:
+            return (None, None, length)
+        keys = {}
+        for child in self._childs(length):
+            key = child._dump_key(def_type, option)
+            if key is None or key in keys:
+                return (None, None, length)
+            keys[key] = None
+        return (None, list(keys), length)
 
     def _obj_sep(self, json_name, json_type, def_type=None):
         """return separator to include in json_name"""
@@ -1304,19 +2191,587 @@ class NtvList(Ntv):
         opt2 = option | {"encoded": False}
         maxv = len(self.ntv_value) if option["maxi"] < 1 else option["maxi"]
         def_type = self.ntv_type.long_name if self.ntv_type else def_type
-        values = [
-            ntv.to_obj(def_type=def_type, **opt2) for ntv in self.ntv_value[:maxv]
-        ]
-        if (
-            len(self) == 1
-            and isinstance(self[0], NtvSingle)
-            and isinstance(values[0], dict)
-        ):
-            return values[0]
+        values = None
+        if isinstance(self.ntv_value, NtvSequence):
+            values = self.ntv_value.obj_values(def_type=def_type, **opt2)
+        if values is None:
+            values = [
+                ntv.to_obj(def_type=def_type, **opt2) for ntv in self._childs(maxv)
+            ]
+        else:
+            values = values[:maxv]
+        return self._json_value(values, option)
+
+
+class NtvSequence(MutableSequence):
+    """The NtvSequence class is an abstract class used by `NtvColumn`,
+    `NtvLazy` and `NtvShared` classes: the ntv_value of a NtvList where the
+    included Ntv entities are created from stored values when they are accessed.
+
+    *Attributes :*
+    - **values** : sequence - stored values of the Ntv entities
+    - **parent** : NtvList - NtvList associated
+    - **nodes** : dict - Ntv entities created (key: index)
+
+    The methods defined in this class are :
+
+    *instance methods*
+    - `copy`
+    - `obj_values` (abstract method)
+    - `set_parent`
+    - MutableSequence methods (`append`, `index`, `insert`, `pop`...)
+    """
+
+    __slots__ = ("values", "parent", "nodes")
+    placeholder = None
+
+    def __init__(self, values, parent=None):
+        """NtvSequence constructor.
+
+        *Parameters*
+
+        - **values** : sequence - stored values of the Ntv entities
+        - **parent** : NtvList (default None) - NtvList associated
+        """
+        self.values = values
+        self.parent = parent
+        self.nodes = {}
+
+    def __len__(self):
+        """number of Ntv entities"""
+        return len(self.values)
+
+    def __getitem__(self, ind):
+        """return the Ntv entity (or the list of Ntv entities) at the `ind` row"""
+        if isinstance(ind, slice):
+            return [self._node(idx) for idx in range(*ind.indices(len(self)))]
+        return self._node(self._index(ind))
+
+    def __setitem__(self, ind, value):
+        """replace the entity at the `ind` row with `value`"""
+        if isinstance(ind, slice):
+            items = list(self)
+            items[ind] = value
+            self._reset(items)
+        else:
+            self.nodes[self._index(ind)] = value
+
+    def __delitem__(self, ind):
+        """remove the entity at the `ind` row"""
+        if isinstance(ind, slice):
+            items = list(self)
+            del items[ind]
+            self._reset(items)
+            return
+        ind = self._index(ind)
+        del self.values[ind]
+        self.nodes = {
+            (idx - 1 if idx > ind else idx): node
+            for idx, node in self.nodes.items()
+            if idx != ind
+        }
+
+    def insert(self, index, value):
+        """add value at the `index` row"""
+        index = max(0, min(len(self), index if index >= 0 else len(self) + index))
+        self.values.insert(index, self.placeholder)
+        self.nodes = {
+            (idx + 1 if idx >= index else idx): node for idx, node in self.nodes.items()
+        }
+        self.nodes[index] = value
+
+    def __iter__(self):
+        """iterator for the Ntv entities"""
+        return (self._node(idx) for idx in range(len(self)))
+
+    def __contains__(self, value):
+        """True if value is an entity of the NtvSequence"""
+        return any(node is value or node == value for node in self._iter_nodes())
+
+    def __eq__(self, other):
+        """equal if the entities are equal"""
+        if isinstance(other, (list, NtvSequence)):
+            others = other._iter_nodes() if isinstance(other, NtvSequence) else other
+            return len(self) == len(other) and all(
+                node == oth for node, oth in zip(self._iter_nodes(), others)
+            )
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        """return classname and json values"""
+        return (
+            self.__class__.__name__
+            + "("
+            + str([node.to_obj() for node in self._iter_nodes()])
+            + ")"
+        )
+
+    def __copy__(self):
+        """copy the values and the entities created"""
+        cop = self._new(copy.copy(self.values))
+        cop.nodes = {idx: copy.copy(node) for idx, node in self.nodes.items()}
+        return cop
+
+    def copy(self):
+        """return a shallow copy (the entities created are shared)"""
+        cop = self._new(copy.copy(self.values))
+        cop.nodes = dict(self.nodes)
+        return cop
+
+    def index(self, value, start=0, stop=None):
+        """return the first row of value"""
+        stop = len(self) if stop is None else stop
+        for idx, node in enumerate(self._iter_nodes()):
+            if start <= idx < stop and (node is value or node == value):
+                return idx
+        raise ValueError("the value is not in the " + self.__class__.__name__)
+
+    def _position(self, node):
+        """return the row of the node (identity with the entities created,
+        else the `_row` attribute of a not kept node)"""
+        row = node._row
+        if row is not None and self.nodes.get(row) is node:
+            return row
+        for idx, nod in self.nodes.items():
+            nod._row = idx
+            if nod is node:
+                return idx
+        if row is not None and row < len(self) and row not in self.nodes:
+            return row
+        return self.index(node)
+
+    def set_parent(self, parent):
+        """set the parent of the NtvSequence and of the entities created"""
+        self.parent = parent
+        for node in self.nodes.values():
+            node.parent = parent
+
+    @abstractmethod
+    def obj_values(self, def_type=None, **option):
+        """return the list of the `to_obj` values of the entities (None if the
+        stored values can't be used)"""
+
+    @abstractmethod
+    def _create(self, idx):
+        """return a new Ntv entity from the stored value at the `idx` row"""
+
+    @abstractmethod
+    def _new(self, values):
+        """return a new NtvSequence with the same parameters and other values"""
+
+    def _index(self, ind):
+        """return the positive index"""
+        idx = ind + len(self) if ind < 0 else ind
+        if not 0 <= idx < len(self):
+            raise IndexError(self.__class__.__name__ + " index out of range")
+        return idx
+
+    def _node(self, idx, keep=True):
+        """return the Ntv entity at the `idx` row (created if not existing)"""
+        node = self.nodes.get(idx)
+        if node is None:
+            node = self._create(idx)
+            node.parent = self.parent
+            node._row = idx
+            if keep:
+                self.nodes[idx] = node
+        return node
+
+    def _iter_nodes(self):
+        """iterator for the entities (the Ntv entities created are not kept)"""
+        return (self._node(idx, keep=False) for idx in range(len(self)))
+
+    def _read(self):
+        """return the sequence of the entities read by the tree traversals (see
+        `NtvTree.walk`)"""
+        return self
+
+    def _reset(self, items):
+        """replace the entities with a list of entities"""
+        values = self.values[:0]
+        values.extend([self.placeholder] * len(items))
+        self.values = values
+        self.nodes = dict(enumerate(items))
+        for node in items:
+            node.parent = self.parent
+
+
+class NtvColumn(NtvSequence):
+    """The NtvColumn class is the ntv_value of a columnar NtvList: a list of
+    NtvSingle entities without name, with the same Datatype and with int (or
+    float) json values.
+
+    The json values are stored in an array and the NtvSingle entities are
+    created only when they are accessed.
+
+    *Attributes :*
+    - **values** : array - json values of the NtvSingle entities
+    - **ntv_type** : Datatype - type of the NtvSingle entities
+    - **parent** : NtvList - NtvList associated
+    - **nodes** : dict - NtvSingle entities created (key: index)
+
+    The additional methods defined in this class are :
+
+    *staticmethods*
+    - `from_json`
+
+    *instance methods*
+    - `to_list`
+    - `obj_values`
+    """
+
+    __slots__ = ("ntv_type",)
+    TYPECODE = {int: "q", float: "d"}
+    placeholder = 0
+
+    def __init__(self, values, ntv_type, parent=None):
+        """NtvColumn constructor.
+
+        *Parameters*
+
+        - **values** : array - json values of the NtvSingle entities
+        - **ntv_type** : Datatype - type of the NtvSingle entities
+        - **parent** : NtvList (default None) - NtvList associated
+        """
+        super().__init__(values, parent)
+        self.ntv_type = ntv_type
+
+    @staticmethod
+    def from_json(json_list, def_type, sep_val):
+        """return a NtvColumn from a list of json values (None if the values
+        are not int or float values of the same class)
+
+        *Parameters*
+
+        - **json_list** : list - json values to decode
+        - **def_type, sep_val** : default type and separator (see `Ntv.from_obj`)
+        """
+        if not json_list or not isinstance(json_list, list):
+            return None
+        classes = set(map(type, json_list))
+        if len(classes) != 1 or (clas := classes.pop()) not in NtvColumn.TYPECODE:
+            return None
+        try:
+            values = array(NtvColumn.TYPECODE[clas], json_list)
+        except OverflowError:
+            return None
+        leaf = Ntv._decode_node(json_list[0], None, None, None, def_type, sep_val, True)
+        return NtvColumn(values, leaf.ntv_type)
+
+    def __eq__(self, other):
+        """equal if the entities are equal"""
+        if isinstance(other, NtvColumn) and not (self.nodes or other.nodes):
+            return self.ntv_type == other.ntv_type and self.values == other.values
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def to_list(self):
+        """return the json values (None if an entity created is modified)"""
+        values = self.values.tolist()
+        clas = type(values[0]) if values else None
+        for idx, leaf in self.nodes.items():
+            if not (
+                leaf.__class__.__name__ == "NtvSingle"
+                and not leaf.ntv_name
+                and leaf.ntv_type is self.ntv_type
+                and type(leaf.ntv_value) is clas
+            ):
+                return None
+            values[idx] = leaf.ntv_value
+        return values
+
+    def obj_values(self, def_type=None, **option):
+        """return the list of the `to_obj` values of the entities without
+        creating them (None if the json values can't be used)
+
+        *Parameters*
+
+        - **def_type** : string (default None) - default type of the entities
+        - **option** : `to_obj` parameters"""
+        values = self.to_list()
+        if not values:
+            return values
+        probe = NtvSingle(values[0], None, self.ntv_type, fast=True)
+        obj = probe.to_obj(def_type=def_type, **option)
+        if type(obj) is not type(values[0]) or obj != values[0]:
+            return None
+        return values
+
+    def _create(self, idx):
+        """return a new NtvSingle from the json value at the `idx` row"""
+        return NtvSingle(self.values[idx], None, self.ntv_type, fast=True)
+
+    def _new(self, values):
+        """return a new NtvColumn with the same type and other values"""
+        return NtvColumn(values, self.ntv_type)
+
+
+class NtvLazy(NtvSequence):
+    """The NtvLazy class is the ntv_value of a lazy NtvList: the json values
+    of the included entities are kept and the Ntv entities are created only
+    when they are accessed (the included NtvList are also lazy).
+
+    *Attributes :*
+    - **values** : list - json values (or (json name, json value) for a json
+    object) of the Ntv entities
+    - **is_dict** : boolean - True if the values come from a json object
+    - **decode** : tuple - parameters of `Ntv.from_obj` for the included entities
+    (def_type, sep_val, fast, columnar)
+    - **parent** : NtvList - NtvList associated
+    - **nodes** : dict - Ntv entities created (key: index)
+
+    The additional methods defined in this class are :
+
+    *instance methods*
+    - `obj_values`
+    """
+
+    __slots__ = ("is_dict", "decode")
+
+    def __init__(self, json_value, def_type, sep_val, fast, columnar, parent=None):
+        """NtvLazy constructor.
+
+        *Parameters*
+
+        - **json_value** : list or dict - json value of the NtvList
+        - **def_type, sep_val, fast, columnar** : parameters of `Ntv.from_obj`
+        used for the included entities
+        - **parent** : NtvList (default None) - NtvList associated
+        """
+        self.is_dict = isinstance(json_value, dict)
+        self.decode = (def_type, sep_val, fast, columnar)
+        super().__init__(
+            list(json_value.items() if self.is_dict else json_value), parent
+        )
+
+    def __eq__(self, other):
+        """equal if the entities are equal"""
         if (
-            not NtvUtil.is_dictable(values)
-            or option["simpleval"]
-            or option["json_array"]
+            isinstance(other, NtvLazy)
+            and not (self.nodes or other.nodes)
+            and (self.is_dict, self.decode) == (other.is_dict, other.decode)
+            and self.values == other.values
         ):
-            return values
-        return {list(val.items())[0][0]: list(val.items())[0][1] for val in values}
+            return True
+        return super().__eq__(other)
+
+    __hash__ = None
+
+    def obj_values(self, def_type=None, **option):
+        """return the list of the `to_obj` values of the entities. The json
+        values of the entities not created are used when they are unchanged
+        by `to_obj`.
+
+        *Parameters*
+
+        - **def_type** : string (default None) - default type of the entities
+        - **option** : `to_obj` parameters"""
+        maxi = option.get("maxi", -1)
+        length = len(self) if maxi < 1 else min(maxi, len(self))
+        raw = option.get("fast") or option.get("format", "json") in ("json", "tuple")
+        plain = (
+            (option.get("fast") or option.get("format", "json") == "json")
+            and maxi < 1
+            and option.get("name", True)
+            and not (option.get("simpleval") or option.get("json_array"))
+            and not option.get("type")
+            and def_type is None
+            and self.decode[:2] == (None, None)
+        )
+        unchanged = {}
+        values = []
+        for idx in range(length):
+            if idx in self.nodes:
+                values.append(self.nodes[idx].to_obj(def_type, **option))
+                continue
+            value = self.values[idx]
+            json_value = {value[0]: value[1]} if self.is_dict else value
+            if plain and NtvLazy._is_plain(json_value):
+                values.append(json_value)
+                continue
+            if not raw or not self._is_simple(idx):
+                values.append(self._node(idx, False).to_obj(def_type, **option))
+                continue
+            clas = type(value[1] if self.is_dict else value)
+            if clas not in unchanged:
+                obj = self._node(idx, False).to_obj(def_type, **option)
+                unchanged[clas] = obj == json_value and type(obj) is type(json_value)
+                if self.is_dict and unchanged[clas]:
+                    unchanged[clas] = type(obj[value[0]]) is clas
+            if unchanged[clas]:
+                values.append(json_value)
+            else:
+                values.append(self._node(idx, False).to_obj(def_type, **option))
+        return values
+
+    @staticmethod
+    def _is_plain(json_value):
+        """return True if the json value is composed with json values, with
+        names without type and with lists without json-object of one element
+        (the json value is unchanged by `to_obj`)"""
+        if isinstance(json_value, list):
+            return bool(json_value) and all(
+                not (isinstance(val, dict) and len(val) < 2) and NtvLazy._is_plain(val)
+                for val in json_value
+            )
+        if isinstance(json_value, dict):
+            return all(
+                isinstance(name, str)
+                and name
+                and ":" not in name
+                and name[-1] != "."
+                and NtvLazy._is_plain(val)
+                for name, val in json_value.items()
+            )
+        return json_value is None or isinstance(json_value, (int, str, float))
+
+    def _is_simple(self, idx):
+        """return True if the json value at the `idx` row is a single value
+        with a name without type"""
+        value = self.values[idx]
+        if self.is_dict:
+            name, value = value
+            if not name or ":" in name or name[-1] == ".":
+                return False
+        return not isinstance(value, (list, dict, bytes))
+
+    def _create(self, idx):
+        """return a new lazy Ntv entity from the json value at the `idx` row"""
+        value = self.values[idx]
+        value = {value[0]: value[1]} if self.is_dict else value
+        def_type, sep_val, fast, columnar = self.decode
+        return Ntv.from_obj(
+            value, def_type, sep_val, fast=fast, columnar=columnar, lazy=True
+        )
+
+    def _new(self, values):
+        """return a new NtvLazy with the same parameters and other values"""
+        lazy = NtvLazy([], *self.decode)
+        lazy.is_dict = self.is_dict
+        lazy.values = values
+        return lazy
+
+
+class NtvShared(NtvSequence):
+    """The NtvShared class is the ntv_value of a copy-on-write NtvList: the
+    included entities are shared with the copied NtvList and they are copied
+    only when they are accessed (see `set_copy_on_write`).
+
+    The shared entities are read (not copied) by the methods which don't return
+    an entity (e.g. `to_obj`, `digest`, equality) and by the tree traversals
+    (see `NtvTree.walk`). The NtvShared is registered
+    in the parents of the shared entities: a shared entity is copied before it
+    is modified (see `Ntv._detach`), so the modifications of the copied NtvList
+    are not visible in the copy.
+
+    *class variables :*
+    - **sharing** : boolean - True if a NtvShared has been registered
+
+    *Attributes :*
+    - **values** : list - Ntv entities shared
+    - **parent** : NtvList - NtvList associated
+    - **nodes** : dict - Ntv entities copied (key: index)
+
+    The additional methods defined in this class are :
+
+    *instance methods*
+    - `obj_values`
+    """
+
+    __slots__ = ("__weakref__",)
+    sharing = False
+
+    def __init__(self, values, parent=None):
+        """NtvShared constructor.
+
+        *Parameters*
+
+        - **values** : list - Ntv entities shared
+        - **parent** : NtvList (default None) - NtvList associated
+        """
+        super().__init__(values, parent)
+        owners = {id(val.parent): val.parent for val in values if val is not None}
+        for owner in owners.values():
+            if owner is not None:
+                shareds = owner._shared() + [self]
+                owner._sharers = [weakref.ref(shared) for shared in shareds]
+                NtvShared.sharing = True
+
+    def __copy__(self):
+        """copy the entities (shared or copied)"""
+        nodes = [copy.copy(node) for node in self._iter_nodes()]
+        cop = NtvShared(nodes)
+        cop.nodes = dict(enumerate(nodes))
+        return cop
+
+    def obj_values(self, def_type=None, **option):
+        """return None (the `to_obj` values are read in the entities)"""
+        return None
+
+    def _create(self, idx):
+        """return a copy of the shared entity at the `idx` row"""
+        return self.values[idx].__copy__()
+
+    def _new(self, values):
+        """return a new NtvShared with other values"""
+        return NtvShared(values)
+
+    def _detach(self, child=None):
+        """copy the shared entity `child` (all the shared entities if None)"""
+        if child is not None:
+            row = child._row
+            if row is not None and row < len(self) and self.values[row] is child:
+                if row not in self.nodes:
+                    self._node(row)
+                return
+        for idx, value in enumerate(self.values):
+            if idx not in self.nodes and (child is None or value is child):
+                self._node(idx)
+
+    def _read(self):
+        """return the list of the entities read by the tree traversals (the
+        shared entities are not copied)"""
+        if not self.nodes:
+            return self.values
+        return [self.nodes.get(idx, val) for idx, val in enumerate(self.values)]
+
+    def _node(self, idx, keep=True):
+        """return the Ntv entity at the `idx` row (if not keep, the shared entity
+        is returned without copy)"""
+        if keep:
+            return super()._node(idx)
+        node = self.nodes.get(idx)
+        return self.values[idx] if node is None else node
+
+
+def set_copy_on_write(cow=True):
+    """define the copy mode of the NtvList entities and return the previous mode.
+
+    In the copy-on-write mode, a copy of a NtvList shares the included entities
+    with the copied NtvList and only the entities accessed by index (and their
+    parents) are copied. The copy is then created in O(length) and the
+    conversions (`no_type`, `only_value`, `to_json_ntv`...) copy only the
+    changed entities (and their parents). The cost of a copied entity is about
+    two or three times the cost of the full copy: the copy-on-write mode is
+    faster when few entities are changed (e.g. `no_type` of a json value with
+    few types) and slower when most of them are changed (e.g. `no_name`).
+
+    A shared entity is copied before it is modified with the Ntv methods
+    (`set_name`, `set_value`, `append`, item assignment...): the modifications
+    of the copy and of the copied entity are not visible in the other one. A
+    direct modification of the attributes has to be preceded by `_detach`.
+    The tree traversals (`NtvTree`, `select`, `find`...) don't copy the shared
+    entities: the entities returned have to be accessed by index (or traversed
+    with `NtvTree(ntv, keep=True)`) to be modified only in the copy.
+
+    *Parameters*
+
+    - **cow** : boolean (default True) - if True the copy-on-write mode is used,
+    else the entities included are copied
+    """
+    previous = Ntv.copy_on_write
+    Ntv.copy_on_write = bool(cow)
+    return previous
@@ -32,7 +32,7 @@ import datetime
 import csv
 import json
 
-from json_ntv.ntv import Ntv, NtvConnector, NtvList, NtvSingle, NtvTree
+from json_ntv.ntv import Ntv, NtvConnector, NtvList, NtvSequence, NtvSingle, NtvTree
 from json_ntv.ntv_util import NtvUtil
 
 
@@ -114,8 +114,7 @@ class ShapelyConnec(NtvConnector):
         - **type_geo** : type of geometry (point, multipoint,
         linestring, multilinestring', polygon, multipolygon)
         - **ntv_value** : array - coordinates"""
-        from shapely import geometry
-
+        geometry = NtvUtil.lazy_import("shapely.geometry")
         type_geo = (
             ShapelyConnec.type_geo(ntv_value)
             if "type_geo" not in kwargs or kwargs["type_geo"] == "geometry"
@@ -148,8 +147,7 @@ class ShapelyConnec(NtvConnector):
     @staticmethod
     def from_geojson(geojson):
         """convert geojson string into shapely geometry."""
-        from shapely import geometry
-
+        geometry = NtvUtil.lazy_import("shapely.geometry")
         return geometry.shape(json.loads(geojson))
 
     @staticmethod
@@ -182,8 +180,7 @@ class CborConnec(NtvConnector):
     @staticmethod
     def to_obj_ntv(ntv_value, **kwargs):
         """convert json ntv_value into a binary CBOR object (no parameters)."""
-        import cbor2
-
+        cbor2 = NtvUtil.lazy_import("cbor2")
         return cbor2.dumps(
             ntv_value,
             datetime_as_timestamp=True,
@@ -201,8 +198,7 @@ class CborConnec(NtvConnector):
         - **typ** : string (default None) - type of the NTV object,
         - **name** : string (default None) - name of the NTV object
         - **value** : binary data"""
-        import cbor2
-
+        cbor2 = NtvUtil.lazy_import("cbor2")
         return (cbor2.loads(value), name, typ)
 
 
@@ -345,9 +341,6 @@ class MermaidConnec(NtvConnector):
         - **row**: Boolean (default False) - if True, add the node row
         - **leaves**: Boolean (default False) - if True, add the leaf row
         """
-        from base64 import b64encode
-        from IPython.display import Image, display
-
         option = {"title": "", "disp": False, "row": False, "leaves": False} | kwargs
         diagram = MermaidConnec.diagram
         link = MermaidConnec._mermaid_link
@@ -355,7 +348,11 @@ class MermaidConnec(NtvConnector):
         node_link = {"nodes": [], "links": []}
         dic_node = {}
         if option["leaves"]:
-            nodes = [node for node in NtvTree(ntv) if not isinstance(node.val, list)]
+            nodes = [
+                node
+                for node in NtvTree(ntv)
+                if not isinstance(node.val, (list, NtvSequence))
+            ]
             dic_node = {node: row for row, node in enumerate(nodes)}
         link(ntv, None, node_link, option["row"], dic_node, None)
         mermaid_json = {
@@ -366,8 +363,11 @@ class MermaidConnec(NtvConnector):
             }
         }
         if option["disp"]:
-            return display(
-                Image(
+            from base64 import b64encode
+
+            display = NtvUtil.lazy_import("IPython.display")
+            return display.display(
+                display.Image(
                     url="https://mermaid.ink/img/"
                     + b64encode(diagram(mermaid_json).encode("ascii")).decode("ascii")
                 )
@@ -45,10 +45,13 @@ The representation of an NtvOp is a JSON-Object
 
 """
 
+from difflib import SequenceMatcher
+import functools
 import json
 from copy import copy
 
 OPERATIONS = ["add", "test", "move", "remove", "copy", "replace"]
+POINTER_CACHE_SIZE = 65536
 
 
 class NtvOp:
@@ -140,7 +143,11 @@ class NtvOp:
             "comment": self.comment,
             "from": str(self.from_path),
         }
-        return {key: val for key, val in dic.items() if val and val != "None"}
+        return {
+            key: val
+            for key, val in dic.items()
+            if val and val != "None" or key == "entity" and val is not None
+        }
 
     def exe(self, ntv):
         """applies the operation to the 'ntv' entity and return the resulting entity"""
@@ -151,7 +158,7 @@ class NtvOp:
         p_path = self.path[:-1].fragment
         path = self.path.fragment
         if self.ope in ["move", "copy", "add"]:
-            if self.ope == "add" and self.entity:
+            if self.ope == "add" and self.entity is not None:
                 ntv = Ntv.obj(self.entity)
             elif self.ope == "copy" and self.from_path:
                 ntv = copy(ntv_res[self.from_path.fragment])
@@ -165,7 +172,7 @@ class NtvOp:
                 ntv_res[p_path].append(ntv)
             else:
                 ntv_res[p_path].insert(idx, ntv)
-        elif self.ope == "test" and self.entity:
+        elif self.ope == "test" and self.entity is not None:
             ntv = Ntv.obj(self.entity)
             if not (idx == "-" and ntv in ntv_res[p_path]) and not (
                 isinstance(idx, int) and ntv == ntv_res[path]
@@ -175,7 +182,9 @@ class NtvOp:
             idx = list(self.path)[-1]
             idx = len(ntv[p_path]) - 1 if idx == "-" else idx
             ntv_res[p_path + "/" + str(idx)].remove(index=idx)
-        elif self.ope == "replace" and self.entity:
+        elif self.ope == "replace" and self.entity is not None and isinstance(idx, int):
+            ntv_res[p_path][idx] = Ntv.obj(self.entity)
+        elif self.ope == "replace" and self.entity is not None:
             ntv_res[path].replace(Ntv.obj(self.entity))
         else:
             raise NtvOpError("op add no result")
@@ -195,6 +204,9 @@ class NtvPatch:
     *dynamic values (@property)*
     - `json`
 
+    *static method*
+    - `diff`
+
     *instance method*
     - `append`
     - `exe`
@@ -312,6 +324,107 @@ class NtvPatch:
             ntv_res = ope.exe(ntv_res)
         return ntv_res
 
+    @staticmethod
+    def diff(ntv_a, ntv_b, comment=None):
+        """return the NtvPatch which converts ntv_a into ntv_b (ntv_b is equal to
+        NtvPatch.diff(ntv_a, ntv_b).exe(ntv_a)).
+
+        The identical entities are skipped (same `digest` and same types of the
+        included NtvList). The entities included
+        in a NtvList are matched by name (if the names are unique) or by
+        digest (longest common subsequence). The operations are 'add', 'remove',
+        'replace' and 'move' with index paths (the root index is 0).
+
+        *Parameters*
+
+        - **ntv_a**: Ntv entity - initial entity
+        - **ntv_b**: Ntv entity - final entity
+        - **comment**: str (default None) - comment of the NtvPatch
+        """
+        patch = NtvPatch([], comment)
+        if NtvPatch._same(ntv_a, ntv_b):
+            return patch
+        if not (
+            ntv_a.__class__.__name__ == ntv_b.__class__.__name__ == "NtvList"
+            and ntv_a.ntv_name == ntv_b.ntv_name
+            and ntv_a.ntv_type == ntv_b.ntv_type
+        ):
+            raise NtvOpError(
+                "the root entities are not compatible (name, type or class)"
+            )
+        NtvPatch._diff_list(patch, ntv_a, ntv_b, [0])
+        return patch
+
+    @staticmethod
+    def _same(ntv_a, ntv_b):
+        """return True if the entities are identical: same `digest` and same
+        types of the included NtvList (not included in the `digest`)"""
+        if ntv_a.digest != ntv_b.digest:
+            return False
+        pairs = [(ntv_a, ntv_b)]
+        while pairs:
+            node_a, node_b = pairs.pop()
+            if node_a.ntv_type != node_b.ntv_type:
+                return False
+            if node_a.__class__.__name__ == "NtvList":
+                pairs += zip(node_a._childs(len(node_a)), node_b._childs(len(node_b)))
+            elif node_a.ntv_value.__class__.__name__ in ("NtvSingle", "NtvList"):
+                pairs.append((node_a.ntv_value, node_b.ntv_value))
+        return True
+
+    @staticmethod
+    def _diff_list(patch, ntv_a, ntv_b, pointer):
+        """add to the patch the operations for the entities included in two
+        NtvList with the same name (pointer: index path of ntv_a)"""
+        childs_a = list(ntv_a._childs(len(ntv_a)))
+        childs_b = list(ntv_b._childs(len(ntv_b)))
+        dig_a = [child.digest for child in childs_a]
+        dig_b = [child.digest for child in childs_b]
+        start = 0
+        end_a, end_b = len(dig_a), len(dig_b)
+        while start < min(end_a, end_b) and NtvPatch._same(
+            childs_a[start], childs_b[start]
+        ):
+            start += 1
+        while (
+            end_a > start
+            and end_b > start
+            and NtvPatch._same(childs_a[end_a - 1], childs_b[end_b - 1])
+        ):
+            end_a -= 1
+            end_b -= 1
+        names_a = [child.ntv_name for child in childs_a]
+        names_b = [child.ntv_name for child in childs_b]
+        if (
+            all(names_a)
+            and all(names_b)
+            and len(set(names_a)) == len(names_a)
+            and len(set(names_b)) == len(names_b)
+        ):
+            keys_a, keys_b = names_a, names_b
+        else:
+            keys_a, keys_b = dig_a, dig_b
+        blocks = SequenceMatcher(
+            None, keys_a[start:end_a], keys_b[start:end_b], autojunk=False
+        ).get_opcodes()
+        blocks = [
+            (tag, i1 + start, i2 + start, j1 + start, j2 + start)
+            for tag, i1, i2, j1, j2 in blocks
+        ]
+        sources = {}
+        for tag, i1, i2, _, _ in blocks:
+            if tag != "equal":
+                for idx in range(i1, i2):
+                    sources.setdefault(keys_a[idx], []).append(idx)
+        moves = {}
+        for tag, _, _, j1, j2 in blocks:
+            if tag != "equal":
+                for jdx in range(j1, j2):
+                    if sources.get(keys_b[jdx]):
+                        moves[jdx] = sources[keys_b[jdx]].pop(0)
+        diff = _NtvDiff(patch, childs_a, childs_b, dig_a, dig_b, pointer, start)
+        diff.run(blocks, moves)
+
 
 class NtvPointer(list):
     """The NtvPointer class defines methods to identify a node in a NTV entity
@@ -322,6 +435,7 @@ class NtvPointer(list):
     - `fragment`
 
     *static method*
+    - `compile`
     - `split`
     - `pointer_json`
     - `pointer_list`
@@ -388,14 +502,138 @@ class NtvPointer(list):
     @staticmethod
     def pointer_list(json_pointer):
         """convert a json_pointer string into a pointer list"""
-        json_pointer = str(json_pointer)
-        split_pointer = json_pointer.split("/")
-        if len(split_pointer) == 0:
-            return []
-        return [
+        return list(NtvPointer.compile(str(json_pointer)))
+
+    @staticmethod
+    @functools.lru_cache(maxsize=POINTER_CACHE_SIZE)
+    def compile(json_pointer):
+        """convert a json_pointer string into a tuple of pointers (the result
+        is cached for the last POINTER_CACHE_SIZE json_pointers)"""
+        return tuple(
             int(nam) if nam.isdigit() else nam.replace("~1", "/").replace("~0", "/")
-            for nam in split_pointer
-        ]
+            for nam in json_pointer.split("/")
+        )
+
+
+class _NtvDiff:
+    """Operations of `NtvPatch.diff` for the entities of a NtvList.
+
+    The current list is: the final entities already placed (`pos` first
+    entities), the remaining initial entities (in their order) and the parked
+    initial entities (moved at the end before their final move)."""
+
+    def __init__(self, patch, childs_a, childs_b, dig_a, dig_b, pointer, start):
+        """initialization of the current list (the `start` first entities are
+        identical)"""
+        self.patch = patch
+        self.childs_a = childs_a
+        self.childs_b = childs_b
+        self.dig_a = dig_a
+        self.dig_b = dig_b
+        self.pointer = pointer
+        self.pos = start
+        self.parked = []
+        self.done = set()
+        # Fenwick tree on the remaining initial entities
+        self.tree = [0] * (len(childs_a) + 1)
+        for idx in range(start, len(childs_a)):
+            self._update(idx, 1)
+        self.remaining = len(childs_a) - start
+
+    def run(self, blocks, moves):
+        """add the operations defined by the SequenceMatcher blocks and the
+        moves (final index: initial index)"""
+        sources = set(moves.values())
+        for tag, i1, i2, j1, j2 in blocks:
+            if tag == "equal":
+                for idx_a, idx_b in zip(range(i1, i2), range(j1, j2)):
+                    self._consume(idx_a)
+                    self._pair(idx_a, idx_b)
+                    self.pos += 1
+                continue
+            free_a = []
+            for idx_a in range(i1, i2):
+                if idx_a in self.done:
+                    continue
+                if idx_a in sources:
+                    self._op("move", self._index(idx_a), "-")
+                    self._consume(idx_a)
+                    self.parked.append(idx_a)
+                else:
+                    free_a.append(idx_a)
+            free_a.reverse()
+            for idx_b in range(j1, j2):
+                if idx_b in moves:
+                    idx_a = moves[idx_b]
+                    self._op("move", self._index(idx_a), self.pos)
+                    if idx_a in self.parked:
+                        self.parked.remove(idx_a)
+                    else:
+                        self._consume(idx_a)
+                    self.done.add(idx_a)
+                    self._pair(idx_a, idx_b)
+                elif free_a:
+                    idx_a = free_a.pop()
+                    self._consume(idx_a)
+                    self._pair(idx_a, idx_b)
+                else:
+                    self._op("add", None, self.pos, self.childs_b[idx_b])
+                self.pos += 1
+            for idx_a in free_a:
+                self._consume(idx_a)
+                self._op("remove", None, self.pos)
+
+    def _pair(self, idx_a, idx_b):
+        """add the operations between two entities (the initial entity is at
+        the index `pos`)"""
+        ntv_a, ntv_b = self.childs_a[idx_a], self.childs_b[idx_b]
+        if self.dig_a[idx_a] == self.dig_b[idx_b] and NtvPatch._same(ntv_a, ntv_b):
+            return
+        if (
+            ntv_a.__class__.__name__ == ntv_b.__class__.__name__ == "NtvList"
+            and ntv_a.ntv_name == ntv_b.ntv_name
+            and ntv_a.ntv_type == ntv_b.ntv_type
+        ):
+            NtvPatch._diff_list(self.patch, ntv_a, ntv_b, self.pointer + [self.pos])
+        else:
+            self._op("replace", None, self.pos, ntv_b)
+
+    def _op(self, ope, from_idx, idx, ntv=None):
+        """add an operation to the patch"""
+        entity = None
+        if ntv is not None:
+            entity = ntv.to_obj()
+            entity = {":json": None} if entity is None else entity
+        dic = {"op": ope, "path": self.pointer + [idx], "entity": entity}
+        if from_idx is not None:
+            dic["from"] = self.pointer + [from_idx]
+        self.patch.append(NtvOp(dic))
+
+    def _index(self, idx_a):
+        """return the current index of a remaining or parked initial entity"""
+        if idx_a in self.parked:
+            return self.pos + self.remaining + self.parked.index(idx_a)
+        return self.pos + self._count(idx_a)
+
+    def _consume(self, idx_a):
+        """remove an initial entity from the remaining entities"""
+        self._update(idx_a, -1)
+        self.remaining -= 1
+
+    def _update(self, idx, val):
+        """add val to the Fenwick tree at the index idx"""
+        idx += 1
+        while idx < len(self.tree):
+            self.tree[idx] += val
+            idx += idx & -idx
+
+    def _count(self, idx):
+        """return the number of remaining initial entities before idx"""
+        res = 0
+        while idx > 0:
+            res += self.tree[idx]
+            idx -= idx & -idx
+        return res
 
 
 class NtvOpError(Exception):
@@ -7,13 +7,18 @@ Created on Feb 27 2023
 The `ntv_util` module is part of the `NTV.json_ntv` package ([specification document](
 https://github.com/loco-philippe/NTV/blob/main/documentation/JSON-NTV-standard.pdf)).
 
-It contains the classes `NtvUtil`, `NtvConnector`, `NtvTree`, `NtvJsonEncoder`
-and `NtvError` for NTV entities.
+It contains the classes `NtvUtil`, `NtvConnector`, `NtvTree`, `NtvSelector`,
+`NtvWriter`, `NtvReader`, `NtvJsonEncoder`, `NtvJson` and `NtvError` for NTV
+entities and the function `set_json_backend`.
 """
 
 from abc import ABC, abstractmethod
 import datetime
+import functools
+import importlib
+import io
 import json
+import math
 import re
 
 
@@ -22,10 +27,13 @@ class NtvUtil:
     NtvUtil is the parent class of `Datatype`, `Namespace`, `Ntv`.
 
     *class variables :*
-    - **_namespaces_** : list of Namespace defined
-    - **_types_** : list of Datatype defined
+    - **_namespaces_** : dict of Namespace defined (key: long_name)
+    - **_types_** : dict of TypeBase defined (key: long_name)
+    - **_datatypes_** : dict of shared Datatype instances (key: full name)
+    - **_optional_** : dict of optional packages (key: module, value: pip name)
 
     *static methods :*
+    - `lazy_import`
     - `is_dictable`
     - `from_obj_name`
     - `decode_ntv_tab`
@@ -35,6 +43,38 @@ class NtvUtil:
 
     _namespaces_ = {}
     _types_ = {}
+    _datatypes_ = {}
+    _optional_ = {
+        "requests": "requests",
+        "cbor2": "cbor2",
+        "shapely": "shapely",
+        "IPython": "ipython",
+    }
+    __slots__ = ()
+
+    @staticmethod
+    def lazy_import(name):
+        """return a module imported at first use (optional packages are not
+        imported with json_ntv).
+
+        *Parameters*
+
+        - **name** : string - name of the module (e.g. 'shapely.geometry')
+        """
+        try:
+            return importlib.import_module(name)
+        except ModuleNotFoundError as exc:
+            package = name.split(".", 1)[0]
+            if exc.name != package or package not in NtvUtil._optional_:
+                raise
+            raise ModuleNotFoundError(
+                "the optional package '"
+                + package
+                + "' is required (pip install "
+                + NtvUtil._optional_[package]
+                + ")",
+                name=package,
+            ) from exc
 
     @staticmethod
     def is_dictable(lis):
@@ -108,7 +148,14 @@ class NtvUtil:
             return (nam, typc, valc, ntv[1].val, ntv[2].to_obj(), None, leng)
         if len(ntv) == 2 and len(ntv[1]) == 1 and isinstance(ntv[1].val, (int, str)):
             return (nam, typc, valc, ntv[1].val, None, None, leng)
-        if len(ntv) == 2 and len(ntv[1]) == 1 and isinstance(ntv[1].val, list):
+        if (
+            len(ntv) == 2
+            and len(ntv[1]) == 1
+            and (
+                isinstance(ntv[1].val, list)
+                or ntv[1].val.__class__.__name__ in ("NtvColumn", "NtvLazy")
+            )
+        ):
             leng = leng * ntv[1][0].val
             return (nam, typc, valc, None, None, ntv[1][0].val, leng)
         if len(ntv) == 2 and len(ntv[1]) > 1 and isinstance(ntv[1][0].val, int):
@@ -565,11 +612,19 @@ class NtvTree:
     """The NtvTree class is an iterator class used to traverse a NTV tree structure.
     Some other methods give tree indicators and data.
 
+    The traversal (`walk`) uses an explicit stack of child iterators: the nodes
+    are never compared or searched in their parent.
+
+    The traversal of a copy-on-write copy (see `set_copy_on_write`) is read-only
+    by default: the entities shared with the copied entity are returned without
+    copy (a modification of these entities is applied to the copied entity).
+    With the `keep` option, they are copied in the copy before they are returned.
+
     *Attributes :*
 
     - **ntv** : Ntv entity
-    - **_node**:  Ntv entity - node pointer
-    - **_stack**:  list - stack used to store context in recursive methods
+    - **keep** : boolean - if True, the shared entities are copied
+    - **_walk**:  generator - traversal used by the iterator
 
     *dynamic values (@property)*
     - `breadth`
@@ -580,13 +635,25 @@ class NtvTree:
     - `dic_nodes`
     - `leaf_nodes`
     - `inner_nodes`
+
+    *instance methods*
+    - `walk`
+    - `iter_nodes`
+    - `stats`
     """
 
-    def __init__(self, ntv):
-        """the parameter of the constructor is the Ntv entity"""
+    def __init__(self, ntv, keep=False):
+        """NtvTree constructor.
+
+        *Parameters*
+
+        - **ntv** : Ntv entity to traverse
+        - **keep** : boolean (default False) - if True, the entities shared by
+        a copy-on-write copy are copied during the traversal (to be modified)
+        """
         self._ntv = ntv
-        self._node = None
-        self._stack = []
+        self.keep = keep
+        self._walk = None
 
     def __iter__(self):
         """iterator without initialization"""
@@ -594,89 +661,531 @@ class NtvTree:
 
     def __next__(self):
         """return next node in the tree"""
-        if self._node is None:
-            self._node = self._ntv
-        elif len(self._node) == 0:
-            raise StopIteration
-        elif self._node.__class__.__name__ == "NtvList":
-            self._next_down()
-        else:
-            self._next_up()
-        return self._node
-
-    def _next_down(self):
-        """find the next subchild node"""
-
-        self._node = self._node[0]
-        self._stack.append(0)
-
-    def _next_up(self):
-        """find the next sibling or ancestor node"""
-        parent = self._node.parent
-        if not parent or self._node == self._ntv:
-            raise StopIteration
-        ind = self._stack[-1]
-        if ind < len(parent) - 1:  # if ind is not the last
-            self._node = parent[ind + 1]
-            self._stack[-1] += 1
-        else:
-            if parent == self._ntv:
-                raise StopIteration
-            self._node = parent
-            self._stack.pop()
-            self._next_up()
+        if self._walk is None:
+            self._walk = self.walk()
+        return next(self._walk)[0]
+
+    @staticmethod
+    def _is_inner(node):
+        """return True if the node is a NtvList"""
+        return node.__class__.__name__ == "NtvList"
+
+    @staticmethod
+    def _childs(node, keep=False):
+        """return the child nodes of a NtvList (the entities shared by a
+        copy-on-write copy are copied only if keep)"""
+        value = node.ntv_value
+        return value if keep or isinstance(value, list) else value._read()
+
+    def walk(self):
+        """return a generator of (node, depth, index) tuples according to the DFS
+        preordering algorithm (index is the row of the node in its parent, None
+        for the root node).
+
+        The children of a node are read after the node is returned: the node
+        can be modified during the traversal."""
+        yield self._ntv, 0, None
+        if not self._is_inner(self._ntv):
+            return
+        stack = [enumerate(self._childs(self._ntv, self.keep))]
+        while stack:
+            for index, node in stack[-1]:
+                yield node, len(stack), index
+                if self._is_inner(node):
+                    stack.append(enumerate(self._childs(node, self.keep)))
+                break
+            else:
+                stack.pop()
+
+    def iter_nodes(self, leaf=None):
+        """return a generator of the nodes according to the DFS preordering
+        algorithm.
+
+        *Parameters*
+
+        - **leaf**: boolean (default None) - if True, only leaf nodes (NtvSingle),
+        if False, only inner nodes (NtvList), if None, all the nodes"""
+        if leaf is None:
+            return (node for node, _, _ in self.walk())
+        return (node for node, _, _ in self.walk() if self._is_inner(node) != leaf)
+
+    def stats(self):
+        """return a dict with the tree indicators computed in a single pass:
+
+        - **size** : number of nodes
+        - **breadth** : number of leaf nodes
+        - **height** : height of the tree
+        - **levels** : list with the number of nodes at each depth
+        - **fanout** : dict with the number of inner nodes for each number of
+        children
+
+        The indicators are cached in the root entity until the entity (or one of
+        the included entities) is modified."""
+        if self._ntv._stats is None:
+            levels, fanout, breadth = [], {}, 0
+            for node, depth, _ in self.walk():
+                if depth == len(levels):
+                    levels.append(0)
+                levels[depth] += 1
+                if self._is_inner(node):
+                    fanout[len(node)] = fanout.get(len(node), 0) + 1
+                else:
+                    breadth += 1
+            self._ntv._stats = {
+                "size": sum(levels),
+                "breadth": breadth,
+                "height": len(levels) - 1,
+                "levels": levels,
+                "fanout": dict(sorted(fanout.items())),
+            }
+        stats = self._ntv._stats
+        return stats | {
+            "levels": list(stats["levels"]),
+            "fanout": dict(stats["fanout"]),
+        }
 
     @property
     def breadth(self):
         """return the number of leaves"""
-        return len(self.leaf_nodes)
+        return self.stats()["breadth"]
 
     @property
     def size(self):
         """return the number of nodes"""
-        return len(self.nodes)
+        return self.stats()["size"]
 
     @property
     def height(self):
         """return the height of the tree"""
-        return max(len(node.pointer()) for node in self.__class__(self._ntv)) - 1
+        return self.stats()["height"]
 
     @property
     def adjacency_list(self):
         """return a dict with the list of child nodes for each parent node"""
-        return {node: node.val for node in self.inner_nodes}
+        return {node: node.val for node in self.iter_nodes(leaf=False)}
 
     @property
     def nodes(self):
         """return the list of nodes according to the DFS preordering algorithm"""
-        return list(self.__class__(self._ntv))
+        return list(self.iter_nodes())
 
     @property
     def dic_nodes(self):
         """return a dict of nodes according to the DFS preordering algorithm"""
-        return {
-            node.ntv_name: node for node in self.__class__(self._ntv) if node.ntv_name
-        }
+        return {node.ntv_name: node for node in self.iter_nodes() if node.ntv_name}
 
     @property
     def leaf_nodes(self):
         """return the list of leaf nodes according to the DFS preordering algorithm"""
-        return [
-            node
-            for node in self.__class__(self._ntv)
-            if node.__class__.__name__ == "NtvSingle"
-        ]
+        return list(self.iter_nodes(leaf=True))
 
     @property
     def inner_nodes(self):
         """return the list of inner nodes according to the DFS preordering algorithm"""
+        return list(self.iter_nodes(leaf=False))
+
+
+class NtvSelector:
+    """The NtvSelector class is a compiled path query over a NTV tree (used by
+    the `Ntv.select` method).
+
+    A path is a list of steps separated by '/' (relative to the entity):
+
+    - `*` : all the child entities
+    - `**` : the entity and all the included entities (recursive descent)
+    - `[i]`, `[i:j]`, `[i:j:k]` or `i` : child entities by index or slice
+    - `name`, `name:type`, `:type`, `*:type`, `:namespace.` : child entities
+    with this name (any name if empty or `*`) and this type (any type if absent,
+    a type ending with '.' is a Namespace which includes the type)
+
+    Names are escaped as in a json-pointer ('~1' for '/', '~0' for '~'). A
+    segment beginning with '[' is an index or a slice: a NtvError is raised if
+    it is not valid.
+
+    *Attributes :*
+
+    - **path** : string - path of the query
+    - **steps** : tuple - compiled steps (kind, argument)
+
+    *static method*
+    - `compile`
+
+    *instance method*
+    - `run`
+    """
+
+    def __init__(self, path):
+        """the parameter of the constructor is the path (string)"""
+        self.path = path
+        self.steps = tuple(
+            NtvSelector._step(seg) for seg in path.split("/") if seg not in ("", ".")
+        )
+
+    def __repr__(self):
+        """return classname and path"""
+        return self.__class__.__name__ + "(" + repr(self.path) + ")"
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def compile(path):
+        """return the NtvSelector of a path (the result is cached)"""
+        return NtvSelector(path)
+
+    @staticmethod
+    def _step(seg):
+        """return the compiled step (kind, argument) of a path segment"""
+        if seg == "**":
+            return ("desc", None)
+        if seg == "*":
+            return ("child", (None, None))
+        if seg[0] == "[":
+            return ("index", NtvSelector._index(seg))
+        if seg.lstrip("-").isdigit():
+            return ("index", int(seg))
+        name, typ, _ = NtvUtil.from_obj_name(seg)
+        if name is not None:
+            name = name.replace("~1", "/").replace("~0", "~")
+        return ("child", (None if name == "*" else name, typ))
+
+    @staticmethod
+    def _index(seg):
+        """return the index (int or slice) of a '[...]' path segment"""
+        bounds = seg[1:-1].split(":")
+        valid = seg[-1] == "]" and len(bounds) <= 3 and bounds != [""]
+        try:
+            bounds = [int(bnd) if bnd else None for bnd in bounds]
+        except ValueError:
+            valid = False
+        if not valid or bounds[2:] == [0]:
+            raise NtvError("the path segment is not valid : " + seg)
+        return bounds[0] if len(bounds) == 1 else slice(*bounds)
+
+    def run(self, ntv):
+        """return the list of the entities selected from the ntv entity"""
+        nodes = [ntv]
+        steps = self.steps
+        ind = 0
+        while ind < len(steps):
+            kind, arg = steps[ind]
+            if kind == "desc":
+                following = steps[ind + 1] if ind + 1 < len(steps) else None
+                if not following or following[0] != "child":
+                    nodes = self._descendants(nodes, 0, None, None)
+                elif (
+                    len(nodes) == 1
+                    and nodes[0] is ntv
+                    and following[1][1]
+                    and ntv._types is not None
+                ):  # the type index of ntv is used
+                    nodes = self._from_type_index(ntv, *following[1])
+                    ind += 1
+                else:  # the child step is checked during the traversal
+                    nodes = self._descendants(nodes, 1, *following[1])
+                    ind += 1
+            elif kind == "child":
+                nodes = [child for node in nodes for child in self._childs(node, *arg)]
+            else:
+                nodes = [child for node in nodes for child in self._items(node, arg)]
+            ind += 1
+        return nodes
+
+    @staticmethod
+    def _match(node, name, typ):
+        """return True if the node has the name and the type"""
+        if name is not None and node.ntv_name != name:
+            return False
+        return typ is None or NtvSelector._type_match(node.ntv_type, typ)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _type_match(ntv_type, typ):
+        """return True if the ntv_type is typ or is included in the typ
+        Namespace (the result is cached)"""
+        type_str = ntv_type.long_name if ntv_type else ""
+        return type_str.startswith(typ) if typ[-1] == "." else type_str == typ
+
+    @staticmethod
+    def _childs(node, name, typ):
+        """return the child entities with the name and the type"""
+        if not NtvTree._is_inner(node):
+            return []
+        childs = NtvTree._childs(node)
+        if name is not None:
+            names = node.names
+            if len(names) == len(node):  # unique names: the index is used
+                idx = names.get(name)
+                childs = [] if idx is None else [childs[idx]]
+                return [chi for chi in childs if NtvSelector._match(chi, None, typ)]
+        return [chi for chi in childs if NtvSelector._match(chi, name, typ)]
+
+    @staticmethod
+    def _items(node, index):
+        """return the child entities at the index (int or slice)"""
+        if not NtvTree._is_inner(node):
+            return []
+        if isinstance(index, slice):
+            return NtvTree._childs(node)[index]
+        if -len(node) <= index < len(node):
+            return [NtvTree._childs(node)[index]]
+        return []
+
+    @staticmethod
+    def _descendants(nodes, depth, name, typ):
+        """return the included entities (from `depth`) of the nodes with the
+        name and the type (without duplicates)"""
+        found = {}
+        for node in nodes:
+            for desc, level, _ in NtvTree(node).walk():
+                if level >= depth and NtvSelector._match(desc, name, typ):
+                    found.setdefault(id(desc), desc)
+        return list(found.values())
+
+    @staticmethod
+    def _from_type_index(ntv, name, typ):
+        """return the included entities (not ntv) with the name and the type
+        (`Ntv.find` is used)"""
+        found = ntv.find(namespace=typ) if typ[-1] == "." else ntv.find(type=typ)
         return [
             node
-            for node in self.__class__(self._ntv)
-            if node.__class__.__name__ == "NtvList"
+            for node in found
+            if node is not ntv and (name is None or node.ntv_name == name)
         ]
 
 
+class NtvWriter:
+    """The NtvWriter class writes a json value by chunks in a file-like object
+    (used by the `Ntv.dump` method). The json value is defined by a sequence of
+    calls (`start`, `key`, `leaf`, `end`) and is never created as a whole.
+
+    *Attributes :*
+
+    - **fp** : file-like object - text object (json format) or binary object
+    (cbor format) with a `write` method
+    - **format** : string - 'json' or 'cbor'
+    - **_stack** : list - [is_dict, number of values] for each open container
+    - **_chunks** : list - json chunks not yet written (json format)
+    - **_encoder** : CBOREncoder - encoder to a buffer (cbor format)
+
+    *instance methods*
+    - `start`
+    - `key`
+    - `leaf`
+    - `end`
+    - `flush`
+    """
+
+    CHUNK = 1000
+    BUFFER = 65536
+
+    def __init__(self, fp, format="json"):
+        """NtvWriter constructor.
+
+        *Parameters*
+
+        - **fp** : file-like object with a `write` method
+        - **format** : string (default 'json') - 'json' (text) or 'cbor' (binary)
+        """
+        self.fp = fp
+        self.format = format
+        self._stack = []
+        self._chunks = []
+        self._encoder = None
+        self._encode = NtvJsonEncoder().encode
+        if format == "cbor":
+            cbor2 = NtvUtil.lazy_import("cbor2")
+            self._encoder = cbor2.CBOREncoder(
+                io.BytesIO(),
+                datetime_as_timestamp=True,
+                timezone=datetime.timezone.utc,
+                canonical=False,
+                date_as_datetime=True,
+            )
+
+    def start(self, is_dict, length):
+        """open a container (json-object if is_dict else json-array) of `length`
+        values"""
+        if self._encoder:
+            self._encoder.encode_length(5 if is_dict else 4, length)
+        else:
+            self._next()
+            self._chunks.append("{" if is_dict else "[")
+        self._stack.append([is_dict, 0])
+
+    def key(self, name):
+        """write the name of the next value of a json-object"""
+        if self._encoder:
+            self._encoder.encode(name)
+            return
+        if self._stack[-1][1]:
+            self._chunks.append(", ")
+        self._stack[-1][1] += 1
+        self._chunks.append(json.dumps(name) + ": ")
+
+    def leaf(self, value):
+        """write a json value"""
+        if self._encoder:
+            self._encoder.encode(value)
+            self._write()
+            return
+        self._next()
+        self._chunks.append(self._encode(value))
+        self._write()
+
+    def end(self):
+        """close the last container opened"""
+        is_dict = self._stack.pop()[0]
+        if not self._encoder:
+            self._chunks.append("}" if is_dict else "]")
+
+    def flush(self):
+        """write the data not yet written"""
+        self._write(True)
+
+    def _next(self):
+        """add the separator before a value of a json-array"""
+        if self._stack and not self._stack[-1][0]:
+            if self._stack[-1][1]:
+                self._chunks.append(", ")
+            self._stack[-1][1] += 1
+
+    def _write(self, force=False):
+        """write the chunks (or the cbor buffer) if they are large enough"""
+        if self._encoder:
+            buffer = self._encoder.fp
+            if force or buffer.tell() > self.BUFFER:
+                self.fp.write(buffer.getvalue())
+                buffer.seek(0)
+                buffer.truncate()
+        elif force or len(self._chunks) > self.CHUNK:
+            self.fp.write("".join(self._chunks))
+            self._chunks.clear()
+
+
+class NtvReader:
+    """The NtvReader class reads a json text by chunks from a file-like object
+    (used by the `Ntv.iter_file` method). The json containers are traversed
+    without being decoded and only the selected values are decoded.
+
+    *Attributes :*
+
+    - **fp** : file-like object - text object with a `read` method
+    - **_buf** : string - json text read and not yet consumed (from _pos)
+    - **_pos** : integer - position of the next character to read in _buf
+    - **_eof** : boolean - True if the end of fp is reached
+
+    *instance methods*
+    - `peek`
+    - `items`
+    - `read_value`
+    - `skip_value`
+    """
+
+    CHUNK = 65536
+    _decoder = json.JSONDecoder()
+    _space = re.compile(r"[ \t\n\r]*")
+    _token = re.compile(r'[\[\]{}"]')
+    _string = re.compile(r'(?:[^"\\]|\\.)*"', re.S)
+
+    def __init__(self, fp):
+        """NtvReader constructor.
+
+        *Parameters*
+
+        - **fp** : file-like object with a `read` method (json text)
+        """
+        self.fp = fp
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+
+    def peek(self):
+        """return the next significant character ('' at the end of the text)"""
+        while True:
+            self._pos = self._space.match(self._buf, self._pos).end()
+            if self._pos < len(self._buf) or not self._fill():
+                return self._buf[self._pos : self._pos + 1]
+
+    def items(self):
+        """iterator on the values of the next json container (key for a
+        json-object, index for a json-array). The value has to be consumed
+        (`read_value`, `skip_value` or `items`) before the next iteration."""
+        is_dict = self._consume("{[") == "{"
+        idx = 0
+        while self.peek() not in "]}":
+            if idx:
+                self._consume(",")
+            if is_dict:
+                key = self.read_value()
+                self._consume(":")
+                yield key
+            else:
+                yield idx
+            idx += 1
+        self._consume("}" if is_dict else "]")
+
+    def read_value(self):
+        """return the next json value (decoded)"""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError as exc:
+                if not self._fill(len(self._buf) - self._pos):
+                    raise NtvError("the json text is not valid") from exc
+                continue
+            # a number can continue in the next chunk
+            if (
+                end < len(self._buf) and self._buf[end] not in "0123456789.eE+-"
+            ) or not self._fill():
+                self._pos = end
+                return value
+
+    def skip_value(self):
+        """go to the end of the next json value (the value is not decoded)"""
+        if self.peek() not in "[{":
+            self.read_value()
+            return
+        depth = 0
+        while True:
+            token = self._token.search(self._buf, self._pos)
+            if not token:
+                self._pos = len(self._buf)
+                if not self._fill():
+                    raise NtvError("the json text is not valid")
+                continue
+            self._pos = token.end()
+            if token.group() == '"':
+                while not (string := self._string.match(self._buf, self._pos)):
+                    if not self._fill():
+                        raise NtvError("the json text is not valid")
+                self._pos = string.end()
+                continue
+            depth += 1 if token.group() in "[{" else -1
+            if not depth:
+                return
+
+    def _consume(self, chars):
+        """consume the next character if it is in chars and return it"""
+        char = self.peek()
+        if not char or char not in chars:
+            raise NtvError("the json text is not valid (" + chars + " is expected)")
+        self._pos += 1
+        return char
+
+    def _fill(self, size=0):
+        """read at least a chunk (or size characters) and return False at the
+        end of the text"""
+        if self._eof:
+            return False
+        data = self.fp.read(max(size, self.CHUNK))
+        if not data:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos :] + data
+        self._pos = 0
+        return True
+
+
 class NtvJsonEncoder(json.JSONEncoder):
     """json encoder for Ntv data"""
 
@@ -690,5 +1199,143 @@ class NtvJsonEncoder(json.JSONEncoder):
         return json.JSONEncoder.default(self, o)
 
 
+class NtvJson:
+    """The NtvJson class defines the backend used to encode and decode the JSON
+    text of NTV entities (`Ntv.obj`, `Ntv.to_obj` with encoded option).
+
+    *class variables :*
+    - **BACKENDS** : tuple of the available backends ('json' is the standard
+    library)
+    - **backend** : name of the active backend (default 'json')
+    - **error** : exception (or tuple of exceptions) raised by `loads` if the
+    text is not valid
+    - **dumps** : function (json value -> JSON text) of the active backend
+    - **loads** : function (JSON text -> json value) of the active backend
+
+    *static methods :*
+    - `default`
+    - `non_finite`
+
+    *class methods :*
+    - `set_backend`
+    """
+
+    BACKENDS = ("json", "orjson", "ujson")
+    backend = "json"
+    error = json.JSONDecodeError
+    dumps = staticmethod(NtvJsonEncoder().encode)
+    loads = staticmethod(json.loads)
+
+    @staticmethod
+    def default(value):
+        """return the json value of a non JSON value (hook used by the backends)"""
+        try:
+            return NtvConnector.cast(value)[0]
+        except NtvError as exc:
+            raise TypeError(
+                "Object of type "
+                + value.__class__.__name__
+                + " is not JSON serializable"
+            ) from exc
+
+    @staticmethod
+    def non_finite(value):
+        """return True if the json value includes a NaN or infinite float"""
+        values = [value]
+        while values:
+            val = values.pop()
+            if val.__class__ is float:
+                if not math.isfinite(val):
+                    return True
+            elif isinstance(val, (list, tuple)):
+                values += val
+            elif isinstance(val, dict):
+                values += val.values()
+        return False
+
+    @classmethod
+    def set_backend(cls, name="json"):
+        """define the JSON backend and return the name of the active backend.
+
+        The standard library is used if the package is not installed. The
+        JSON text produced by 'orjson' or 'ujson' is compact and not escaped
+        (ascii). The values rejected or changed by these backends (e.g. int > 64
+        bits, NaN and Infinity floats) are encoded and decoded with the
+        standard library.
+
+        *Parameters*
+
+        - **name** : string (default 'json') - 'json', 'orjson', 'ujson' or
+        'auto' (the first installed backend in 'orjson', 'ujson', 'json')
+        """
+        if name not in cls.BACKENDS + ("auto",):
+            raise NtvError("the json backend is not valid : " + str(name))
+        names = ("orjson", "ujson") if name == "auto" else (name,)
+        for module_name in names:
+            if module_name == "json":
+                break
+            try:
+                module = importlib.import_module(module_name)
+            except ModuleNotFoundError:
+                continue
+            cls._set_module(module_name, module)
+            return cls.backend
+        cls.backend = "json"
+        cls.error = json.JSONDecodeError
+        cls.dumps = staticmethod(NtvJsonEncoder().encode)
+        cls.loads = staticmethod(json.loads)
+        return cls.backend
+
+    @classmethod
+    def _set_module(cls, name, module):
+        """define the functions of the 'orjson' or 'ujson' backend"""
+        std_dumps = NtvJsonEncoder().encode
+        default = NtvJson.default
+        if name == "orjson":
+            option = module.OPT_PASSTHROUGH_DATETIME
+
+            def dumps(value):
+                try:
+                    text = module.dumps(value, default=default, option=option).decode()
+                except TypeError:
+                    return std_dumps(value)
+                # orjson encodes NaN and Infinity as null
+                if "null" in text and NtvJson.non_finite(value):
+                    return std_dumps(value)
+                return text
+
+        else:
+
+            def dumps(value):
+                try:
+                    return module.dumps(value, ensure_ascii=False, default=default)
+                except (TypeError, OverflowError):
+                    return std_dumps(value)
+
+        def loads(text):
+            try:
+                return module.loads(text)
+            except module.JSONDecodeError:
+                if isinstance(text, str) and ("NaN" in text or "Infinity" in text):
+                    return json.loads(text)
+                raise
+
+        cls.backend = name
+        cls.error = (module.JSONDecodeError, json.JSONDecodeError)
+        cls.dumps = staticmethod(dumps)
+        cls.loads = staticmethod(loads)
+
+
+def set_json_backend(name="json"):
+    """define the JSON backend used by NTV entities and return the name of the
+    active backend (see `NtvJson.set_backend`)
+
+    *Parameters*
+
+    - **name** : string (default 'json') - 'json', 'orjson', 'ujson' or 'auto'
+    """
+    return NtvJson.set_backend(name)
+
+
 class NtvError(Exception):
     """NTV Exception"""
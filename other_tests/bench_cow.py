@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the copies and of the conversions (`no_type`, `only_value`,
+`to_json_ntv`...) with and without the copy-on-write mode
+(`set_copy_on_write`).
+
+usage: python bench_cow.py [number of records] [repeat]
+"""
+
+import copy
+
+from json_ntv import Ntv, NtvOp, NtvTree, set_copy_on_write
+
+from bench_util import arguments, best
+
+
+def payload(length):
+    """return a json value with 'length' records"""
+    return {
+        "records": [
+            {"id": i, "name": "n" + str(i), "values": [i + 0.5, i + 1.5]}
+            for i in range(length)
+        ],
+        "meta": {"count": length, "date:date": "2021-01-01"},
+    }
+
+
+OPERATIONS = {
+    "copy": copy.copy,
+    "no_type": lambda ntv: ntv.no_type(),
+    "to_json_ntv": lambda ntv: ntv.to_json_ntv(),
+    "to_obj_ntv": lambda ntv: ntv.to_obj_ntv(),
+    "only_value": lambda ntv: ntv.only_value(),
+    "NtvOp.exe": NtvOp({"op": "add", "path": "/0/1/-", "entity": 1}).exe,
+}
+
+if __name__ == "__main__":
+    LENGTH, REPEAT = arguments(20000, 3)
+    NTV = Ntv.obj(payload(LENGTH))
+    print(NtvTree(NTV).size, "nodes")
+    for name, func in OPERATIONS.items():
+        durations = []
+        for cow in (False, True):
+            set_copy_on_write(cow)
+            durations.append(best(func, NTV, repeat=REPEAT))
+        set_copy_on_write(False)
+        print(
+            "    ",
+            name.ljust(11),
+            ": full",
+            round(durations[0], 4),
+            "s, copy-on-write",
+            round(durations[1], 4),
+            "s",
+        )
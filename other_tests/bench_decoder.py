@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the JSON-NTV decoders: `Ntv.obj(engine='recursive')` versus
+`Ntv.obj(engine='iterative')` (with and without the `columnar` option).
+
+usage: python bench_decoder.py [depth] [width] [repeat]
+"""
+
+from json_ntv import Ntv, NtvTree
+
+from bench_util import arguments, best
+
+
+def nested(depth, width):
+    """return a json value with 'width' children per level and 'depth' levels"""
+    if depth == 0:
+        return list(range(width))
+    return {"k" + str(i): nested(depth - 1, width) for i in range(width)}
+
+
+def typed(length):
+    """return a json value with typed leaves"""
+    return {
+        "measure::float": list(range(length)),
+        "date::datetime": ["2021-01-01T10:00:00"] * length,
+        "loc::point": [[1.5, 2.5]] * length,
+    }
+
+
+def numeric(length):
+    """return a json value with int and float leaves"""
+    return {
+        "measure::int32": list(range(length)),
+        "value::float": [float(i) for i in range(length)],
+    }
+
+
+def bench(name, data, repeat, **kwargs):
+    """print the time per node for the two engines"""
+    size = NtvTree(Ntv.obj(data, **kwargs)).size
+    print(name, "-", size, "nodes", kwargs if kwargs else "")
+    for engine in ("recursive", "iterative"):
+        duration = best(Ntv.obj, data, repeat=repeat, engine=engine, **kwargs)
+        print(
+            "    ",
+            engine.ljust(10),
+            ":",
+            round(duration, 4),
+            "s, ",
+            round(duration / size * 1e6, 3),
+            "µs/node",
+        )
+
+
+if __name__ == "__main__":
+    DEPTH, WIDTH, REPEAT = arguments(4, 6, 5)
+    bench("nested", nested(DEPTH, WIDTH), REPEAT)
+    bench("nested", nested(DEPTH, WIDTH), REPEAT, fast=True)
+    bench("typed", typed(WIDTH**DEPTH), REPEAT)
+    bench("typed", typed(WIDTH**DEPTH), REPEAT, fast=True)
+    bench("typed", typed(WIDTH**DEPTH), REPEAT, columnar=True)
+    bench("numeric", numeric(WIDTH**DEPTH), REPEAT)
+    bench("numeric", numeric(WIDTH**DEPTH), REPEAT, columnar=True)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of `NtvPatch.diff` between two versions of a large Ntv entity
+(modified, inserted, removed and moved records): digest computation, diff
+and size of the patch versus the size of the entity.
+
+usage: python bench_diff.py [number of records] [number of changes] [seed]
+"""
+
+import random
+import time
+
+from json_ntv import Ntv, NtvPatch, NtvTree
+
+from bench_util import arguments, records
+
+
+def changes(data, number, seed):
+    """return a copy of data with 'number' changes"""
+    rnd = random.Random(seed)
+    records = [dict(rec) for rec in data["records"]]
+    for _ in range(number):
+        match rnd.randrange(4):
+            case 0:
+                records[rnd.randrange(len(records))]["name"] = "changed"
+            case 1:
+                records.insert(rnd.randrange(len(records)), {"id": -1, "ok": False})
+            case 2:
+                records.pop(rnd.randrange(len(records)))
+            case 3:
+                records.insert(
+                    rnd.randrange(len(records)),
+                    records.pop(rnd.randrange(len(records))),
+                )
+    return {"records": records}
+
+
+if __name__ == "__main__":
+    LENGTH, NUMBER, SEED = arguments(150000, 500, 0)
+    DATA = records(LENGTH)
+    NTV_A, NTV_B = Ntv.obj(DATA), Ntv.obj(changes(DATA, NUMBER, SEED))
+    print(NtvTree(NTV_A).size, "nodes,", NUMBER, "changes")
+    start = time.perf_counter()
+    DIGESTS = (NTV_A.digest, NTV_B.digest)
+    print("     digests (a and b) :", round(time.perf_counter() - start, 3), "s")
+    start = time.perf_counter()
+    PATCH = NtvPatch.diff(NTV_A, NTV_B)
+    print("     diff              :", round(time.perf_counter() - start, 3), "s")
+    print("    ", len(PATCH), "operations,", len(str(PATCH)), "chars in the patch")
+    print("    ", len(NTV_B.to_obj(encoded=True)), "chars in the entity")
@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the hash and the equality of Ntv entities (cached Merkle digest):
+first computation of the digest, hash and equality of unchanged entities,
+update after the modification of a leaf and deduplication in a set.
+
+usage: python bench_digest.py [number of records] [repeat]
+"""
+
+from json_ntv import Ntv
+
+from bench_util import arguments, best, records
+
+
+def cold(data, repeat):
+    """return the time of the first hash (digest computation)"""
+    return min(best(hash, Ntv.obj(data), repeat=1) for _ in range(repeat))
+
+
+if __name__ == "__main__":
+    LENGTH, REPEAT = arguments(20000, 5)
+    DATA = records(LENGTH)
+    NTV, OTHER = Ntv.obj(DATA), Ntv.obj(DATA)
+    assert NTV == OTHER and hash(NTV) == hash(OTHER)
+    LEAF = NTV[LENGTH // 2][0]
+    RECORDS = [Ntv.obj(rec) for rec in DATA["records"]] * 5
+    print(LENGTH, "records")
+    print("    ", "first hash".ljust(19), ":", round(cold(DATA, REPEAT) * 1e6, 2), "µs")
+    for name, func, number in (
+        ("hash (cached)", lambda: hash(NTV), 1000),
+        ("equality (cached)", lambda: NTV == OTHER, 1000),
+        ("set_value + hash", lambda: (LEAF.set_value(-1), hash(NTV)), 1000),
+        ("set of records (x5)", lambda: len(set(RECORDS)), 1),
+    ):
+        duration = best(func, repeat=REPEAT, number=number)
+        print("    ", name.ljust(19), ":", round(duration * 1e6, 2), "µs")
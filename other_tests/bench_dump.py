@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the export of a Ntv entity in a file: `to_obj(encoded=True)`
+versus the streaming writer `dump` (execution time and peak memory measured
+with tracemalloc).
+
+usage: python bench_dump.py [number of records] [repeat]
+"""
+
+import io
+import tracemalloc
+
+from json_ntv import Ntv
+
+from bench_util import arguments, best, records
+
+
+def to_obj(ntv, fmt, file):
+    """write the to_obj(encoded=True) value in file"""
+    file.write(ntv.to_obj(encoded=True, format=fmt))
+
+
+def dump(ntv, fmt, file):
+    """write the dump value in file"""
+    ntv.dump(file, format=fmt)
+
+
+def peak(func, ntv, fmt, file):
+    """return the peak memory used by func (the file size is excluded)"""
+    tracemalloc.start()
+    func(ntv, fmt, file)
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+class NullFile:
+    """file-like object without storage"""
+
+    def write(self, data):
+        """write nothing"""
+        return len(data)
+
+
+if __name__ == "__main__":
+    LENGTH, REPEAT = arguments(20000, 3)
+    NTV = Ntv.obj(records(LENGTH))
+    for FMT, FILE in (("json", io.StringIO), ("cbor", io.BytesIO)):
+        text, stream = FILE(), FILE()
+        to_obj(NTV, FMT, text)
+        dump(NTV, FMT, stream)
+        assert text.getvalue() == stream.getvalue()
+        print(FMT, "-", LENGTH, "records,", len(text.getvalue()), "chars/bytes")
+        for name, func in (("to_obj", to_obj), ("dump", dump)):
+            duration = best(func, NTV, FMT, NullFile(), repeat=REPEAT)
+            size = peak(func, NTV, FMT, NullFile())
+            print(
+                "    ",
+                name.ljust(6),
+                ":",
+                round(duration, 4),
+                "s, peak memory",
+                round(size / 1e6, 2),
+                "MB",
+            )
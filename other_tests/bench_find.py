@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the typed queries: `Ntv.find` (type index) versus a NtvTree
+traversal with a comparison of `type_str`, for several queries on the same
+entity.
+
+usage: python bench_find.py [number of records] [repeat]
+"""
+
+from json_ntv import Ntv, NtvTree
+
+from bench_util import arguments, best
+
+
+def payload(length):
+    """return a json value with 'length' records"""
+    return {
+        "records": [
+            {
+                "id": i,
+                "date:datetime": "2021-01-01T10:00:00",
+                "lon:fr.BAN.lon": 2.5,
+                "values::float": [i + 0.5, i + 1.5],
+            }
+            for i in range(length)
+        ]
+    }
+
+
+def scan(ntv):
+    """typed queries with a traversal for each query"""
+    return (
+        [node for node in NtvTree(ntv) if node.type_str == "datetime"],
+        [node for node in NtvTree(ntv) if node.type_str.startswith("fr.")],
+        [node for node in NtvTree(ntv) if node.type_str == "float"],
+    )
+
+
+def find(ntv):
+    """typed queries with the type index"""
+    return (
+        ntv.find(type="datetime"),
+        ntv.find(namespace="fr."),
+        ntv.find(type="float"),
+    )
+
+
+if __name__ == "__main__":
+    LENGTH, REPEAT = arguments(20000, 3)
+    NTV = Ntv.obj(payload(LENGTH))
+    assert scan(NTV) == find(NTV)
+    print(NtvTree(NTV).size, "nodes, 3 queries")
+    for name, func in (
+        ("scan", lambda: scan(NTV)),
+        ("find (index)", lambda: (NTV._invalidate(), find(NTV))),
+        ("find (cached)", lambda: find(NTV)),
+    ):
+        duration = best(func, repeat=REPEAT)
+        print("    ", name.ljust(13), ":", round(duration, 4), "s")
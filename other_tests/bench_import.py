@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the import time of json_ntv (`python -X importtime` report).
+
+The import is executed in new processes. The report gives the best total
+import time, the slowest modules loaded by json_ntv (cumulative time) and the
+modules imported by json_ntv that are not in the standard library (modules
+already loaded at the interpreter startup are excluded).
+
+usage: python bench_import.py [repeat] [number of modules]
+"""
+
+import subprocess
+import sys
+
+from bench_util import arguments
+
+CODE = "import sys; {} print(' '.join(sys.modules))"
+
+
+def import_time(imp="import json_ntv;"):
+    """return the import time of each module (µs) and the modules loaded"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CODE.format(imp)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self, cumulative, name = line[12:].split("|")
+        times[name.strip()] = int(cumulative)
+    return times, proc.stdout.split()
+
+
+def third_party(modules):
+    """return the top-level modules that are not in the standard library"""
+    tops = {mod.split(".", 1)[0] for mod in modules}
+    return sorted(
+        top
+        for top in tops
+        if top not in sys.stdlib_module_names
+        and not top.startswith("_")
+        and top not in ("json_ntv", "sitecustomize", "usercustomize")
+    )
+
+
+if __name__ == "__main__":
+    REPEAT, NUMBER = arguments(5, 15)
+    results = [import_time() for _ in range(REPEAT)]
+    best, modules = min(results, key=lambda res: res[0]["json_ntv"])
+    startup = set(import_time("")[1])
+    loaded = [mod for mod in modules if mod not in startup]
+    print("import json_ntv :", round(best["json_ntv"] / 1000, 2), "ms")
+    print("slowest modules (cumulative) :")
+    times = sorted(best.items(), key=lambda it: -it[1])
+    for name, duration in [it for it in times if it[0] in loaded][:NUMBER]:
+        print("    ", name.ljust(40), round(duration / 1000, 2), "ms")
+    print("third-party modules :", third_party(loaded) or "none")
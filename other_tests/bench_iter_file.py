@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the reading of a JSON-NTV file: `Ntv.obj` (json.load of the
+whole file) versus the incremental reader `Ntv.iter_file` (execution time and
+peak memory measured with tracemalloc).
+
+usage: python bench_iter_file.py [number of records]
+"""
+
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+
+from json_ntv import Ntv
+
+from bench_util import arguments, records
+
+
+def read_obj(path):
+    """return the number of records with Ntv.obj"""
+    with open(path, encoding="utf-8") as file:
+        return len(Ntv.obj(json.load(file)))
+
+
+def read_iter(path):
+    """return the number of records with Ntv.iter_file"""
+    return sum(1 for _ in Ntv.iter_file(path, "/records"))
+
+
+if __name__ == "__main__":
+    (LENGTH,) = arguments(50000)
+    with tempfile.TemporaryDirectory() as folder:
+        PATH = os.path.join(folder, "payload.json")
+        with open(PATH, "w", encoding="utf-8") as FILE:
+            json.dump(records(LENGTH), FILE)
+        print(LENGTH, "records,", round(os.path.getsize(PATH) / 1e6, 2), "MB")
+        for name, func in (("Ntv.obj", read_obj), ("iter_file", read_iter)):
+            start = time.perf_counter()
+            assert func(PATH) == LENGTH
+            duration = time.perf_counter() - start
+            tracemalloc.start()
+            func(PATH)
+            size = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                "    ",
+                name.ljust(9),
+                ":",
+                round(duration, 4),
+                "s, peak memory",
+                round(size / 1e6, 2),
+                "MB",
+            )
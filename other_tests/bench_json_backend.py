@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the JSON backends (`json_ntv.set_json_backend`): encoding and
+decoding of the JSON text (`NtvJson.dumps`, `NtvJson.loads`) and the
+associated Ntv methods (`to_obj(encoded=True)`, `Ntv.obj(text)`).
+
+usage: python bench_json_backend.py [number of records] [repeat]
+"""
+
+import json
+
+import json_ntv
+from json_ntv import Ntv, NtvJson
+
+from bench_util import arguments, best, records
+
+if __name__ == "__main__":
+    LENGTH, REPEAT = arguments(20000, 5)
+    DATA = records(LENGTH)
+    TEXT = json.dumps(DATA)
+    NTV = Ntv.obj(DATA)
+    print(LENGTH, "records,", len(TEXT), "chars")
+    for BACKEND in NtvJson.BACKENDS:
+        if json_ntv.set_json_backend(BACKEND) != BACKEND:
+            print("    ", BACKEND.ljust(6), ": not installed")
+            continue
+        assert json.loads(NTV.to_obj(encoded=True)) == NTV.to_obj()
+        assert Ntv.obj(TEXT) == NTV
+        print("    ", BACKEND)
+        for name, func, arg, kwargs in (
+            ("dumps", NtvJson.dumps, DATA, {}),
+            ("loads", NtvJson.loads, TEXT, {}),
+            ("to_obj", Ntv.to_obj, NTV, {"encoded": True}),
+            ("Ntv.obj", Ntv.obj, TEXT, {}),
+        ):
+            duration = best(func, arg, repeat=REPEAT, **kwargs)
+            print("        ", name.ljust(7), ":", round(duration, 4), "s")
+    json_ntv.set_json_backend("json")
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the lazy NtvList (`Ntv.obj(lazy=True)`) versus the eager decoding
+when a small part of a large payload is accessed (decoding, access to some
+records and `to_obj`).
+
+usage: python bench_lazy.py [number of records] [number of accesses] [repeat]
+"""
+
+import tracemalloc
+
+from json_ntv import Ntv
+
+from bench_util import arguments, best
+
+
+def payload(length):
+    """return a json value with 'length' records"""
+    return {
+        "records": [
+            {"id": i, "name": "n" + str(i), "values": [i, i + 1, i + 2], "ok": True}
+            for i in range(length)
+        ]
+    }
+
+
+def process(data, access, **kwargs):
+    """decode data, access to some records and return the json value"""
+    ntv = Ntv.obj(data, **kwargs)
+    step = max(1, len(data["records"]) // access)
+    for idx in range(0, len(data["records"]), step):
+        ntv[idx][2][0].set_value(-1)
+    return ntv.to_obj()
+
+
+if __name__ == "__main__":
+    LENGTH, ACCESS, REPEAT = arguments(20000, 500, 5)
+    DATA = payload(LENGTH)
+    assert process(DATA, ACCESS) == process(DATA, ACCESS, lazy=True)
+    print(LENGTH, "records,", ACCESS, "records accessed")
+    for name, kwargs in (("eager", {}), ("lazy", {"lazy": True})):
+        duration = best(process, DATA, ACCESS, repeat=REPEAT, **kwargs)
+        tracemalloc.start()
+        ntv = Ntv.obj(DATA, **kwargs)
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        print(
+            "    ",
+            name.ljust(6),
+            ":",
+            round(duration, 4),
+            "s, ",
+            round(size / 1e6, 2),
+            "MB after decoding",
+        )
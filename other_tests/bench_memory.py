@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the memory used by the NTV entities (bytes per leaf measured
+with tracemalloc).
+
+usage: python bench_memory.py [number of leaves]
+"""
+
+import sys
+import tracemalloc
+
+from json_ntv import Ntv, NtvList, NtvSingle
+
+from bench_util import arguments
+
+
+def measure(name, build, leaves):
+    """print the memory allocated by build() per leaf"""
+    tracemalloc.start()
+    start = tracemalloc.get_traced_memory()[0]
+    ntv = build()
+    size = tracemalloc.get_traced_memory()[0] - start
+    tracemalloc.stop()
+    print("    ", name.ljust(25), ":", round(size / leaves, 1), "bytes/leaf")
+    return ntv
+
+
+if __name__ == "__main__":
+    (LEAVES,) = arguments(100000)
+    values = list(range(LEAVES))
+    json_value = {"::int32": values}
+    named = {"k" + str(i): i for i in range(LEAVES)}
+    print(
+        "NtvSingle :",
+        sys.getsizeof(NtvSingle(1)),
+        "bytes per node, NtvList :",
+        sys.getsizeof(NtvList([])),
+        "bytes per node",
+        "(without __dict__)" if not hasattr(NtvSingle(1), "__dict__") else "",
+    )
+    print(LEAVES, "leaves")
+    measure("list of int", lambda: Ntv.obj(values), LEAVES)
+    measure("list of int (fast)", lambda: Ntv.obj(values, fast=True), LEAVES)
+    measure("list of int32", lambda: Ntv.obj(json_value), LEAVES)
+    measure(
+        "list of int32 (columnar)", lambda: Ntv.obj(json_value, columnar=True), LEAVES
+    )
+    measure("named values", lambda: Ntv.obj(named), LEAVES)
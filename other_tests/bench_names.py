@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the lookup by name in a NtvList (`ntv["name"]`, `NtvList.names`,
+`NtvList.json_names`): every field of every record is read by name.
+
+usage: python bench_names.py [number of records] [number of fields] [repeat]
+"""
+
+from json_ntv import Ntv
+
+from bench_util import arguments, best
+
+
+def payload(length, fields):
+    """return a json value with 'length' records of 'fields' fields"""
+    return [
+        {"f" + str(fld) + ":int": rec * fld for fld in range(fields)}
+        for rec in range(length)
+    ]
+
+
+def read(ntv, names):
+    """read each field of each record by name"""
+    return [[rec[name] for name in names] for rec in ntv]
+
+
+if __name__ == "__main__":
+    LENGTH, FIELDS, REPEAT = arguments(2000, 40, 3)
+    NTV = Ntv.obj(payload(LENGTH, FIELDS))
+    NAMES = ["f" + str(fld) for fld in range(FIELDS)]
+    JSON_NAMES = [name + ":int" for name in NAMES]
+    print(LENGTH, "records,", FIELDS, "fields")
+    for name, names in (("names", NAMES), ("json_names", JSON_NAMES)):
+        duration = best(read, NTV, names, repeat=REPEAT)
+        print("    ", name.ljust(10), ":", round(duration, 4), "s")
@@ -0,0 +1,44 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the pointer resolution: `ntv["#pointer"]` for each pointer and
+`Ntv.get_many` (one walk for all the pointers).
+
+usage: python bench_pointer.py [number of records] [repeat]
+"""
+
+from json_ntv import Ntv
+
+from bench_util import arguments, best
+
+
+def payload(length):
+    """return a json value with 'length' records"""
+    return {
+        "records": [
+            {"id": i, "name": "n" + str(i), "values::float": [i, i + 0.5], "ok": True}
+            for i in range(length)
+        ],
+        "count": length,
+    }
+
+
+if __name__ == "__main__":
+    LENGTH, REPEAT = arguments(5000, 3)
+    NTV = Ntv.obj(payload(LENGTH))
+    POINTERS = [
+        "#/records/" + str(i) + "/" + field
+        for i in range(LENGTH)
+        for field in ("id", "name", "values/1", "ok")
+    ]
+    assert NTV.get_many(POINTERS) == [NTV[pointer] for pointer in POINTERS]
+    print(LENGTH, "records,", len(POINTERS), "pointers")
+    for name, func in (
+        ("getitem", lambda: [NTV[pointer] for pointer in POINTERS]),
+        ("get_many", lambda: NTV.get_many(POINTERS)),
+    ):
+        duration = best(func, repeat=REPEAT)
+        print("    ", name.ljust(8), ":", round(duration, 4), "s")
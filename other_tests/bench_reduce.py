@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the preview of a large Ntv entity: `repr`, `reduce`, `to_repr`
+and `to_tuple` (only the previewed entities are read, the entity is not
+copied).
+
+usage: python bench_reduce.py [number of records] [repeat]
+"""
+
+import copy
+
+from json_ntv import Ntv, NtvTree
+
+from bench_util import arguments, best, records
+
+if __name__ == "__main__":
+    LENGTH, REPEAT = arguments(100000, 5)
+    DATA = records(LENGTH)
+    for NAME, KWARGS in (("eager", {}), ("lazy", {"lazy": True})):
+        NTV = Ntv.obj(DATA, **KWARGS)
+        print(NAME, "-", LENGTH, "records")
+        for name, func, kwargs in (
+            ("repr", repr, {}),
+            ("reduce", Ntv.reduce, {"maxi": 10, "level": 4}),
+            ("to_repr", Ntv.to_repr, {"maxi": 3}),
+            ("to_tuple", Ntv.to_tuple, {"maxi": 3}),
+            ("copy (previous reduce)", copy.copy, {}),
+        ):
+            duration = best(func, NTV, repeat=REPEAT, **kwargs)
+            print("    ", name.ljust(22), ":", round(duration * 1e3, 3), "ms")
+    print("    ", NtvTree(Ntv.obj(DATA)).size, "nodes")
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the path queries (`Ntv.select`) versus Python loops over
+`NtvTree`: recursive descent with a type predicate (with and without the type
+index) and child steps with a name predicate (name index).
+
+usage: python bench_select.py [number of records] [repeat]
+"""
+
+from json_ntv import Ntv, NtvTree
+
+from bench_util import arguments, best
+
+
+def payload(length):
+    """return a json value with 'length' records"""
+    return {
+        "records": [
+            {
+                "id": i,
+                "name": "n" + str(i),
+                "loc:point": [i + 0.5, 1.5],
+                "values::float": [i + 0.5, i + 1.5],
+            }
+            for i in range(length)
+        ],
+        "count": length,
+    }
+
+
+def loops(ntv):
+    """queries with loops over NtvTree"""
+    return (
+        [node for node in NtvTree(ntv) if node.type_str == "point"],
+        [child for rec in ntv["records"] for child in rec if child.ntv_name == "name"],
+    )
+
+
+def select(ntv):
+    """queries with Ntv.select"""
+    return (ntv.select("**/:point"), ntv.select("records/*/name"))
+
+
+if __name__ == "__main__":
+    LENGTH, REPEAT = arguments(20000, 3)
+    NTV = Ntv.obj(payload(LENGTH))
+    assert loops(NTV) == select(NTV)
+    print(NtvTree(NTV).size, "nodes, 2 queries")
+    for name, func in (
+        ("loops", lambda: loops(NTV)),
+        ("select", lambda: (NTV._invalidate(), select(NTV))),
+        ("select (index)", lambda: (NTV.index_by_type(), select(NTV))[1]),
+    ):
+        duration = best(func, repeat=REPEAT)
+        print("    ", name.ljust(14), ":", round(duration, 4), "s")
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the JSON-NTV serializers: `to_obj(engine='recursive')` versus
+`to_obj(engine='single')` (single pass, default engine).
+
+usage: python bench_serializer.py [depth] [width] [repeat]
+"""
+
+from json_ntv import Ntv, NtvTree
+
+from bench_util import arguments, best, records
+
+
+def nested(depth, width):
+    """return a json value with 'width' children per level and 'depth' levels"""
+    if depth == 0:
+        return list(range(width))
+    return {"k" + str(i): nested(depth - 1, width) for i in range(width)}
+
+
+def typed(length):
+    """return a json value with typed leaves"""
+    return {
+        "measure::float": list(range(length)),
+        "date::datetime": ["2021-01-01T10:00:00"] * length,
+        "loc::point": [[1.5, 2.5]] * length,
+        "dep::fr.": [{"dep": "75"}, {"reg": 11}] * (length // 2),
+    }
+
+
+def bench(name, data, repeat, **kwargs):
+    """print the time per node for the two engines"""
+    ntv = Ntv.obj(data)
+    size = NtvTree(ntv).size
+    print(name, "-", size, "nodes", kwargs if kwargs else "")
+    results = {}
+    for engine in ("recursive", "single"):
+        assert ntv.to_obj(**kwargs) == ntv.to_obj(engine=engine, **kwargs)
+        results[engine] = best(ntv.to_obj, repeat=repeat, engine=engine, **kwargs)
+        print(
+            "    ",
+            engine.ljust(10),
+            ":",
+            round(results[engine], 4),
+            "s, ",
+            round(results[engine] / size * 1e6, 3),
+            "µs/node",
+        )
+    print("     speedup    :", round(results["recursive"] / results["single"], 2))
+
+
+if __name__ == "__main__":
+    DEPTH, WIDTH, REPEAT = arguments(4, 6, 5)
+    bench("nested", nested(DEPTH, WIDTH), REPEAT)
+    bench("records", records(WIDTH**DEPTH), REPEAT)
+    bench("records", records(WIDTH**DEPTH), REPEAT, encoded=True)
+    bench("typed", typed(WIDTH**DEPTH), REPEAT)
+    bench("typed", typed(WIDTH**DEPTH), REPEAT, maxi=10)
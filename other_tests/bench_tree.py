@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+Benchmark of the NtvTree traversal (`NtvTree.walk`, `nodes`, `leaf_nodes`,
+`stats`), of the `pointer` of the leaf nodes and of the methods based on the
+traversal (`no_type`, `validate`, `to_json_ntv`).
+
+usage: python bench_tree.py [number of records] [repeat]
+"""
+
+from json_ntv import Ntv, NtvTree
+
+from bench_util import arguments, best
+
+
+def payload(length):
+    """return a json value with 'length' records"""
+    return {
+        "records": [
+            {
+                "id": i,
+                "name": "n" + str(i),
+                "values::float": [i + 0.25, i + 0.5],
+                "ok": True,
+            }
+            for i in range(length)
+        ]
+    }
+
+
+if __name__ == "__main__":
+    LENGTH, REPEAT = arguments(20000, 3)
+    NTV = Ntv.obj(payload(LENGTH))
+    print(NtvTree(NTV).size, "nodes")
+    for name, func in (
+        ("walk", lambda: sum(1 for _ in NtvTree(NTV).walk())),
+        ("nodes", lambda: NtvTree(NTV).nodes),
+        ("leaf_nodes", lambda: NtvTree(NTV).leaf_nodes),
+        ("stats", lambda: (NTV._invalidate(), NtvTree(NTV).stats())),
+        ("stats cache", lambda: NtvTree(NTV).stats()),
+        ("pointers", lambda: [leaf.pointer() for leaf in NtvTree(NTV).leaf_nodes]),
+        ("no_type", NTV.no_type),
+        ("validate", NTV.validate),
+        ("to_json_ntv", NTV.to_json_ntv),
+    ):
+        duration = best(func, repeat=REPEAT)
+        print("    ", name.ljust(11), ":", round(duration, 4), "s")
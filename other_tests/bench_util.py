@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""
+Created on Oct 18 2026
+
+@author: Philippe@loco-labs.io
+
+The `bench_util` module contains the functions shared by the benchmarks
+(`bench_*.py` scripts): command line arguments, test data and time measures.
+"""
+
+import sys
+import timeit
+
+
+def arguments(*defaults):
+    """return the integer arguments of the command line (the default values are
+    used for the missing arguments)"""
+    args = [int(arg) for arg in sys.argv[1 : len(defaults) + 1]]
+    return args + list(defaults[len(args) :])
+
+
+def records(length):
+    """return a json value with 'length' records"""
+    return {
+        "records": [
+            {"id": i, "name": "n" + str(i), "values::float": [i, i + 0.5], "ok": True}
+            for i in range(length)
+        ]
+    }
+
+
+def best(func, *args, repeat=3, number=1, **kwargs):
+    """return the best duration (seconds) of the call func(*args, **kwargs)
+
+    *Parameters*
+
+    - **func** : function to measure
+    - **args**, **kwargs** : parameters of the function
+    - **repeat** : integer (default 3) - number of measures
+    - **number** : integer (default 1) - number of calls per measure
+    """
+    durations = timeit.repeat(
+        lambda: func(*args, **kwargs), number=number, repeat=repeat
+    )
+    return min(durations) / number
@@ -29,7 +29,7 @@ setup(
     ],
     keywords="JSON-NTV, semantic JSON, development, environmental data",
     packages=find_packages(include=["json_ntv", "json_ntv.*"]),
-    package_data={"json_ntv": ["./config/*.ini"]},
+    package_data={"json_ntv": ["./config/*.ini", "./config/*.json"]},
     python_requires=">=3.7, <4",
     install_requires=["shapely", "cbor2", "tab_dataset"],
 )
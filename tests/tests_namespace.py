@@ -9,7 +9,20 @@ The `NTV.test_namespace` module contains the unit tests (class unittest) for the
 """
 
 import unittest
+import configparser
+import functools
+import json
+import tempfile
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import json_ntv
 from json_ntv.namespace import Namespace, DatatypeError, Datatype, _join_type
+from json_ntv.namespace import _crc, _local_config
+from json_ntv.ntv_validate import Validator
+from json_ntv.namespace_cache import NamespaceCache, NamespaceCacheError
+
 # from observation import  Ilist
 
 
@@ -85,6 +98,20 @@ class TestDatatype(unittest.TestCase):
         """tests Datatype"""
         self.assertEqual(Datatype(Datatype("datetime")), Datatype("datetime"))
 
+    def test_shared(self):
+        """tests Datatype"""
+        self.assertIs(Datatype("int32"), Datatype("int32"))
+        self.assertIs(Datatype("int32[kg]"), Datatype("int32[kg]"))
+        self.assertIsNot(Datatype("int32"), Datatype("int32[kg]"))
+        self.assertIs(Datatype("int32").typebase, Datatype("int32[kg]").typebase)
+        self.assertEqual(Datatype("int32[kg]").extension, "kg")
+        self.assertEqual(Datatype("$newtype[m]").long_name, "$newtype[m]")
+        self.assertIs(Datatype("$newtype[m]"), Datatype("$newtype[m]"))
+        with self.assertRaises(DatatypeError):
+            Datatype("unknowntype")
+        with self.assertRaises(DatatypeError):
+            Datatype("unknowntype")
+
     def test_add(self):
         """tests Datatype"""
         liststr = [
@@ -134,6 +161,26 @@ class TestDatatype(unittest.TestCase):
             with self.assertRaises(DatatypeError):
                 lon.isin_namespace(nsp)
 
+    def test_snapshot(self):
+        """tests Datatype"""
+        path = Path(json_ntv.__file__).parent / "config" / "NTV_global_namespace.ini"
+        snapshot = json.loads(path.with_suffix(".json").read_text(encoding="utf-8"))
+        self.assertEqual(snapshot["source"], _crc(path))
+        config = configparser.ConfigParser()
+        config.read(path)
+        self.assertEqual(snapshot["type"], json.loads(config["data"]["type"]))
+        self.assertEqual(_local_config(path.name), snapshot)
+        self.assertEqual(Namespace.add("").content["type"], snapshot["type"])
+
+    def test_lazy_root(self):
+        """tests Datatype"""
+        self.assertEqual(len(Datatype.types()), len(set(Datatype.types())))
+        for typ in Namespace.add("").content["type"]:
+            self.assertIn(typ, Datatype.types())
+        valid = Validator.__dict__["point_valid"]
+        self.assertIs(Datatype("point").validate, valid)
+        self.assertIs(Datatype("point[m]").validate, valid)
+
     def test_org(self):
         """tests Datatype"""
         liststr = ["org.House."]
@@ -167,5 +214,110 @@ class TestDatatype(unittest.TestCase):
         )
 
 
+class _CountHandler(SimpleHTTPRequestHandler):
+    """local file-server for the configuration files"""
+
+    statuses = []
+    error = None
+
+    def do_GET(self):
+        if self.error:
+            self.send_error(self.error)
+            return
+        super().do_GET()
+
+    def send_response(self, code, message=None):
+        self.statuses.append(code)
+        super().send_response(code, message)
+
+    def log_message(self, *args):
+        pass
+
+
+class TestNamespaceCache(unittest.TestCase):
+    """tests NamespaceCache class"""
+
+    @classmethod
+    def setUpClass(cls):
+        handler = functools.partial(
+            _CountHandler, directory=Path(json_ntv.__file__).parent / "config"
+        )
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+        cls.url = "http://127.0.0.1:" + str(cls.server.server_port) + "/"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.param = (
+            NamespaceCache.path,
+            NamespaceCache.ttl,
+            NamespaceCache.offline,
+            NamespaceCache.enabled,
+        )
+        self.tmp = tempfile.TemporaryDirectory()
+        NamespaceCache.configure(self.tmp.name, 3600, False, True)
+        _CountHandler.statuses.clear()
+        _CountHandler.error = None
+
+    def tearDown(self):
+        NamespaceCache.configure(*self.param)
+        self.tmp.cleanup()
+
+    def test_prewarm(self):
+        """tests NamespaceCache"""
+        root = self.url + "NTV_global_namespace.ini"
+        loaded = NamespaceCache.prewarm(["fr.BAN."], root)
+        self.assertEqual(set(loaded), {"", "fr.", "fr.BAN.", "fr.BAN.test."})
+        self.assertEqual(_CountHandler.statuses, [200] * 4)
+        NamespaceCache.configure(offline=True)
+        content = Namespace._content(loaded["fr.BAN."], "BAN.", False, False)
+        self.assertIn("lon", content["type"])
+        self.assertEqual(_CountHandler.statuses, [200] * 4)
+        with self.assertRaises(NamespaceCacheError):
+            NamespaceCache.get(self.url + "NTV_fr_IRVE_namespace.ini")
+
+    def test_get(self):
+        """tests NamespaceCache"""
+        url = self.url + "NTV_fr_namespace.ini"
+        text = (
+            Path(json_ntv.__file__).parent / "config" / "NTV_fr_namespace.ini"
+        ).read_text(encoding="utf-8")
+        self.assertEqual(NamespaceCache.get(url), text)
+        self.assertEqual(NamespaceCache.get(url), text)
+        self.assertEqual(_CountHandler.statuses, [200])
+        NamespaceCache.configure(ttl=0)
+        self.assertEqual(NamespaceCache.get(url), text)
+        self.assertEqual(_CountHandler.statuses, [200, 304])
+        with self.assertRaises(NamespaceCacheError):
+            NamespaceCache.get(self.url + "unknown.ini")
+        self.assertEqual(NamespaceCache.get(self.url + "unknown.ini", default=""), "")
+        NamespaceCache.configure(offline=True)
+        with self.assertRaises(NamespaceCacheError):
+            NamespaceCache.get(self.url + "unknown.ini")
+        NamespaceCache.clear()
+        with self.assertRaises(NamespaceCacheError):
+            NamespaceCache.get(url)
+
+    def test_get_error(self):
+        """tests NamespaceCache with an error status"""
+        url = self.url + "NTV_fr_namespace.ini"
+        text = NamespaceCache.get(url)
+        NamespaceCache.configure(ttl=0)
+        _CountHandler.error = 500
+        self.assertEqual(NamespaceCache.get(url), text)
+        self.assertEqual(_CountHandler.statuses, [200, 500])
+        with self.assertRaises(NamespaceCacheError):
+            NamespaceCache.get(self.url + "NTV_fr_BAN_namespace.ini")
+        NamespaceCache.configure(enabled=False)
+        with self.assertRaises(NamespaceCacheError):
+            NamespaceCache.get(url)
+        _CountHandler.error = None
+        self.assertEqual(NamespaceCache.get(url), text)
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
@@ -9,13 +9,26 @@ The `NTV.test_ntv` module contains the unit tests (class unittest) for the
 """
 
 import unittest
+import copy
 import datetime
+import io
 from itertools import product
 import json
-
-from json_ntv import NtvSingle, NtvList, Ntv, NtvError, NtvComment
-from json_ntv.ntv_util import NtvUtil
+import math
+import os
+import pickle
+import subprocess
+import sys
+import tempfile
+
+from json_ntv import NtvSingle, NtvList, Ntv, NtvError, NtvComment, NtvColumn, NtvLazy
+from json_ntv import NtvShared, set_copy_on_write
+from json_ntv.ntv_util import NtvUtil, NtvReader
 from json_ntv import agreg_type, NtvTree, NtvConnector, NtvOp, NtvPatch, Datatype
+from json_ntv.ntv_patch import NtvOpError, NtvPointer
+from json_ntv import NtvJson, NtvSelector, set_json_backend
+from json_ntv import relative_type, str_type
+from json_ntv.namespace import DatatypeError, TypeBase, type_cache_info
 from shapely import geometry
 from jsonpointer import resolve_pointer
 
@@ -382,6 +395,281 @@ class TestNtvCreation(unittest.TestCase):
         self.assertEqual(Ntv.obj({"::": {":json": 2}}).to_obj(), [2])
         self.assertEqual(Ntv.obj({"::": {":": 2}}).to_obj(), [2])
 
+    def test_is_json(self):
+        data = [
+            {"a": [1, [2, 3, {"b": [4, None]}], [{"c": 5}, 6]], "b": "ert"},
+            {"a:": [1, {"b": [2, 3]}], "c::": [], "d": {}},
+            {"dat:datetime": "2021-01-01T10:00:00", "lis::date": ["2021-01-01"]},
+            [datetime.date(2021, 1, 1), [datetime.time(10, 0), "a"]],
+        ]
+        for dat in data:
+            for fast in (True, False):
+                for node in NtvTree(Ntv.obj(dat, fast=fast)):
+                    self.assertEqual(node.is_json, NtvConnector.is_json(node.ntv_value))
+
+    def test_slots(self):
+        ntv = Ntv.obj({"a": [1, {"b::point": [1, 2]}], "c:fr.BAN.lon": 3})
+        for node in NtvTree(ntv):
+            self.assertFalse(hasattr(node, "__dict__"))
+        for ntv_copy in (copy.deepcopy(ntv), pickle.loads(pickle.dumps(ntv))):
+            self.assertEqual(ntv_copy, ntv)
+            self.assertEqual(ntv_copy.to_obj(), ntv.to_obj())
+            self.assertIs(ntv_copy[0].parent, ntv_copy)
+            self.assertIs(ntv_copy[1].ntv_type, ntv[1].ntv_type)
+
+    def test_columnar(self):
+        data = [
+            {"::int32": [1, 2, 3]},
+            [1, 2, 3],
+            {"a": [1.5, 2.5], "b::float": [1.0, 2.0], "c": [1, True], "d": [1, "a"]},
+            {"x::fr.": [1, 2]},
+            {"p::point": [1, 2], "l::point": [[1, 2], [3, 4]]},
+            [2**70, 1],
+            {"a::": [1, 2], "b:": [1, 2], "c::int32": [1]},
+        ]
+        options = [{}, {"type": True}, {"simpleval": True}, {"maxi": 2}]
+        for dat, engine, typ_auto in product(
+            data, ("recursive", "iterative"), (False, True)
+        ):
+            ntv = Ntv.obj(dat, engine=engine, typ_auto=typ_auto)
+            col = Ntv.obj(dat, engine=engine, typ_auto=typ_auto, columnar=True)
+            self.assertEqual(ntv, col)
+            self.assertEqual(repr(ntv), repr(col))
+            for option in options:
+                self.assertEqual(ntv.to_obj(**option), col.to_obj(**option))
+            self.assertEqual(
+                [(node.to_obj(), node.pointer()) for node in NtvTree(ntv)],
+                [(node.to_obj(), node.pointer()) for node in NtvTree(col)],
+            )
+        col = Ntv.obj({"::int32": [1, 2, 3, 4]}, columnar=True)
+        self.assertIsInstance(col.ntv_value, NtvColumn)
+        self.assertEqual(col.ntv_value.nodes, {})
+        self.assertEqual(col.to_obj(), {"::int32": [1, 2, 3, 4]})
+        self.assertEqual(col.ntv_value.nodes, {})
+        self.assertIs(col[1], col[1])
+        self.assertIs(col[1].parent, col)
+        results = []
+        for ntv in (Ntv.obj({"::int32": [1, 2, 3, 4]}), col):
+            ntv[1].set_value(5)
+            ntv.append(Ntv.obj({":float": 2.5}))
+            del ntv[0]
+            ntv.insert(0, Ntv.obj(9))
+            ntv[2].remove()
+            ntv[0].set_name("n")
+            ntv[1] = Ntv.obj(7)
+            ntv_copy = copy.copy(ntv)
+            self.assertEqual(ntv_copy, ntv)
+            self.assertIs(ntv_copy[0].parent, ntv_copy)
+            results.append(
+                (ntv.to_obj(), ntv[2].pointer(), ntv.ntv_value.index(ntv[2]))
+            )
+        self.assertEqual(results[0], results[1])
+
+    def test_lazy(self):
+        data = [
+            [1, 2, 3],
+            [None, True, 1.5, "s", [], {}, {"x": None}],
+            {"a": 1, "b": "x", "c": None, "e": {"f": [1, {"g:date": "2021-01-01"}]}},
+            {"l::point": [[1, 2], [3, 4]], "d::datetime": ["2021-01-01T10:00:00"]},
+            {"a::int32": {"b": 1, "c:float": 2}, "d::": [1, 2], "e:": [1, 2]},
+            [{"a": 1}, {"a": 2}, [1, [2, [3]]]],
+        ]
+        options = [{}, {"type": True}, {"simpleval": True}, {"maxi": 2}]
+        options += [{"format": "tuple"}, {"format": "obj"}, {"fast": True}]
+        for dat, engine, columnar in product(
+            data, ("recursive", "iterative"), (False, True)
+        ):
+            ntv = Ntv.obj(dat, engine=engine, columnar=columnar)
+            for option in options:
+                lazy = Ntv.obj(dat, engine=engine, columnar=columnar, lazy=True)
+                self.assertEqual(ntv.to_obj(**option), lazy.to_obj(**option))
+                self.assertEqual(lazy.ntv_value.nodes, {})
+            self.assertEqual(repr(ntv), repr(lazy))
+            self.assertEqual(
+                [(node.to_obj(), node.pointer()) for node in NtvTree(ntv)],
+                [(node.to_obj(), node.pointer()) for node in NtvTree(lazy)],
+            )
+            self.assertEqual(ntv, lazy)
+        lazy = Ntv.obj({"a": 1, "b": [1, 2, {"c": [3]}]}, lazy=True)
+        self.assertIsInstance(lazy.ntv_value, NtvLazy)
+        self.assertIs(lazy[1], lazy[1])
+        self.assertEqual(list(lazy.ntv_value.nodes), [1])
+        self.assertIs(lazy[1][2].parent, lazy[1])
+        self.assertEqual(list(lazy[1].ntv_value.nodes), [2])
+        lazy[1][2][0].set_value(4)
+        self.assertEqual(lazy.to_obj(), {"a": 1, "b": [1, 2, {"c": [4]}]})
+        results = []
+        for ntv in (Ntv.obj({"a": 1, "b": [1, 2, {"c": [4]}]}), lazy):
+            ntv.append(Ntv.obj({"d": 2.5}))
+            del ntv[0]
+            ntv.insert(0, Ntv.obj({"e": 9}))
+            ntv[2].remove()
+            ntv[0].set_name("n")
+            ntv[1][0] = Ntv.obj(7)
+            ntv_copy = copy.copy(ntv)
+            self.assertEqual(ntv_copy, ntv)
+            self.assertIs(ntv_copy[0].parent, ntv_copy)
+            results.append(
+                (ntv.to_obj(), ntv[1][2].pointer(), ntv.ntv_value.index(ntv[1]))
+            )
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(results[1][0], {"n": 9, "b": [7, 2, {"c": [4]}]})
+
+    def test_copy_on_write(self):
+        self.addCleanup(set_copy_on_write, False)
+        data = {
+            "a": [1, {"b::int32": [2, 3]}, {"c": {"d:date": "2021-01-01"}}],
+            "e:point": [1, 2],
+            "f": {"g": None, "h::int32": [1, 2]},
+            "i": [1, 2, 3],
+        }
+        methods = ["no_type", "no_name", "no_value", "only_type", "only_name"]
+        methods += ["only_value", "to_json_ntv", "to_obj_ntv"]
+        results = []
+        for cow in (False, True):
+            self.assertFalse(set_copy_on_write(cow))
+            ntv = Ntv.obj(data)
+            res = [getattr(ntv, method)() for method in methods]
+            res.append(NtvOp({"op": "add", "path": "/0/1/0", "entity": 5}).exe(ntv))
+            res.append(copy.copy(ntv).no_name().no_type())
+            self.assertEqual(ntv.to_obj(), data)
+            results.append([(ntv.to_obj(), ntv.digest) for ntv in res])
+        self.assertEqual(results[0], results[1])
+        ntv = Ntv.obj(data)
+        ntv_copy = copy.copy(ntv)
+        self.assertIsInstance(ntv_copy.ntv_value, NtvShared)
+        self.assertIs(ntv_copy.ntv_value.values[2], ntv[2])
+        self.assertEqual(ntv_copy, ntv)
+        self.assertEqual(ntv_copy.ntv_value.nodes, {})
+        ntv_copy["a"][2][0].set_value("2022-01-01")
+        self.assertEqual(list(ntv_copy.ntv_value.nodes), [0])
+        self.assertIs(ntv_copy.ntv_value.values[1], ntv[1])
+        self.assertIs(ntv_copy[0][1].parent, ntv_copy[0])
+        self.assertEqual(ntv_copy[0][2][0].pointer(), ntv[0][2][0].pointer())
+        self.assertEqual(ntv.to_obj(), data)
+        self.assertEqual(ntv_copy.to_obj()["a"][2], {"c": {"d:date": "2022-01-01"}})
+        only = ntv.only_value()
+        self.assertIs(only[3].ntv_value.values[1], ntv[3][1])
+        set_copy_on_write(False)
+        ntv_full = copy.copy(ntv_copy)
+        self.assertIsNot(ntv_full.ntv_value.values[1], ntv[1])
+        self.assertEqual(ntv_full, ntv_copy)
+        set_copy_on_write(True)
+        ntv = Ntv.obj(data)
+        ntv_copy = copy.copy(ntv)
+        ntv_copy2 = copy.copy(ntv_copy)
+        only = ntv.only_value()
+        ntv_op = NtvOp({"op": "add", "path": "/0/1/0", "entity": 5}).exe(ntv)
+        res = [(cop.to_obj(), cop.digest) for cop in (ntv_copy, only, ntv_op)]
+        self.assertEqual(ntv_copy, Ntv.obj(data))
+        ntv["e"].set_type("json")
+        ntv["e"].set_value(3)
+        ntv["a"][1][0].set_value(5)
+        ntv["a"][2].set_name("z", nodes="all")
+        ntv["f"].append(Ntv.obj(4))
+        del ntv["i"][0]
+        ntv["a"][0].remove()
+        self.assertEqual(ntv_copy.to_obj(), data)
+        self.assertEqual(ntv_copy2.to_obj(), data)
+        self.assertEqual(ntv_copy, Ntv.obj(data))
+        self.assertEqual(
+            [(cop.to_obj(), cop.digest) for cop in (ntv_copy, only, ntv_op)], res
+        )
+        ntv_copy["a"][1].set_name("y")
+        ntv_op["a"][1][0].set_value(6)
+        self.assertEqual(ntv_copy2.to_obj(), data)
+        self.assertEqual(
+            ntv.to_obj()["a"], {"b::int32": [5, 3], "z": {"z:date": "2021-01-01"}}
+        )
+        ntv_copy = copy.copy(Ntv.obj(data))
+        ntv_copy_f = ntv_copy["f"]
+        ntv_copy2 = copy.copy(ntv_copy)
+        ntv_copy_f[0] = Ntv.obj({"x": 9})
+        del ntv_copy_f[1]
+        self.assertEqual(ntv_copy2.to_obj(), data)
+        self.assertEqual(ntv_copy.to_obj()["f"], {"x": 9})
+        ntv_copy = copy.copy(Ntv.obj(data))
+        self.assertEqual(NtvTree(ntv_copy).size, NtvTree(Ntv.obj(data)).size)
+        self.assertEqual(len(list(NtvTree(ntv_copy).walk())), 18)
+        self.assertEqual(NtvTree(ntv_copy).stats(), NtvTree(Ntv.obj(data)).stats())
+        self.assertEqual(ntv_copy.select("**/d")[0].to_obj(), {"d:date": "2021-01-01"})
+        ntv_copy.to_obj_ntv()
+        self.assertEqual(ntv_copy.ntv_value.nodes, {})
+        self.assertEqual(len(list(NtvTree(ntv_copy, keep=True).walk())), 18)
+        self.assertEqual(list(ntv_copy.ntv_value.nodes), [0, 1, 2, 3])
+
+    def test_iter_file(self):
+        data = {
+            "records": [{"a": 1, "b": 'x"]}'}, [1, 2.5e3, -1], {"c::int32": [1]}],
+            "typed::int32": {"b": [1, 2], "c": {"d": 3}, "e::": [4, "5"]},
+            "geo::point": [[1, 2], [3, 4]],
+            "x::fr.": {"dep": [75, 92], "reg": {"r": 11}},
+            "l:": [1, 2],
+            "a/b~": [[1, [2, 3]], {"c": 4, "d": 5}],
+        }
+        pointers = {
+            "": Ntv.obj(data),
+            "/records": Ntv.obj(data)["records"],
+            "/typed::int32": Ntv.obj(data)["typed"],
+            "/typed::int32/e::": Ntv.obj(data)["typed"]["e"],
+            "/geo::point": Ntv.obj(data)["geo"],
+            "/x::fr.": Ntv.obj(data)["x"],
+            "/a~1b~0/0/1": Ntv.obj(data)[5][0][1],
+            "/a~1b~0/1": Ntv.obj(data)[5][1],
+        }
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "data.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(data, file, indent=1)
+            chunk, NtvReader.CHUNK = NtvReader.CHUNK, 7
+            for pointer, ntv in pointers.items():
+                self.assertEqual(list(Ntv.iter_file(path, pointer)), list(ntv))
+                for ntv_file, ntv_obj in zip(
+                    Ntv.iter_file(path, pointer, lazy=True), ntv
+                ):
+                    self.assertEqual(ntv_file.to_obj(), ntv_obj.to_obj())
+            for pointer in ("/l:", "/x::fr./reg", "/records/0/a", "/unknown", "a"):
+                with self.assertRaises(NtvError):
+                    list(Ntv.iter_file(path, pointer))
+            NtvReader.CHUNK = chunk
+
+    def test_engine(self):
+        data = [
+            1,
+            [],
+            {},
+            {"a": [1, [2, 3, {"b": [4, None]}], [{"c": 5}, 6]], "b": "ert"},
+            {"a:": [1, {"b": [2, 3]}], "c::": [], "d": {}},
+            {"::int32": [1, 2, {"a": 3}, {":float": 4}]},
+            {"test::point": [[1, 2], {"b:line": [[1, 2], [3, 4]]}]},
+            {"dat:datetime": "2021-01-01T10:00:00", "lis::date": ["2021-01-01"]},
+            [datetime.date(2021, 1, 1), [datetime.time(10, 0), "a"]],
+            [{"a": 1}, {"a": 2}, [{":": [1, 2]}]],
+            {"::": {"a": 2}},
+        ]
+        for dat, fast, typ_auto, no_typ in product(data, *[(True, False)] * 3):
+            opt = {"fast": fast, "typ_auto": typ_auto, "no_typ": no_typ}
+            ntv = Ntv.obj(dat, **opt)
+            ntv_iter = Ntv.obj(dat, engine="iterative", **opt)
+            self.assertEqual(ntv, ntv_iter)
+            self.assertEqual(ntv.to_repr(), ntv_iter.to_repr())
+            self.assertEqual(ntv.to_obj(), ntv_iter.to_obj())
+            for node in NtvTree(ntv_iter):
+                self.assertTrue(node is ntv_iter or node in node.parent)
+        with self.assertRaises(NtvError):
+            Ntv.obj(1, engine="other")
+
+    def test_engine_depth(self):
+        data = leaf = [1]
+        for _ in range(5000):
+            data = {"a": [data, 2]}
+        ntv = Ntv.obj(data, engine="iterative")
+        depth = 0
+        while isinstance(ntv, NtvList):
+            ntv, depth = ntv[0], depth + 1
+        self.assertEqual(ntv.val, leaf[0])
+        self.assertEqual(depth, 5001)
+
     def test_separator(self):
         sings = [
             {"test::string:int32": [2, 21]},
@@ -572,6 +860,71 @@ class TestNtvCreation(unittest.TestCase):
             Ntv.obj({"paris:point": "null"}).to_obj(format="obj"), {"paris:point": None}
         )
 
+    def test_dump(self):
+        data = [
+            1,
+            [],
+            {},
+            [{"a": 1}],
+            [[{"a": 1}]],
+            [{"a": 1}, {"a": 2}, {"b": 3}],
+            {"a": [1, [2, 3, {"b": [4, None]}], [{"c": 5}, 6]], "b": "ert"},
+            {"a:": [1, {"b": [2, 3]}], "c::": [], "d": {}, "": [1]},
+            {"::int32": [1, 2, {"a": 3}, {":float": 4}]},
+            {"a::int32": {"b": 1, "c:float": 2}, ":json": {"a": 1}},
+            {"test::point": [[1, 2], {"b:line": [[1, 2], [3, 4]]}]},
+            {"dat:datetime": "2021-01-01T10:00:00", "lis::date": ["2021-01-01"]},
+            [datetime.date(2021, 1, 1), [datetime.time(10, 0), "a"]],
+        ]
+        options = [{}, {"type": True}, {"simpleval": True}, {"maxi": 2}]
+        options += [{"json_array": True}, {"name": False}, {"maxi": 1}]
+        for dat, option, lazy in product(data, options, (False, True)):
+            ntv = Ntv.obj(dat, lazy=lazy)
+            text = io.StringIO()
+            ntv.dump(text, **option)
+            self.assertEqual(text.getvalue(), ntv.to_obj(encoded=True, **option))
+            binary = io.BytesIO()
+            ntv.dump(binary, format="cbor", **option)
+            self.assertEqual(
+                binary.getvalue(), ntv.to_obj(encoded=True, format="cbor", **option)
+            )
+        with self.assertRaises(NtvError):
+            Ntv.obj(1).dump(io.StringIO(), format="obj")
+
+    def test_serializer(self):
+        data = [
+            1,
+            [],
+            {},
+            [{"a": 1}],
+            [[{"a": 1}]],
+            {"a": {"b": 1}},
+            [{"a": 1}, {"a": 2}, {"b": 3}],
+            {"a": [1, [2, 3, {"b": [4, None]}], [{"c": 5}, 6]], "b": "ert"},
+            {"a:": [1, {"b": [2, 3]}], "c::": [], "d": {}, "": [1]},
+            {"::int32": [1, 2, {"a": 3}, {":float": 4}]},
+            {"a::int32": {"b": 1, "c:float": 2}, ":json": {"a": 1}},
+            {"test::point": [[1, 2], {"b:line": [[1, 2], [3, 4]]}]},
+            {"dat:datetime": "2021-01-01T10:00:00", "lis::date": ["2021-01-01"]},
+            {"::fr.": [{"dep": "75"}, {"reg": 11}], "a:fr.dep": "75"},
+            [datetime.date(2021, 1, 1), [datetime.time(10, 0), "a"]],
+            [1, 2.5, 3],
+        ]
+        options = [{}, {"type": True}, {"simpleval": True}, {"maxi": 2}]
+        options += [{"json_array": True}, {"name": False}, {"maxi": 1}]
+        options += [{"encoded": True}, {"format": "tuple"}, {"fast": True}]
+        decodes = [{}, {"lazy": True}, {"columnar": True}, {"fast": True}]
+        for dat, option, decode in product(data, options, decodes):
+            ntv = Ntv.obj(dat, **decode)
+            self.assertEqual(
+                ntv.to_obj(**option), ntv.to_obj(engine="recursive", **option)
+            )
+            for def_type in ("json", "int32", "fr."):
+                self.assertEqual(
+                    ntv.to_obj(def_type=def_type, **option),
+                    ntv.to_obj(def_type=def_type, engine="recursive", **option),
+                )
+
 
 class TestNtvValidator(unittest.TestCase):
     """test NTV validate"""
@@ -661,6 +1014,53 @@ class TestNtvCompare(unittest.TestCase):
         self.assertTrue(Ntv.obj([1, 4]) < Ntv.obj({"test": {"truc": 2}}))
         self.assertTrue(Ntv.obj([1, 4]) < Ntv.obj([[2]]))
 
+    def test_digest(self):
+        data = {"a": [1, {"b::point": [[1, 2], [3, 4]]}], "c:fr.BAN.lon": 3, "d": {}}
+        ntv = Ntv.obj(data)
+        for option in ({}, {"lazy": True}, {"fast": True}):
+            self.assertEqual(Ntv.obj(data, **option).digest, ntv.digest)
+            self.assertEqual(hash(Ntv.obj(data, **option)), hash(ntv))
+            self.assertEqual(Ntv.obj(data, **option), ntv)
+        self.assertEqual(Ntv.obj([1, 2.0]), Ntv.obj([1.0, 2]))
+        self.assertEqual(
+            Ntv.obj({"a:json": {"x": 1, "y": [2, {"z": 3}]}}),
+            Ntv.obj({"a:json": {"x": 1.0, "y": [2.0, {"z": 3.0}]}}),
+        )
+        self.assertNotEqual(
+            Ntv.obj({"a:json": {"x": 1}}), Ntv.obj({"a:json": {"x": 1.5}})
+        )
+        self.assertNotEqual(Ntv.obj({"a": 1}), Ntv.obj({"a": "1"}))
+        self.assertNotEqual(Ntv.obj([1]), Ntv.obj(1))
+        self.assertNotEqual(Ntv.obj({"a": [1]}), Ntv.obj([1]))
+        self.assertEqual(len({Ntv.obj(data), ntv, Ntv.obj(data, lazy=True)}), 1)
+        for node in NtvTree(ntv):
+            self.assertIsNotNone(node._digest)
+        modifs = [
+            lambda ntv: ntv["a"][0].set_value(2),
+            lambda ntv: ntv["a"][1][0].set_name("e"),
+            lambda ntv: ntv["a"][1][0].set_type("json"),
+            lambda ntv: ntv["a"].append(Ntv.obj(5)),
+            lambda ntv: ntv["a"].insert(0, Ntv.obj(5)),
+            lambda ntv: ntv["a"].__setitem__(0, Ntv.obj(5)),
+            lambda ntv: ntv["a"][1][1].remove(),
+            lambda ntv: ntv["a"][1][1].replace(Ntv.obj({":point": [3, 5]})),
+            lambda ntv: ntv["a"].__delitem__(0),
+            lambda ntv: ntv.set_name("x", nodes="leaves"),
+            lambda ntv: ntv.set_value(0),
+        ]
+        for modif, option in product(modifs, ({}, {"lazy": True})):
+            ntv = Ntv.obj(data, **option)
+            self.assertEqual(ntv, Ntv.obj(data))
+            modif(ntv)
+            self.assertNotEqual(ntv, Ntv.obj(data))
+            self.assertEqual(ntv, Ntv.obj(ntv.to_obj()))
+            self.assertEqual(ntv.digest, Ntv.obj(ntv.to_obj()).digest)
+        ntv = Ntv.obj(data)
+        hash(ntv)
+        ntv["a"][0].ntv_value = 2
+        ntv["a"][0]._invalidate()
+        self.assertEqual(ntv, Ntv.obj(ntv.to_obj()))
+
 
 class TestNtvPointer(unittest.TestCase):
     """test NTV pointer"""
@@ -727,6 +1127,68 @@ class TestNtvPointer(unittest.TestCase):
         self.assertEqual(list(a["t3"][0].pointer(index=True)), [0, 2, 0])
         self.assertEqual(str(a["t3"][0].pointer(index=True)), "0/2/0")
 
+    def test_get_many(self):
+        ntv = Ntv.obj({"test": {"t1": 1, "t2": [2, 3], "t3": {"a": [4, 5], "b": 6}}})
+        pointers = ["#test/t3/a/1", "test/t2/0", "#0/2/b", "test", "#test/t3/a/1"]
+        nodes = ntv.get_many(pointers)
+        self.assertEqual(
+            nodes,
+            [
+                ntv[pointer]
+                for pointer in [
+                    "#test/t3/a/1",
+                    "#test/t2/0",
+                    "#0/2/b",
+                    "#test",
+                    "#test/t3/a/1",
+                ]
+            ],
+        )
+        self.assertTrue(nodes[0] is nodes[4] is ntv["t3"]["a"][1])
+        self.assertTrue(nodes[3] is ntv)
+        nodes = ntv.get_many([NtvPointer(["test", "t2", 1]), [0, 2, "a"]])
+        self.assertEqual([node.to_obj() for node in nodes], [3, {"a": [4, 5]}])
+        self.assertEqual(ntv.get_many([]), [])
+        with self.assertRaises(NtvError):
+            ntv.get_many(["#other/t1"])
+        for pointer in ["#test/t2/1", "#test/t3/b"]:
+            self.assertEqual(str(ntv[pointer].pointer()), pointer[1:])
+        self.assertEqual(NtvPointer.compile("0/a/1"), (0, "a", 1))
+        self.assertEqual(NtvPointer("0/a/1"), [0, "a", 1])
+        self.assertTrue(NtvPointer.compile.cache_info().hits > 0)
+
+    def test_pointer_duplicates(self):
+        ntv = Ntv.obj([1, [2, 2], 1, [2, 2]])
+        self.assertEqual([str(nod.pointer()) for nod in ntv], ["/0", "/1", "/2", "/3"])
+        self.assertEqual(str(ntv[3][1].pointer()), "/3/1")
+        ntv.insert(0, Ntv.obj(0))
+        ntv.append(Ntv.obj(1))
+        self.assertEqual([str(nod.pointer())[-1] for nod in ntv], list("012345"))
+        last = ntv[5]
+        last.remove()
+        self.assertTrue(last.parent is None and len(ntv) == 5)
+        ntv[1].remove()
+        self.assertEqual(ntv.to_obj(), [0, [2, 2], 1, [2, 2]])
+        ntv[0].remove()
+        self.assertEqual([str(nod.pointer()) for nod in ntv], ["/0", "/1", "/2"])
+        ntv[2][1].replace(Ntv.obj(3))
+        ntv[0].append(ntv[2][0])
+        self.assertEqual(ntv.to_obj(), [[2, 2, 2], 1, [3]])
+        self.assertEqual(str(ntv[0][2].pointer()), "/0/2")
+        ntv[1] = Ntv.obj(1)
+        del ntv[0][0]
+        self.assertEqual([str(nod.pointer()) for nod in ntv[0]], ["/0/0", "/0/1"])
+        ntv.ntv_value.reverse()
+        self.assertEqual(str(ntv[2][1].pointer()), "/2/1")
+        obj = Ntv.obj({"a": 1, "b": 2})
+        self.assertEqual(str(obj[1].pointer()), "/b")
+        obj[1].set_name("a")
+        self.assertEqual(str(obj[1].pointer()), "/1")
+        lazy = Ntv.obj({"a": [1, 1, 1], "b": 2}, lazy=True)
+        self.assertEqual(str(lazy["a"][2].pointer()), "/a/2")
+        del lazy["a"][0]
+        self.assertEqual(str(lazy["a"][1].pointer()), "/a/1")
+
     def test_json_ntv_pointer(self):
         examples = [
             {"data": {"a": 1, "test": "ok"}, "pointer": "/test", "canonical": "/1"},
@@ -871,6 +1333,79 @@ class TestNtvFunction(unittest.TestCase):
                 Ntv.obj({tst[1] + "::" + tst[2]: tst[0]}).to_obj(),
             )
 
+    def test_names(self):
+        ntv = Ntv.obj({"a": 1, "b:int": 2, "c": [3, 4], "a2": 5})
+        self.assertEqual(ntv.names, {"a": 0, "b": 1, "c": 2, "a2": 3})
+        self.assertEqual(ntv.json_names, {"a": 0, "b:int": 1, "c": 2, "a2": 3})
+        self.assertEqual(ntv["b:int"], ntv["b"])
+        self.assertTrue(ntv._names is not None)
+        ntv["a2"].set_name("a")
+        self.assertTrue(ntv._names is None)
+        self.assertEqual(ntv["a"].val, 1)
+        self.assertTrue(ntv.json_array)
+        del ntv[0]
+        self.assertEqual(ntv["a"].val, 5)
+        self.assertFalse(ntv.json_array)
+        ntv.insert(0, Ntv.obj({"d": 6}))
+        self.assertEqual([ntv[name].val for name in "dba"], [6, 2, 5])
+        with self.assertRaises(ValueError):
+            ntv["e"]
+        lazy = Ntv.obj({"a": 1, "b": [1, 2], "c": "t"}, lazy=True)
+        self.assertEqual(lazy["c"].val, "t")
+        self.assertEqual(list(lazy.ntv_value.nodes), [2])
+
+    def test_find(self):
+        ntv = Ntv.obj(
+            {
+                "a:datetime": "2021-01-01T10:00:00",
+                "b": [1, {"c:datetime": "2022-01-01T00:00:00"}],
+                "d::date": ["2021-01-01", "2021-01-02"],
+                "e:fr.BAN.lon": 1.0,
+                "f:fr.reg": 1,
+            }
+        )
+        index = ntv.index_by_type()
+        self.assertEqual(index[Datatype("datetime")], [ntv["a"], ntv["b"]["c"]])
+        self.assertEqual(sum(len(nodes) for nodes in index.values()), ntv.tree.size)
+        self.assertEqual(ntv.find(type="datetime"), ntv.find(type=Datatype("datetime")))
+        self.assertEqual(ntv.find(type="date"), [ntv["d"], ntv["d"][0], ntv["d"][1]])
+        self.assertEqual(ntv.find(type="date", leaf=False), [ntv["d"]])
+        self.assertEqual(ntv.find(namespace="fr."), [ntv["e"], ntv["f"]])
+        self.assertEqual(ntv.find(namespace="fr.BAN."), [ntv["e"]])
+        self.assertEqual(ntv.find(type="time"), [])
+        self.assertTrue(ntv.find(type="datetime")[0] is ntv[0])
+        ntv["b"]["c"].set_type("date")
+        self.assertEqual(ntv.find(type="datetime"), [ntv["a"]])
+        ntv.append(Ntv.obj({"g:datetime": "2023-01-01T00:00:00"}))
+        self.assertEqual(ntv.find(type="datetime"), [ntv["a"], ntv["g"]])
+
+    def test_reduce(self):
+        data = {"a": list(range(10)), "b": {"c": [[1, 2, 3, 4, 5, 6, 7, 8]]}}
+        self.assertEqual(
+            Ntv.obj(data).reduce(maxi=4, level=2),
+            {"a": [0, 1, "___", 8, 9], "b": {"c": ["___"]}},
+        )
+        self.assertEqual(
+            repr(Ntv.obj(data)),
+            '{"a": [0, 1, 2, "___", 7, 8, 9], "b": {"c": [["___"]]}}',
+        )
+        self.assertEqual(
+            Ntv.obj([{"a": i} for i in range(10)]).reduce(maxi=4),
+            [{"a": 0}, {"a": 1}, "___", {"a": 8}, {"a": 9}],
+        )
+        self.assertEqual(Ntv.obj({"a": [1, 2]}).reduce(level=0), {"a": ["___"]})
+        for option in ({"lazy": True}, {"columnar": True}):
+            ntv = Ntv.obj(data, **option)
+            self.assertEqual(repr(ntv), repr(Ntv.obj(data)))
+            self.assertEqual(ntv.to_tuple(maxi=3), Ntv.obj(data).to_tuple(maxi=3))
+            self.assertEqual(ntv.to_repr(maxi=3), Ntv.obj(data).to_repr(maxi=3))
+            self.assertEqual(ntv["a"].ntv_value.nodes, {})
+        ntv = Ntv.obj({"a": {"b": [1, 2]}, "c:json": {"d": [1, 2]}})
+        red = ntv.reduce(obj=False)
+        self.assertIs(red["c"].ntv_value, ntv["c"].ntv_value)
+        self.assertIsNone(red.parent)
+        self.assertIs(ntv["a"].parent, ntv)
+
     def test_single_obj_name(self):
         list_obj = [
             ["json", 4, ("", "", "")],
@@ -951,6 +1486,21 @@ class TestNtvFunction(unittest.TestCase):
                     agreg_type(typ[0][0], typ[0][1], typ[0][2]).long_name, typ[1]
                 )
 
+    def test_type_cache(self):
+        agreg_type("int32", None, True)
+        hits = type_cache_info()["agreg_type"].hits
+        self.assertIs(agreg_type("int32", None, True), Datatype("int32"))
+        self.assertEqual(type_cache_info()["agreg_type"].hits, hits + 1)
+        self.assertEqual(relative_type("int32", "int32"), "")
+        self.assertEqual(relative_type("", "int32"), "int32")
+        Datatype("$cachetype")
+        self.assertGreater(type_cache_info()["agreg_type"].currsize, 0)
+        TypeBase("$cachetype")  # replaced TypeBase
+        self.assertEqual(type_cache_info()["agreg_type"].currsize, 0)
+        self.assertEqual(agreg_type("$cachetype", None, True).long_name, "$cachetype")
+        with self.assertRaises(DatatypeError):
+            str_type(["int32"], True)
+
     def test_default_type(self):
         list_test = [
             [("", ":", "fr.BAN.lon"), {"ntv1::fr.BAN.": [{":BAN.lon": 4}, 5, 6]}],
@@ -990,6 +1540,57 @@ class TestNtvFunction(unittest.TestCase):
         for int, val in enumerate(ntv):
             self.assertEqual(val.val, int)
 
+    def test_lazy_import(self):
+        code = (
+            "import sys; before = set(sys.modules); import json_ntv; "
+            + "print(' '.join(mod for mod in "
+            + "('requests', 'cbor2', 'shapely', 'IPython', 'configparser') "
+            + "if mod in set(sys.modules) - before))"
+        )
+        env = os.environ | {"PYTHONPATH": os.pathsep.join(sys.path)}
+        proc = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, env=env
+        )
+        self.assertEqual(proc.stdout.strip(), "")
+        self.assertEqual(NtvUtil.lazy_import("cbor2").__name__, "cbor2")
+        self.addCleanup(NtvUtil._optional_.pop, "ntv_unknown_package", None)
+        NtvUtil._optional_["ntv_unknown_package"] = "ntv-unknown"
+        with self.assertRaisesRegex(ModuleNotFoundError, "pip install ntv-unknown"):
+            NtvUtil.lazy_import("ntv_unknown_package.module")
+
+    def test_json_backend(self):
+        self.addCleanup(set_json_backend, "json")
+        data = {
+            "a": [1, 2.5, None, {"b": [True, "é"]}],
+            "dat:datetime": datetime.datetime(2021, 1, 1, 10),
+            "lis": [datetime.date(2021, 1, 1), datetime.time(10, 0, 5)],
+            "loc:point": geometry.Point(1, 2),
+            "big": 2**70,
+        }
+        ntv = Ntv.obj(data)
+        text = ntv.to_obj(encoded=True)
+        ntv_nan = Ntv.obj({"a": float("nan"), "b": [float("inf"), -float("inf"), None]})
+        text_nan = ntv_nan.to_obj(encoded=True)
+        for backend in NtvJson.BACKENDS + ("auto",):
+            active = set_json_backend(backend)
+            self.assertEqual(NtvJson.backend, active)
+            self.assertIn(active, NtvJson.BACKENDS)
+            if backend != "auto":
+                self.assertIn(active, (backend, "json"))
+            self.assertEqual(json.loads(ntv.to_obj(encoded=True)), json.loads(text))
+            self.assertEqual(Ntv.obj(text), ntv)
+            self.assertEqual(Ntv.obj("abc").val, "abc")
+            ntv_str = Ntv.from_obj('{"a": [1]}', decode_str=True)
+            self.assertEqual(ntv_str.to_obj(), {"a": [1]})
+            self.assertEqual(len({Ntv.obj(data)[1], Ntv.obj(data)[1], ntv[0][3][0]}), 2)
+            self.assertEqual(ntv_nan.to_obj(encoded=True), text_nan)
+            self.assertEqual(NtvJson.loads(text_nan)["b"], [math.inf, -math.inf, None])
+            self.assertEqual(Ntv.obj(text_nan)[1].to_obj(), ntv_nan[1].to_obj())
+        self.assertEqual(set_json_backend(), "json")
+        self.assertEqual(ntv.to_obj(encoded=True), text)
+        with self.assertRaises(NtvError):
+            set_json_backend("unknown")
+
 
 class TestNtvTree(unittest.TestCase):
     """test NTV tree"""
@@ -1010,6 +1611,88 @@ class TestNtvTree(unittest.TestCase):
         self.assertEqual(tree.breadth, 7)
         self.assertEqual(len(tree.inner_nodes), 4)
 
+    def test_stats(self):
+        ntv = Ntv.obj({"a": [1, [2, 3, 4], [{"c": 5}, 6]], "b": "ert"})
+        stats = ntv.tree.stats()
+        self.assertEqual(
+            stats,
+            {
+                "size": 11,
+                "breadth": 7,
+                "height": 3,
+                "levels": [1, 2, 3, 5],
+                "fanout": {2: 2, 3: 2},
+            },
+        )
+        self.assertTrue(ntv._stats is not None)
+        stats["levels"].append(0)
+        self.assertEqual(ntv.tree.stats()["levels"], [1, 2, 3, 5])
+        ntv["a"][1].append(Ntv.obj([7, 8]))
+        self.assertTrue(ntv._stats is None)
+        self.assertEqual(NtvTree(ntv).size, 14)
+        self.assertEqual(NtvTree(ntv).stats()["fanout"], {2: 3, 3: 1, 4: 1})
+        del ntv["a"]
+        self.assertEqual(NtvTree(ntv).stats()["levels"], [1, 1])
+        self.assertEqual(NtvTree(Ntv.obj([])).stats()["fanout"], {0: 1})
+
+    def test_select(self):
+        ntv = Ntv.obj(
+            {
+                "records": [
+                    {"name": "a", "loc:point": [1, 2], "d:date": "2021-01-01"},
+                    {"name": "b", "loc:point": [3, 4], "sub": {"p:point": [0, 0]}},
+                ],
+                "x:fr.BAN.lon": 1.0,
+            }
+        )
+        recs = ntv["records"]
+        points = [recs[0]["loc"], recs[1]["loc"], recs[1]["sub"]["p"]]
+        self.assertEqual(ntv.select("**/:point"), points)
+        self.assertEqual(ntv.select("records/*/name"), [recs[0][0], recs[1][0]])
+        self.assertEqual(ntv.select("records/[0]/*:date"), [recs[0]["d"]])
+        self.assertEqual(ntv.select("records/[-1]/**/:point"), points[1:])
+        self.assertEqual(ntv.select("records/[0:2]/loc"), points[:2])
+        self.assertEqual(ntv.select("records/1/sub/*"), points[2:])
+        self.assertEqual(ntv.select("**/:fr."), [ntv["x"]])
+        self.assertEqual(ntv.select("**/name"), ntv.select("records/*/name"))
+        self.assertEqual(ntv.select("*"), list(ntv))
+        self.assertEqual(ntv.select("**"), NtvTree(ntv).nodes)
+        self.assertEqual(ntv.select(""), [ntv])
+        self.assertEqual(ntv.select("nope/*") + ntv.select("records/[5]"), [])
+        ntv.index_by_type()
+        self.assertEqual(ntv.select("**/:point"), points)
+        self.assertEqual(ntv.select("**/loc:point"), points[:2])
+        self.assertTrue(ntv.select("**/loc:point")[0] is recs[0]["loc"])
+        selector = NtvSelector.compile("**/:point")
+        self.assertTrue(selector is NtvSelector.compile("**/:point"))
+        self.assertEqual(ntv.select(selector), points)
+        self.assertEqual(ntv.select("records/[::-1]/name"), [recs[1][0], recs[0][0]])
+        for path in ("a/[x:y]", "[::0]", "a/[1", "[]", "[1:2:3:4]", "[-]"):
+            with self.assertRaisesRegex(NtvError, "segment is not valid"):
+                ntv.select(path)
+
+    def test_walk(self):
+        ntv = Ntv.obj({"a": [1, [], [{"c": 5}, 6]], "b": [1, 1], "d": "ert"})
+        walk = list(NtvTree(ntv).walk())
+        self.assertEqual([node for node, _, _ in walk], NtvTree(ntv).nodes)
+        self.assertTrue(all(node.parent[idx] is node for node, _, idx in walk[1:]))
+        self.assertEqual(
+            [(depth, index) for _, depth, index in walk],
+            [(0, None), (1, 0), (2, 0), (2, 1), (2, 2), (3, 0), (3, 1)]
+            + [(1, 1), (2, 0), (2, 1), (1, 2)],
+        )
+        self.assertEqual(NtvTree(ntv).size, 11)
+        leaves = list(NtvTree(ntv).iter_nodes(leaf=True))
+        self.assertEqual(leaves, NtvTree(ntv).leaf_nodes)
+        self.assertEqual([node.val for node in leaves], [1, 5, 6, 1, 1, "ert"])
+        self.assertTrue(leaves[3] is ntv["b"][0] and leaves[4] is ntv["b"][1])
+        self.assertEqual(len(list(NtvTree(ntv).iter_nodes(leaf=False))), 5)
+        self.assertEqual(list(NtvTree(Ntv.obj(1)).walk()), [(Ntv.obj(1), 0, None)])
+        col = Ntv.obj({"a": [1, 2], "b::int": [3, 4]}, lazy=True)
+        self.assertEqual(
+            NtvTree(col).leaf_nodes, NtvTree(Ntv.obj(col.to_obj())).leaf_nodes
+        )
+
 
 class Test_NtvConnector(unittest.TestCase):
     def test_is_json(self):
@@ -1154,6 +1837,61 @@ class TestNtvPatch(unittest.TestCase):
         del pat[3]
         self.assertEqual(pat, NtvPatch([cop, test, remove]))
 
+    def test_diff(self):
+        a_obj = {
+            "test": [[1, 2, 3], {"liste": [0, 1, 2, 0, 1, {"val": [1, 2]}]}],
+            "truc": 1,
+            "none": None,
+        }
+        b_objs = [
+            {
+                "test": [[1, 5, 3], {"liste": [0, 1, 2, 0, {"val": [1, 3]}]}],
+                "truc": 1,
+                "none": None,
+            },
+            {"none": None, "truc": 1, "test": [{"liste": [1, 0]}, [1, 2, 3, 4]]},
+            {"truc": 0, "test": [[], {"liste": []}], "new": {"a": None}},
+            {
+                "test": [[3, 2, 1], {"liste": [{"val": [1, 2]}, 0, 1, 2, 0, 1]}],
+                "truc": 2,
+            },
+        ]
+        a = Ntv.obj(a_obj)
+        for b_obj in b_objs:
+            b = Ntv.obj(b_obj)
+            patch = NtvPatch.diff(a, b)
+            self.assertEqual(patch.exe(a), b)
+            self.assertEqual(NtvPatch(patch.json).exe(a), b)
+            self.assertEqual(Ntv.obj(a_obj), a)
+        moved = NtvPatch.diff(
+            a, Ntv.obj({"none": None, "test": a_obj["test"], "truc": 1})
+        )
+        self.assertEqual(len(moved), 1)
+        self.assertEqual(moved[0].ope, "move")
+        self.assertEqual(len(NtvPatch.diff(a, Ntv.obj(a_obj))), 0)
+        with self.assertRaises(NtvOpError):
+            NtvPatch.diff(a, Ntv.obj({"other": [1, 2]}))
+        with self.assertRaises(NtvOpError):
+            NtvPatch.diff(a, Ntv.obj(1))
+        typed = [
+            ({"r": {"l::int32": [1, 2]}}, {"r": {"l::float": [1, 2]}}),
+            ({"r": {"l::int32": [1, 2]}}, {"r": {"l": [1, 2]}}),
+            ({"r": {"l::fr.": [{"a:reg": 1}]}}, {"r": {"l": [{"a:fr.reg": 1}]}}),
+            ({"r": [{"l::fr.": {"a:reg": 1}}, 2]}, {"r": [{"l": {"a:fr.reg": 1}}, 2]}),
+            ([{"l::int32": [1, 2]}, 3], [{"l::int32": [1, 2]}, 3, 4]),
+        ]
+        for a_obj, b_obj in typed:
+            a, b = Ntv.obj(a_obj), Ntv.obj(b_obj)
+            patch = NtvPatch.diff(a, b)
+            self.assertEqual(len(patch), 1)
+            self.assertEqual(patch.exe(a).to_obj(), b.to_obj())
+        for a_obj, b_obj in (
+            ({"r::int32": [1, 2]}, {"r::float": [1, 2]}),
+            ({"r::fr.": [{"a:reg": 1}]}, {"r": [{"a:fr.reg": 1}]}),
+        ):
+            with self.assertRaises(NtvOpError):
+                NtvPatch.diff(Ntv.obj(a_obj), Ntv.obj(b_obj))
+
 
 class TestNtvComment(unittest.TestCase):
     """test NTV comment"""